@@ -5,24 +5,35 @@ Orchestrates AI agent interactions using Azure AI Foundry.
 Routes queries to appropriate MCP tools based on intent analysis.
 """
 
-import json
-from typing import Optional, List, Dict, Any
-import httpx
+import asyncio
+import hashlib
+import logging
+import random
+import re
+import time
+from collections import OrderedDict, deque
+from typing import Optional, List, Dict, Any, Tuple, AsyncGenerator, Callable, Awaitable, Deque
+import aiohttp
+import orjson
 import structlog
 from enum import Enum
 
 from app.core.config import settings
+from app.core.http_client import get_aiohttp_session
 from app.models.schemas import (
     UserInfo,
     ChatMessage,
     MessageRole,
     AgentType,
     ToolCall,
+    ToolCallStatus,
 )
 from app.tools.salesforce_tools import SalesforceTools
 from app.tools.inventory_tools import inventory_tools
 
 logger = structlog.get_logger()
+# stdlib logger behind structlog; checked before building hot-path log events
+_log_level_check = logging.getLogger(__name__)
 
 
 class ToolCategory(str, Enum):
@@ -256,6 +267,122 @@ AVAILABLE_TOOLS = [
     },
 ]
 
+# Number of past messages (user + assistant) sent back to the model
+MAX_HISTORY_MESSAGES = 10
+
+# Fast routing: short read-only lookups answered without the LLM
+FAST_ROUTE_MAX_LENGTH = 80
+_FAST_ROUTE_EXCLUDE = re.compile(
+    r"\b(create|add|update|remove|order|set|change|why|how|compare|and)\b", re.IGNORECASE
+)
+_FAST_ROUTES = [
+    (re.compile(r"\blow[- ]stock\b|\bneeds? reorder", re.IGNORECASE), "get_low_stock_alerts"),
+    (re.compile(r"\b(inventory|stock) (summary|overview|analytics)\b", re.IGNORECASE), "get_inventory_analytics"),
+]
+_SKU_PATTERN = re.compile(r"\b[A-Z0-9]{3}-\d{3}\b", re.IGNORECASE)
+
+# Canned responses used when Azure Foundry is not configured
+_MOCK_KEYWORDS = {
+    "inventory": "inventory", "stock": "inventory", "product": "inventory",
+    "sales": "sales", "opportunity": "sales", "deal": "sales", "pipeline": "sales",
+    "customer": "customer", "account": "customer", "contact": "customer",
+}
+_MOCK_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, _MOCK_KEYWORDS)))
+_MOCK_TOPIC_PRIORITY = ("inventory", "sales", "customer")
+
+_MOCK_RESPONSES = {
+    "inventory": """I can help you check our inventory! Here's what I found:
+
+**Current Stock Summary:**
+- Trail Runner Pro (TRP-001): 45 units ✓ In Stock
+- Summit Hiking Boot (SHB-002): 12 units ⚠️ Low Stock
+- Alpine Backpack 45L (ABP-003): 28 units ✓ In Stock
+- Weather Shield Jacket (WSJ-004): 0 units ❌ Out of Stock
+
+⚠️ **Alert**: We have 3 items that need attention - consider reordering the Weather Shield Jacket and Summit Hiking Boot.""",
+    "sales": """Here's your sales pipeline overview:
+
+**Active Opportunities:**
+| Deal | Amount | Stage | Close Date |
+|------|--------|-------|------------|
+| REI Partnership | $125,000 | Proposal | Mar 15 |
+| Outdoor World Bulk | $89,500 | Negotiation | Feb 28 |
+| Adventure Co. Renewal | $45,000 | Closed Won | Feb 10 |
+
+**Pipeline Summary:**
+- Total Pipeline Value: $259,500
+- Weighted Value: $178,250
+- Win Rate This Quarter: 68%""",
+    "customer": """Here are your recent customer accounts:
+
+**Top Accounts:**
+1. **REI Cooperative** - $450K annual revenue
+   - Primary Contact: Sarah Johnson (sarah@rei.com)
+   - Last Activity: Meeting on Feb 5th
+
+2. **Outdoor World** - $280K annual revenue
+   - Primary Contact: Mike Chen (mike@outdoorworld.com)
+   - Last Activity: Quote sent Feb 8th
+
+3. **Adventure Outfitters** - $175K annual revenue
+   - Primary Contact: Lisa Park
+   - Last Activity: Contract signed Feb 1st""",
+}
+
+_MOCK_GREETING = """Hello {name}! I'm ProGear AI, your assistant for managing sales, customers, and inventory.
+
+I can help you with:
+- 📊 **Sales**: Check opportunities, pipeline, create quotes
+- 👥 **Customers**: Look up accounts, contacts, interaction history
+- 📦 **Inventory**: Check stock levels, manage products, handle reorders
+
+What would you like to know about today?"""
+
+# Upstream backpressure: cap in-flight Azure Foundry streams and retry throttling
+_AZURE_SEMAPHORE = asyncio.Semaphore(settings.azure_foundry_max_concurrency)
+AZURE_MAX_RETRIES = 2
+_RETRYABLE_STATUSES = frozenset({429, 503})
+
+# Closing chunk for a stream whose connection dropped after content was sent
+_STREAM_INTERRUPTED_CHUNK = {
+    "choices": [{
+        "delta": {"content": "\n\n_(The response was interrupted. Please try again.)_"},
+        "finish_reason": "error",
+    }],
+}
+
+# LLM response cache bounds
+LLM_CACHE_MAX_ENTRIES = 1024
+LLM_CACHE_TTL_SECONDS = 300
+
+# AVAILABLE_TOOLS never changes, so the request body fragments are serialized once
+_STATIC_PAYLOAD_JSON = b',"temperature":0.7,"max_tokens":2000,"stream":true'
+_TOOLS_PAYLOAD_JSON = b',"tools":' + orjson.dumps(AVAILABLE_TOOLS) + b',"tool_choice":"auto"'
+
+# Agent responsible for each tool (anything not listed is an inventory tool)
+TOOL_AGENT_TYPES = {
+    "get_opportunities": AgentType.SALES,
+    "create_opportunity": AgentType.SALES,
+    "get_leads": AgentType.SALES,
+    "get_sales_analytics": AgentType.SALES,
+    "search_accounts": AgentType.SALES,
+    "search_contacts": AgentType.CUSTOMER,
+    "get_customer_history": AgentType.CUSTOMER,
+    "create_activity": AgentType.CUSTOMER,
+}
+
+# Salesforce tool name -> SalesforceTools method name
+SALESFORCE_METHODS = {
+    "get_opportunities": "get_opportunities",
+    "search_accounts": "search_accounts",
+    "get_leads": "get_leads",
+    "create_opportunity": "create_opportunity",
+    "get_sales_analytics": "get_sales_analytics",
+    "search_contacts": "search_contacts",
+    "get_customer_history": "get_account_history",
+    "create_activity": "log_activity",
+}
+
 
 class AgentOrchestrator:
     """
@@ -267,6 +394,12 @@ class AgentOrchestrator:
     - Response synthesis
     """
 
+    # Populated after the class body (see bottom of module)
+    _DISPATCH: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {}
+
+    # Completed (non tool-call) responses shared across instances, LRU ordered
+    _response_cache: "OrderedDict[bytes, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+
     def __init__(
         self,
         user: UserInfo,
@@ -276,7 +409,17 @@ class AgentOrchestrator:
         self.user = user
         self.salesforce_tools = salesforce_tools
         self.user_scopes = user_scopes or []
-        self.conversation_history: List[Dict[str, Any]] = []
+        self.conversation_history: Deque[Dict[str, Any]] = deque(maxlen=MAX_HISTORY_MESSAGES)
+
+    @property
+    def user_scopes(self) -> List[str]:
+        return self._user_scopes
+
+    @user_scopes.setter
+    def user_scopes(self, scopes: List[str]) -> None:
+        # The system prompt only depends on the user and scopes, so build it once
+        self._user_scopes = scopes
+        self._system_message = {"role": "system", "content": self._get_system_prompt()}
 
     def _get_system_prompt(self) -> str:
         """Generate system prompt for the AI agent"""
@@ -303,112 +446,145 @@ Guidelines:
 
 Remember: This is a demo showcasing Okta AI Agent governance with XAA token exchange and Auth0 Token Vault integration."""
 
-    async def _call_azure_foundry(
+    def _build_request(
         self,
         messages: List[Dict[str, Any]],
-        tools: Optional[List[Dict]] = None,
-    ) -> Dict[str, Any]:
-        """Call Azure AI Foundry API"""
-        if not settings.azure_foundry_endpoint or not settings.azure_foundry_api_key:
-            logger.warning("Azure Foundry not configured, using mock response")
-            return self._mock_response(messages)
-
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            headers = {
-                "Content-Type": "application/json",
-                "api-key": settings.azure_foundry_api_key,
-            }
-
-            payload = {
-                "messages": messages,
-                "temperature": 0.7,
-                "max_tokens": 2000,
-            }
-
-            if tools:
-                payload["tools"] = tools
-                payload["tool_choice"] = "auto"
-
-            # Azure AI Foundry uses /openai/deployments/{deployment}/chat/completions format
-            deployment = settings.azure_foundry_deployment or "gpt-4o"
-            endpoint = settings.azure_foundry_endpoint.rstrip("/")
-
-            # Try the project-based endpoint format first
-            url = f"{endpoint}/openai/deployments/{deployment}/chat/completions?api-version=2024-08-01-preview"
-
-            try:
-                response = await client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error("Azure Foundry API error", status=e.response.status_code, detail=str(e))
-                # Fall back to mock response on error
-                return self._mock_response(messages)
-            except Exception as e:
-                logger.error("Azure Foundry connection error", error=str(e))
-                return self._mock_response(messages)
-
-    def _mock_response(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Generate mock response when Azure Foundry is not configured"""
-        last_message = messages[-1]["content"] if messages else ""
-        last_lower = last_message.lower()
+        tools: bool = False,
+    ) -> Tuple[str, Dict[str, str], bytes]:
+        """Build the URL, headers and JSON body for a streaming chat completion"""
+        headers = {
+            "Content-Type": "application/json",
+            "api-key": settings.azure_foundry_api_key,
+        }
 
-        # Determine appropriate mock response based on query
-        if any(word in last_lower for word in ["inventory", "stock", "product"]):
-            response_text = """I can help you check our inventory! Here's what I found:
+        # Only the messages change per call; the rest of the body is static
+        body = b'{"messages":' + orjson.dumps(messages) + _STATIC_PAYLOAD_JSON
+        if tools:
+            body += _TOOLS_PAYLOAD_JSON
+        body += b"}"
 
-**Current Stock Summary:**
-- Trail Runner Pro (TRP-001): 45 units ✓ In Stock
-- Summit Hiking Boot (SHB-002): 12 units ⚠️ Low Stock
-- Alpine Backpack 45L (ABP-003): 28 units ✓ In Stock
-- Weather Shield Jacket (WSJ-004): 0 units ❌ Out of Stock
+        # Azure AI Foundry uses /openai/deployments/{deployment}/chat/completions format
+        deployment = settings.azure_foundry_deployment or "gpt-4o"
+        endpoint = settings.azure_foundry_endpoint.rstrip("/")
 
-⚠️ **Alert**: We have 3 items that need attention - consider reordering the Weather Shield Jacket and Summit Hiking Boot."""
+        # Try the project-based endpoint format first
+        url = f"{endpoint}/openai/deployments/{deployment}/chat/completions?api-version=2024-08-01-preview"
 
-        elif any(word in last_lower for word in ["sales", "opportunity", "deal", "pipeline"]):
-            response_text = """Here's your sales pipeline overview:
+        return url, headers, body
 
-**Active Opportunities:**
-| Deal | Amount | Stage | Close Date |
-|------|--------|-------|------------|
-| REI Partnership | $125,000 | Proposal | Mar 15 |
-| Outdoor World Bulk | $89,500 | Negotiation | Feb 28 |
-| Adventure Co. Renewal | $45,000 | Closed Won | Feb 10 |
-
-**Pipeline Summary:**
-- Total Pipeline Value: $259,500
-- Weighted Value: $178,250
-- Win Rate This Quarter: 68%"""
+    async def _stream_azure_foundry(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: bool = False,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream chat completion chunks from Azure AI Foundry (SSE)"""
+        if not settings.azure_foundry_endpoint or not settings.azure_foundry_api_key:
+            logger.warning("Azure Foundry not configured, using mock response")
+            yield self._mock_response(messages)
+            return
 
-        elif any(word in last_lower for word in ["customer", "account", "contact"]):
-            response_text = """Here are your recent customer accounts:
+        url, headers, body = self._build_request(messages, tools)
 
-**Top Accounts:**
-1. **REI Cooperative** - $450K annual revenue
-   - Primary Contact: Sarah Johnson (sarah@rei.com)
-   - Last Activity: Meeting on Feb 5th
+        # The body holds the full prompt (system, history, tools flag), so it is the cache key
+        cache_key = hashlib.blake2b(body, digest_size=16).digest()
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            if _log_level_check.isEnabledFor(logging.INFO):
+                logger.info("LLM response cache hit")
+            for chunk in cached:
+                yield chunk
+            return
 
-2. **Outdoor World** - $280K annual revenue
-   - Primary Contact: Mike Chen (mike@outdoorworld.com)
-   - Last Activity: Quote sent Feb 8th
+        session = get_aiohttp_session()
+        streamed = False
 
-3. **Adventure Outfitters** - $175K annual revenue
-   - Primary Contact: Lisa Park
-   - Last Activity: Contract signed Feb 1st"""
+        try:
+            for attempt in range(AZURE_MAX_RETRIES + 1):
+                async with _AZURE_SEMAPHORE:
+                    async with session.post(url, headers=headers, data=body) as response:
+                        if response.status not in _RETRYABLE_STATUSES or attempt == AZURE_MAX_RETRIES:
+                            response.raise_for_status()
+                            chunks: List[Dict[str, Any]] = []
+                            finish_reason = None
+                            async for chunk in self._iter_sse_chunks(response):
+                                chunks.append(chunk)
+                                finish_reason = chunk["choices"][0].get("finish_reason") or finish_reason
+                                streamed = True
+                                yield chunk
+
+                            # Only plain answers are cached; tool calls must run every time
+                            if finish_reason == "stop":
+                                self._cache_response(cache_key, chunks)
+                            return
+
+                # Throttled: back off (outside the semaphore) with jitter, then retry
+                logger.warning("Azure Foundry throttled, retrying", status=response.status, attempt=attempt + 1)
+                await asyncio.sleep(2 ** attempt * 0.1 + random.random() * 0.1)
+        except aiohttp.ClientResponseError as e:
+            logger.error("Azure Foundry API error", status=e.status, detail=str(e), streamed=streamed)
+            # Fall back to mock response on error; a mock reply can't be
+            # appended to a partly streamed real one
+            yield _STREAM_INTERRUPTED_CHUNK if streamed else self._mock_response(messages)
+        except Exception as e:
+            logger.error("Azure Foundry connection error", error=str(e), streamed=streamed)
+            yield _STREAM_INTERRUPTED_CHUNK if streamed else self._mock_response(messages)
+
+    @staticmethod
+    async def _iter_sse_chunks(response: aiohttp.ClientResponse) -> AsyncGenerator[Dict[str, Any], None]:
+        """Parse chat completion chunks from an SSE response body"""
+        async for raw_line in response.content:
+            line = raw_line.strip()
+            if not line.startswith(b"data: "):
+                continue
+            data = line[6:]
+            if data == b"[DONE]":
+                break
+            chunk = orjson.loads(data)
+            # Azure sends a leading prompt-filter chunk with no choices
+            if chunk.get("choices"):
+                yield chunk
+
+    @classmethod
+    def _get_cached_response(cls, key: bytes) -> Optional[List[Dict[str, Any]]]:
+        """Return cached stream chunks for a request body hash, if still fresh"""
+        entry = cls._response_cache.get(key)
+        if entry is None:
+            return None
+
+        stored_at, chunks = entry
+        if time.monotonic() - stored_at > LLM_CACHE_TTL_SECONDS:
+            del cls._response_cache[key]
+            return None
+
+        cls._response_cache.move_to_end(key)
+        return chunks
+
+    @classmethod
+    def _cache_response(cls, key: bytes, chunks: List[Dict[str, Any]]) -> None:
+        """Store stream chunks for a request body hash, evicting the oldest entry"""
+        cls._response_cache[key] = (time.monotonic(), chunks)
+        cls._response_cache.move_to_end(key)
+        if len(cls._response_cache) > LLM_CACHE_MAX_ENTRIES:
+            cls._response_cache.popitem(last=False)
 
-        else:
-            response_text = f"""Hello {self.user.name or 'there'}! I'm ProGear AI, your assistant for managing sales, customers, and inventory.
+    def _mock_response(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Generate a mock stream chunk when Azure Foundry is not configured"""
+        last_message = messages[-1]["content"] if messages else ""
 
-I can help you with:
-- 📊 **Sales**: Check opportunities, pipeline, create quotes
-- 👥 **Customers**: Look up accounts, contacts, interaction history
-- 📦 **Inventory**: Check stock levels, manage products, handle reorders
+        # One pass over the message collects every topic mentioned
+        topics = {_MOCK_KEYWORDS[m.group(0)] for m in _MOCK_KEYWORD_PATTERN.finditer(last_message.lower())}
 
-What would you like to know about today?"""
+        # Determine appropriate mock response based on query
+        response_text = next(
+            (_MOCK_RESPONSES[topic] for topic in _MOCK_TOPIC_PRIORITY if topic in topics),
+            None,
+        )
+        if response_text is None:
+            response_text = _MOCK_GREETING.format(name=self.user.name or "there")
 
         return {
             "choices": [{
-                "message": {
+                "delta": {
                     "role": "assistant",
                     "content": response_text,
                 },
@@ -416,159 +592,329 @@ What would you like to know about today?"""
             }],
         }
 
+    # === Tool handlers (looked up through _DISPATCH) ===
+
+    async def _tool_check_inventory(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        if arguments.get("sku"):
+            product = inventory_tools.get_product(arguments["sku"])
+            return {"product": product.to_dict_cached() if product else None}
+
+        if arguments.get("search"):
+            products = inventory_tools.search_by_name(
+                arguments["search"],
+                category=arguments.get("category"),
+            )
+        else:
+            products = inventory_tools.list_products(
+                category=arguments.get("category"),
+            )
+        return {"products": [p.to_dict_cached() for p in products]}
+
+    async def _tool_update_inventory(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return inventory_tools.update_stock_sync(
+            sku=arguments["sku"],
+            quantity_change=arguments["quantity_change"],
+            reason=arguments["reason"],
+        )
+
+    async def _tool_get_low_stock_alerts(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return inventory_tools.check_low_stock(
+            threshold=arguments.get("threshold", 15)
+        )
+
+    async def _tool_create_reorder(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return inventory_tools.create_reorder(
+            sku=arguments["sku"],
+            quantity=arguments["quantity"],
+        )
+
+    async def _tool_get_inventory_analytics(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return inventory_tools.get_inventory_summary()
+
+    async def _tool_get_stock_movements(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        movements = inventory_tools.get_stock_movements(arguments["sku"])
+        return {"movements": movements}
+
+    async def _call_salesforce(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.salesforce_tools:
+            return {
+                "error": "Salesforce not connected",
+                "message": "Please connect your Salesforce account to access sales and customer data",
+            }
+
+        method = getattr(self.salesforce_tools, SALESFORCE_METHODS[tool_name], None)
+        if method:
+            return await method(**arguments)
+        return {"error": f"Method {tool_name} not found"}
+
     async def _execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool and return results"""
-        logger.info("Executing tool", tool=tool_name, arguments=arguments)
-
-        try:
-            # Inventory tools
-            if tool_name == "check_inventory":
-                if arguments.get("sku"):
-                    product = inventory_tools.get_product(arguments["sku"])
-                    return {"product": product.__dict__ if product else None}
-                else:
-                    products = inventory_tools.list_products(
-                        category=arguments.get("category"),
-                    )
-                    if arguments.get("search"):
-                        search = arguments["search"].lower()
-                        products = [p for p in products if search in p.name.lower()]
-                    return {"products": [p.__dict__ for p in products]}
-
-            elif tool_name == "update_inventory":
-                result = inventory_tools.update_stock_sync(
-                    sku=arguments["sku"],
-                    quantity_change=arguments["quantity_change"],
-                    reason=arguments["reason"],
-                )
-                return result
-
-            elif tool_name == "get_low_stock_alerts":
-                result = inventory_tools.check_low_stock(
-                    threshold=arguments.get("threshold", 15)
-                )
-                return result
-
-            elif tool_name == "create_reorder":
-                result = inventory_tools.create_reorder(
-                    sku=arguments["sku"],
-                    quantity=arguments["quantity"],
-                )
-                return result
-
-            elif tool_name == "get_inventory_analytics":
-                return inventory_tools.get_inventory_summary()
-
-            elif tool_name == "get_stock_movements":
-                movements = inventory_tools.get_stock_movements(arguments["sku"])
-                return {"movements": movements}
-
-            # Salesforce tools
-            elif tool_name in ["get_opportunities", "search_accounts", "get_leads",
-                               "create_opportunity", "get_sales_analytics",
-                               "search_contacts", "get_customer_history", "create_activity"]:
-                if self.salesforce_tools:
-                    # Map tool name to Salesforce method
-                    method_map = {
-                        "get_opportunities": "get_opportunities",
-                        "search_accounts": "search_accounts",
-                        "get_leads": "get_leads",
-                        "create_opportunity": "create_opportunity",
-                        "get_sales_analytics": "get_sales_analytics",
-                        "search_contacts": "search_contacts",
-                        "get_customer_history": "get_account_history",
-                        "create_activity": "log_activity",
-                    }
-                    method = getattr(self.salesforce_tools, method_map[tool_name], None)
-                    if method:
-                        result = await method(**arguments)
-                        return result
-                    return {"error": f"Method {tool_name} not found"}
-                else:
-                    return {
-                        "error": "Salesforce not connected",
-                        "message": "Please connect your Salesforce account to access sales and customer data",
-                    }
+        if _log_level_check.isEnabledFor(logging.INFO):
+            logger.info("Executing tool", tool=tool_name, arguments=arguments)
 
+        handler = self._DISPATCH.get(tool_name)
+        if not handler:
             return {"error": f"Unknown tool: {tool_name}"}
 
+        try:
+            return await handler(self, arguments)
         except Exception as e:
             logger.error("Tool execution failed", tool=tool_name, error=str(e))
             return {"error": str(e)}
 
-    async def process_message(
+    async def _stream_completion(
         self,
-        message: str,
-        conversation_id: Optional[str] = None,
-    ) -> ChatMessage:
-        """Process a user message and return AI response"""
-        logger.info(
-            "Processing message",
-            user=self.user.email,
-            message_preview=message[:100],
+        messages: List[Dict[str, Any]],
+        tools: bool = False,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Stream a completion, yielding content tokens as they arrive.
+
+        Yields {"type": "chunk", "content": ...} for each token and finishes
+        with {"type": "message", "message": ...} holding the assembled
+        assistant message (including any accumulated tool calls).
+        """
+        content_parts: List[str] = []
+        tool_call_parts: Dict[int, Dict[str, Any]] = {}
+
+        async for chunk in self._stream_azure_foundry(messages, tools):
+            if chunk["choices"][0].get("finish_reason") == "error":
+                # Tool call arguments cut off mid-stream can't be parsed or run
+                tool_call_parts.clear()
+            delta = chunk["choices"][0].get("delta") or {}
+
+            if delta.get("content"):
+                content_parts.append(delta["content"])
+                yield {"type": "chunk", "content": delta["content"]}
+
+            # Tool call arguments arrive as fragments keyed by index
+            for tc_delta in delta.get("tool_calls") or []:
+                tc = tool_call_parts.setdefault(tc_delta.get("index", 0), {
+                    "id": "",
+                    "type": "function",
+                    "function": {"name": "", "arguments": ""},
+                })
+                if tc_delta.get("id"):
+                    tc["id"] = tc_delta["id"]
+                func = tc_delta.get("function") or {}
+                if func.get("name"):
+                    tc["function"]["name"] += func["name"]
+                if func.get("arguments"):
+                    tc["function"]["arguments"] += func["arguments"]
+
+        assistant_message: Dict[str, Any] = {
+            "role": "assistant",
+            "content": "".join(content_parts),
+        }
+        if tool_call_parts:
+            assistant_message["tool_calls"] = [
+                tool_call_parts[i] for i in sorted(tool_call_parts)
+            ]
+
+        yield {"type": "message", "message": assistant_message}
+
+    def _fast_route(self, message: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Match short, read-only lookups that map directly onto a single tool.
+
+        Returns (tool_name, arguments) on a match, or None when the message
+        needs the full LLM (anything long, open-ended or state-changing).
+        """
+        if len(message) > FAST_ROUTE_MAX_LENGTH or _FAST_ROUTE_EXCLUDE.search(message):
+            return None
+
+        for pattern, tool_name in _FAST_ROUTES:
+            if pattern.search(message):
+                return tool_name, {}
+
+        sku_match = _SKU_PATTERN.search(message)
+        if sku_match:
+            return "check_inventory", {"sku": sku_match.group(0).upper()}
+
+        return None
+
+    def _format_fast_response(self, tool_name: str, result: Dict[str, Any]) -> str:
+        """Render a templated answer for a fast-routed tool result"""
+        if "error" in result:
+            return f"I couldn't complete that lookup: {result['error']}"
+
+        if tool_name == "get_low_stock_alerts":
+            items = result["items"]
+            if not items:
+                return f"All products have at least {result['threshold']} units in stock."
+            lines = [f"**{result['count']} products are below {result['threshold']} units:**\n"]
+            for item in items:
+                lines.append(f"- {item['name']} ({item['sku']}): {item['quantity']} units")
+            return "\n".join(lines)
+
+        if tool_name == "get_inventory_analytics":
+            return (
+                "**Inventory Summary:**\n\n"
+                f"- Total Products: {result['total_products']}\n"
+                f"- Total Units: {result['total_units']}\n"
+                f"- Total Value: ${result['total_value']:,.2f}\n"
+                f"- Low Stock: {result['low_stock_count']}\n"
+                f"- Out of Stock: {result['out_of_stock_count']}"
+            )
+
+        # check_inventory by SKU
+        product = result.get("product")
+        if not product:
+            return "I couldn't find a product with that SKU."
+        return (
+            f"**{product['name']}** ({product['sku']}): {product['quantity']} units, "
+            f"{product['status'].replace('_', ' ')} - {product['location'] or 'location unknown'}"
+        )
+
+    async def _run_fast_route(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Execute a fast-routed tool and yield a templated response"""
+        tool_call = ToolCall(
+            tool_name=tool_name,
+            arguments=arguments,
+            status=ToolCallStatus.RUNNING,
+            agent=TOOL_AGENT_TYPES.get(tool_name, AgentType.INVENTORY),
         )
+        yield {"type": "tool_start", "tool_call": tool_call}
+
+        async for event in self._run_tools([tool_call]):
+            yield event
+        yield {"type": "chunk", "content": self._format_fast_response(tool_name, tool_call.result)}
+
+    async def _run_tools(
+        self,
+        tool_calls: List[ToolCall],
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Run tool calls concurrently, yielding a tool_call event as each completes"""
+
+        async def run(tool_call: ToolCall) -> ToolCall:
+            start_time = time.perf_counter()
+            result = await self._execute_tool(tool_call.tool_name, tool_call.arguments)
+            tool_call.duration = int((time.perf_counter() - start_time) * 1000)
+            tool_call.result = result
+            if "error" in result:
+                tool_call.status = ToolCallStatus.ERROR
+                tool_call.error = result["error"]
+            else:
+                tool_call.status = ToolCallStatus.COMPLETED
+            return tool_call
+
+        for finished in asyncio.as_completed([run(tc) for tc in tool_calls]):
+            yield {"type": "tool_call", "tool_call": await finished}
+
+    async def _run_llm_turn(
+        self,
+        messages: List[Dict[str, Any]],
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream a model turn, running any requested tools and the follow-up"""
+        assistant_message: Dict[str, Any] = {}
+        async for event in self._stream_completion(messages, tools=True):
+            if event["type"] == "chunk":
+                yield event
+            else:
+                assistant_message = event["message"]
+
+        # Handle tool calls if present
+        if "tool_calls" not in assistant_message:
+            return
+
+        # (tool_call_id, tool_name, arguments) for each requested call
+        requested = [
+            (
+                tool_call["id"],
+                tool_call["function"]["name"],
+                orjson.loads(tool_call["function"].get("arguments") or "{}"),
+            )
+            for tool_call in assistant_message["tool_calls"]
+        ]
 
-        # Build messages for AI
-        messages = [
-            {"role": "system", "content": self._get_system_prompt()},
+        tool_calls = [
+            ToolCall(
+                tool_name=name,
+                arguments=args,
+                status=ToolCallStatus.RUNNING,
+                agent=TOOL_AGENT_TYPES.get(name, AgentType.INVENTORY),
+            )
+            for _, name, args in requested
         ]
+        for tool_call in tool_calls:
+            yield {"type": "tool_start", "tool_call": tool_call}
 
-        # Add conversation history
-        for hist in self.conversation_history[-10:]:  # Keep last 10 messages
-            messages.append(hist)
+        # Execute independent tool calls concurrently, reporting each as it finishes
+        async for event in self._run_tools(tool_calls):
+            yield event
 
-        # Add current message
-        messages.append({"role": "user", "content": message})
+        # If we had tool calls, stream a follow-up response
+        messages.append(assistant_message)
+
+        for (tool_call_id, _, _), tool_call in zip(requested, tool_calls):
+            messages.append({
+                "role": "tool",
+                "tool_call_id": tool_call_id,
+                "content": orjson.dumps(tool_call.result, option=orjson.OPT_NON_STR_KEYS).decode(),
+            })
+
+        async for event in self._stream_completion(messages):
+            if event["type"] == "chunk":
+                yield event
+
+    async def process_message_stream(
+        self,
+        message: str,
+        conversation_id: Optional[str] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Process a user message, streaming the AI response.
+
+        Yields events:
+        - {"type": "chunk", "content": str} for each response token
+        - {"type": "tool_start", "tool_call": ToolCall} when a tool begins running
+        - {"type": "tool_call", "tool_call": ToolCall} as each tool finishes
+        - {"type": "complete", "message": ChatMessage} once the response is done
+        """
+        if _log_level_check.isEnabledFor(logging.INFO):
+            logger.info(
+                "Processing message",
+                user=self.user.email,
+                message_preview=message[:100],
+            )
 
-        # Call Azure Foundry
         tool_calls = []
+        content_parts: List[str] = []
         try:
-            response = await self._call_azure_foundry(messages, AVAILABLE_TOOLS)
-            choice = response["choices"][0]
-            assistant_message = choice["message"]
-
-            # Handle tool calls if present
-            if "tool_calls" in assistant_message:
-                for tool_call in assistant_message["tool_calls"]:
-                    func = tool_call["function"]
-                    tool_name = func["name"]
-                    arguments = json.loads(func.get("arguments", "{}"))
-
-                    # Execute tool
-                    result = await self._execute_tool(tool_name, arguments)
-
-                    # Determine agent type based on tool
-                    agent_type = AgentType.INVENTORY
-                    if tool_name in ["get_opportunities", "create_opportunity",
-                                     "get_leads", "get_sales_analytics", "search_accounts"]:
-                        agent_type = AgentType.SALES
-                    elif tool_name in ["search_contacts", "get_customer_history", "create_activity"]:
-                        agent_type = AgentType.CUSTOMER
-
-                    tool_calls.append(ToolCall(
-                        tool_name=tool_name,
-                        arguments=arguments,
-                        result=result,
-                        agent=agent_type,
-                    ))
-
-                # If we had tool calls, get a follow-up response
-                messages.append(assistant_message)
-                for tc in tool_calls:
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call["id"],
-                        "content": json.dumps(tc.result),
-                    })
-
-                final_response = await self._call_azure_foundry(messages)
-                content = final_response["choices"][0]["message"]["content"]
+            fast_route = self._fast_route(message)
+            if fast_route:
+                # Simple lookups skip the LLM entirely
+                events = self._run_fast_route(*fast_route)
             else:
-                content = assistant_message.get("content", "")
+                # Build messages for AI
+                messages = [self._system_message]
+
+                # Add conversation history (bounded by the deque's maxlen)
+                messages.extend(self.conversation_history)
+
+                # Add current message
+                messages.append({"role": "user", "content": message})
+
+                events = self._run_llm_turn(messages)
+
+            async for event in events:
+                if event["type"] == "chunk":
+                    content_parts.append(event["content"])
+                elif event["type"] == "tool_call":
+                    tool_calls.append(event["tool_call"])
+                yield event
 
         except Exception as e:
             logger.error("AI processing failed", error=str(e))
-            content = f"I encountered an issue processing your request. Please try again. (Error: {str(e)})"
+            error_text = f"I encountered an issue processing your request. Please try again. (Error: {str(e)})"
+            content_parts = [error_text]
+            yield {"type": "chunk", "content": error_text}
+
+        content = "".join(content_parts)
 
         # Update conversation history
         self.conversation_history.append({"role": "user", "content": message})
@@ -577,9 +923,43 @@ What would you like to know about today?"""
         # Determine primary agent used
         agents_used = list(set(tc.agent for tc in tool_calls)) if tool_calls else [AgentType.GENERAL]
 
-        return ChatMessage(
-            role=MessageRole.ASSISTANT,
-            content=content,
-            agent=agents_used[0] if len(agents_used) == 1 else AgentType.GENERAL,
-            tool_calls=tool_calls if tool_calls else None,
-        )
+        yield {
+            "type": "complete",
+            "message": ChatMessage(
+                role=MessageRole.ASSISTANT,
+                content=content,
+                agent=agents_used[0] if len(agents_used) == 1 else AgentType.GENERAL,
+                tool_calls=tool_calls if tool_calls else None,
+            ),
+        }
+
+    async def process_message(
+        self,
+        message: str,
+        conversation_id: Optional[str] = None,
+    ) -> ChatMessage:
+        """Process a user message and return the complete AI response"""
+        result = None
+        async for event in self.process_message_stream(message, conversation_id):
+            if event["type"] == "complete":
+                result = event["message"]
+        return result
+
+
+def _salesforce_handler(tool_name: str):
+    """Build a dispatch handler that forwards a tool call to SalesforceTools"""
+    async def handler(self: AgentOrchestrator, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._call_salesforce(tool_name, arguments)
+    return handler
+
+
+# Tool name -> handler, built once at import time
+AgentOrchestrator._DISPATCH = {
+    "check_inventory": AgentOrchestrator._tool_check_inventory,
+    "update_inventory": AgentOrchestrator._tool_update_inventory,
+    "get_low_stock_alerts": AgentOrchestrator._tool_get_low_stock_alerts,
+    "create_reorder": AgentOrchestrator._tool_create_reorder,
+    "get_inventory_analytics": AgentOrchestrator._tool_get_inventory_analytics,
+    "get_stock_movements": AgentOrchestrator._tool_get_stock_movements,
+    **{name: _salesforce_handler(name) for name in SALESFORCE_METHODS},
+}
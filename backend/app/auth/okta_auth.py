@@ -7,20 +7,56 @@ Handles:
 - ID-JAG token exchange for XAA
 """
 
+import asyncio
+import httpx
 import jwt
 import time
 import uuid
-import json
-import httpx
-from typing import Optional
+from collections import OrderedDict
+from typing import Optional, Any
+from jwt.algorithms import ECAlgorithm, RSAAlgorithm
 from functools import lru_cache
+import orjson
 from fastapi import HTTPException, Security, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import structlog
 
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.models.schemas import UserInfo
 
 security = HTTPBearer()
+logger = structlog.get_logger()
+
+# Minimum age of the JWKS cache before an unknown kid may force a refetch,
+# so tokens with bogus kids can't make every request hit Okta
+JWKS_FORCE_REFRESH_INTERVAL = 60
+
+# Scoped access tokens are reused until this many seconds before they expire
+SCOPED_TOKEN_EXPIRY_MARGIN = 30
+SCOPED_TOKEN_CACHE_SIZE = 10_000
+
+# Validated ID tokens are remembered until they expire
+VALIDATED_TOKEN_CACHE_SIZE = 10_000
+
+# Invariant parts of the token endpoint requests; per-call fields are merged in
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+# Endpoint URLs are parsed once here; this also surfaces a bad domain at startup
+_ORG_TOKEN_AUDIENCE = f"https://{settings.okta_domain}/oauth2/v1/token"
+_ORG_TOKEN_URL = httpx.URL(_ORG_TOKEN_AUDIENCE)
+_JWKS_URL = httpx.URL(settings.okta_jwks_uri)
+_ID_JAG_FORM = {
+    "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
+    "client_id": settings.okta_client_id,
+    "client_assertion_type": "urn:ietf:params:oauth:client-assertion-type:jwt-bearer",
+    "scope": "openid profile email",
+}
+_TOKEN_EXCHANGE_FORM = {
+    "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
+    "subject_token_type": "urn:ietf:params:oauth:token-type:id_token",
+    "client_id": settings.okta_client_id,
+    "client_assertion_type": "urn:ietf:params:oauth:client-assertion-type:jwt-bearer",
+}
 
 
 class OktaAuth:
@@ -29,46 +65,109 @@ class OktaAuth:
     def __init__(self):
         self._jwks_cache: Optional[dict] = None
         self._jwks_cache_time: float = 0
+        self._jwks_by_kid: dict[str, dict] = {}
         self._cache_ttl: int = 3600  # 1 hour
+        # Parsed public keys by kid, rebuilt whenever the JWKS is refetched
+        self._key_cache: dict[str, Any] = {}
+        # Only one coroutine refetches an expired JWKS; the rest wait for it
+        self._jwks_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._private_key: Optional[tuple[Any, str]] = None
+        # (user sub, auth server, scopes) -> (token result, expiry), least recently used first
+        self._scoped_tokens: "OrderedDict[tuple, tuple[dict, float]]" = OrderedDict()
+        self._scoped_token_requests: dict[tuple, asyncio.Future] = {}
+        # Raw ID token -> (UserInfo, exp), least recently used first
+        self._validated_tokens: "OrderedDict[str, tuple[UserInfo, float]]" = OrderedDict()
+        self._custom_as_token_urls: dict[str, httpx.URL] = {}
+
+    def _jwks_is_fresh(self) -> bool:
+        return bool(self._jwks_cache) and (time.time() - self._jwks_cache_time) < self._cache_ttl
+
+    async def _refresh_jwks(self) -> None:
+        """Refetch JWKS from Okta, coalescing concurrent refreshes into one request"""
+        seen_time = self._jwks_cache_time
+
+        async with self._jwks_lock:
+            # Another coroutine refreshed the cache while we waited
+            if self._jwks_cache_time != seen_time:
+                return
+
+            client = get_http_client()
+            response = await client.get(_JWKS_URL)
+            response.raise_for_status()
+            self._jwks_cache = orjson.loads(response.content)
+            self._jwks_cache_time = time.time()
+            self._jwks_by_kid = {
+                key["kid"]: key for key in self._jwks_cache.get("keys", []) if "kid" in key
+            }
+            self._key_cache.clear()
 
-    async def get_jwks(self) -> dict:
-        """Fetch and cache JWKS from Okta"""
-        current_time = time.time()
+    async def _refresh_jwks_in_background(self) -> None:
+        try:
+            await self._refresh_jwks()
+        except Exception as e:
+            logger.warning("JWKS refresh failed, keeping cached keys", error=str(e))
 
-        if self._jwks_cache and (current_time - self._jwks_cache_time) < self._cache_ttl:
-            return self._jwks_cache
+    async def get_jwks(self, force: bool = False) -> dict:
+        """
+        Fetch and cache JWKS from Okta.
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(settings.okta_jwks_uri)
-            response.raise_for_status()
-            self._jwks_cache = response.json()
-            self._jwks_cache_time = current_time
+        Only the very first call waits on the network. Once the cache has
+        expired, the stale keys are served while a background task
+        refetches them. force=True refetches immediately (e.g. after a key
+        rotation), at most once per JWKS_FORCE_REFRESH_INTERVAL.
+        """
+        if self._jwks_cache is None:
+            await self._refresh_jwks()
+        elif force and time.time() - self._jwks_cache_time >= JWKS_FORCE_REFRESH_INTERVAL:
+            await self._refresh_jwks()
+        elif not self._jwks_is_fresh() and (
+            self._refresh_task is None or self._refresh_task.done()
+        ):
+            self._refresh_task = asyncio.create_task(self._refresh_jwks_in_background())
 
         return self._jwks_cache
 
+    async def run_jwks_refresher(self) -> None:
+        """Keep the JWKS cache warm by refreshing it ahead of expiry (runs until cancelled)"""
+        while True:
+            await self._refresh_jwks_in_background()
+            await asyncio.sleep(self._cache_ttl * 0.8)
+
     async def validate_id_token(self, token: str) -> UserInfo:
-        """Validate an ID token from Okta"""
+        """
+        Validate an ID token from Okta.
+
+        Every request carries the same token until it expires, so a
+        successfully validated token is cached (keyed by the exact token
+        string) and reused until its exp claim.
+        """
+        cached = self._validated_tokens.get(token)
+        if cached and time.time() < cached[1]:
+            self._validated_tokens.move_to_end(token)
+            return cached[0]
+
         try:
-            # Get JWKS
-            jwks = await self.get_jwks()
+            # Refresh JWKS if the cache has expired
+            await self.get_jwks()
 
             # Decode header to get key ID
             unverified_header = jwt.get_unverified_header(token)
             kid = unverified_header.get("kid")
 
-            # Find the matching key
-            rsa_key = None
-            for key in jwks.get("keys", []):
-                if key.get("kid") == kid:
-                    rsa_key = key
-                    break
+            # Convert the matching JWK to a public key object once per kid
+            public_key = self._key_cache.get(kid)
+            if public_key is None:
+                rsa_key = self._jwks_by_kid.get(kid)
+                if not rsa_key:
+                    # Okta may have rotated its signing keys; refetch once and retry
+                    await self.get_jwks(force=True)
+                    rsa_key = self._jwks_by_kid.get(kid)
+                if not rsa_key:
+                    raise HTTPException(status_code=401, detail="Invalid token: key not found")
 
-            if not rsa_key:
-                raise HTTPException(status_code=401, detail="Invalid token: key not found")
-
-            # Convert JWK to PEM for verification
-            from jwt.algorithms import RSAAlgorithm
-            public_key = RSAAlgorithm.from_jwk(json.dumps(rsa_key))
+                public_key = RSAAlgorithm.from_jwk(rsa_key)
+                self._key_cache[kid] = public_key
 
             # Verify and decode
             payload = jwt.decode(
@@ -79,7 +178,7 @@ class OktaAuth:
                 issuer=settings.okta_issuer_url,
             )
 
-            return UserInfo(
+            user = UserInfo(
                 sub=payload.get("sub"),
                 email=payload.get("email", ""),
                 name=payload.get("name"),
@@ -88,11 +187,37 @@ class OktaAuth:
                 groups=payload.get("groups", []),
             )
 
+            if "exp" in payload:
+                self._validated_tokens[token] = (user, float(payload["exp"]))
+                if len(self._validated_tokens) > VALIDATED_TOKEN_CACHE_SIZE:
+                    self._validated_tokens.popitem(last=False)
+
+            return user
+
         except jwt.ExpiredSignatureError:
             raise HTTPException(status_code=401, detail="Token has expired")
         except jwt.InvalidTokenError as e:
             raise HTTPException(status_code=401, detail=f"Invalid token: {str(e)}")
 
+    def _load_private_key(self) -> tuple[Any, str]:
+        """
+        Parse the WLP private key JWK once and reuse the key object.
+
+        Returns (key, algorithm): EC P-256 keys sign with ES256, which is
+        much cheaper per assertion than RSA; RSA keys keep using RS256.
+        """
+        if self._private_key is None:
+            jwk = orjson.loads(settings.wlp_private_key)
+            if jwk.get("kty") == "EC":
+                if jwk.get("crv") != "P-256":
+                    raise HTTPException(
+                        status_code=500, detail="WLP EC private key must use the P-256 curve"
+                    )
+                self._private_key = (ECAlgorithm.from_jwk(jwk), "ES256")
+            else:
+                self._private_key = (RSAAlgorithm.from_jwk(jwk), "RS256")
+        return self._private_key
+
     def generate_wlp_assertion(self, audience: Optional[str] = None) -> str:
         """
         Generate a JWT client assertion signed with the WLP private key.
@@ -104,7 +229,7 @@ class OktaAuth:
             )
 
         now = int(time.time())
-        aud = audience or f"https://{settings.okta_domain}/oauth2/v1/token"
+        aud = audience or _ORG_TOKEN_AUDIENCE
 
         payload = {
             "iss": settings.wlp_client_id,
@@ -115,12 +240,8 @@ class OktaAuth:
             "jti": str(uuid.uuid4()),
         }
 
-        # Parse private key from JWK
-        private_key_jwk = json.loads(settings.wlp_private_key)
-        from jwt.algorithms import RSAAlgorithm
-        private_key = RSAAlgorithm.from_jwk(json.dumps(private_key_jwk))
-
-        return jwt.encode(payload, private_key, algorithm="RS256")
+        private_key, algorithm = self._load_private_key()
+        return jwt.encode(payload, private_key, algorithm=algorithm)
 
     async def exchange_for_id_jag(self, id_token: str) -> str:
         """
@@ -130,31 +251,29 @@ class OktaAuth:
         - Input: User's ID token
         - Output: ID-JAG (Identity Assertion JWT with `act` claim = WLP)
         """
-        client_assertion = self.generate_wlp_assertion()
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"https://{settings.okta_domain}/oauth2/v1/token",
-                data={
-                    "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
-                    "assertion": id_token,
-                    "client_id": settings.okta_client_id,
-                    "client_assertion_type": "urn:ietf:params:oauth:client-assertion-type:jwt-bearer",
-                    "client_assertion": client_assertion,
-                    "scope": "openid profile email",
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
+        # Signing is CPU-bound; run it in a worker thread (cryptography releases the GIL)
+        client_assertion = await asyncio.to_thread(self.generate_wlp_assertion)
+
+        client = get_http_client()
+        response = await client.post(
+            _ORG_TOKEN_URL,
+            data={
+                **_ID_JAG_FORM,
+                "assertion": id_token,
+                "client_assertion": client_assertion,
+            },
+            headers=_FORM_HEADERS,
+        )
 
-            if response.status_code != 200:
-                error = response.json()
-                raise HTTPException(
-                    status_code=401,
-                    detail=f"ID-JAG exchange failed: {error.get('error_description', error.get('error'))}",
-                )
+        if response.status_code != 200:
+            error = orjson.loads(response.content)
+            raise HTTPException(
+                status_code=401,
+                detail=f"ID-JAG exchange failed: {error.get('error_description', error.get('error'))}",
+            )
 
-            data = response.json()
-            return data.get("id_token")  # This is the ID-JAG
+        data = orjson.loads(response.content)
+        return data.get("id_token")  # This is the ID-JAG
 
     async def exchange_id_jag_for_token(
         self,
@@ -169,43 +288,101 @@ class OktaAuth:
         - Input: ID-JAG from Step 1
         - Output: Scoped access token for the target resource
         """
-        client_assertion = self.generate_wlp_assertion(
-            audience=f"https://{settings.okta_domain}/oauth2/{auth_server_id}/v1/token"
+        token_url = self._custom_as_token_urls.get(auth_server_id)
+        if token_url is None:
+            token_url = httpx.URL(f"https://{settings.okta_domain}/oauth2/{auth_server_id}/v1/token")
+            self._custom_as_token_urls[auth_server_id] = token_url
+
+        client_assertion = await asyncio.to_thread(self.generate_wlp_assertion, audience=str(token_url))
+
+        client = get_http_client()
+        response = await client.post(
+            token_url,
+            data={
+                **_TOKEN_EXCHANGE_FORM,
+                "subject_token": id_jag,
+                "client_assertion": client_assertion,
+                "scope": " ".join(scopes),
+            },
+            headers=_FORM_HEADERS,
         )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"https://{settings.okta_domain}/oauth2/{auth_server_id}/v1/token",
-                data={
-                    "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
-                    "subject_token": id_jag,
-                    "subject_token_type": "urn:ietf:params:oauth:token-type:id_token",
-                    "client_id": settings.okta_client_id,
-                    "client_assertion_type": "urn:ietf:params:oauth:client-assertion-type:jwt-bearer",
-                    "client_assertion": client_assertion,
-                    "scope": " ".join(scopes),
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-
-            if response.status_code != 200:
-                error = response.json()
-                # Don't raise - return access denied info
-                return {
-                    "success": False,
-                    "error": error.get("error"),
-                    "error_description": error.get("error_description"),
-                }
-
-            data = response.json()
+        if response.status_code != 200:
+            error = orjson.loads(response.content)
+            # Don't raise - return access denied info
             return {
-                "success": True,
-                "access_token": data.get("access_token"),
-                "token_type": data.get("token_type", "Bearer"),
-                "expires_in": data.get("expires_in"),
-                "scope": data.get("scope"),
+                "success": False,
+                "error": error.get("error"),
+                "error_description": error.get("error_description"),
             }
 
+        data = orjson.loads(response.content)
+        return {
+            "success": True,
+            "access_token": data.get("access_token"),
+            "token_type": data.get("token_type", "Bearer"),
+            "expires_in": data.get("expires_in"),
+            "scope": data.get("scope"),
+        }
+
+
+    async def _exchange_and_cache_scoped_token(
+        self,
+        key: tuple,
+        id_token: str,
+        auth_server_id: str,
+        scopes: list[str],
+    ) -> dict:
+        id_jag = await self.exchange_for_id_jag(id_token)
+        result = await self.exchange_id_jag_for_token(
+            id_jag=id_jag,
+            auth_server_id=auth_server_id,
+            scopes=scopes,
+        )
+
+        # Only successful grants are cached; denials are re-checked next time
+        if result.get("success") and result.get("expires_in"):
+            expiry = time.time() + int(result["expires_in"]) - SCOPED_TOKEN_EXPIRY_MARGIN
+            self._scoped_tokens[key] = (result, expiry)
+            self._scoped_tokens.move_to_end(key)
+            if len(self._scoped_tokens) > SCOPED_TOKEN_CACHE_SIZE:
+                self._scoped_tokens.popitem(last=False)
+
+        return result
+
+    async def get_scoped_token(
+        self,
+        id_token: str,
+        auth_server_id: str,
+        scopes: list[str],
+    ) -> dict:
+        """
+        Get a scoped access token for the user via the two-step ID-JAG flow.
+
+        Tokens are cached per (user, auth server, scopes) until shortly
+        before they expire, and concurrent requests for the same key share
+        a single exchange. Returns the exchange_id_jag_for_token result.
+        """
+        # The ID token has already been validated by get_current_user
+        sub = jwt.decode(id_token, options={"verify_signature": False}).get("sub")
+        key = (sub, auth_server_id, tuple(sorted(scopes)))
+
+        cached = self._scoped_tokens.get(key)
+        if cached and time.time() < cached[1]:
+            self._scoped_tokens.move_to_end(key)
+            return cached[0]
+
+        request = self._scoped_token_requests.get(key)
+        if request is None:
+            request = asyncio.ensure_future(
+                self._exchange_and_cache_scoped_token(key, id_token, auth_server_id, scopes)
+            )
+            self._scoped_token_requests[key] = request
+            request.add_done_callback(lambda _: self._scoped_token_requests.pop(key, None))
+
+        # Shield so one caller disconnecting doesn't cancel the shared exchange
+        return await asyncio.shield(request)
+
 
 # Singleton instance
 okta_auth = OktaAuth()
@@ -7,13 +7,53 @@ Handles:
 - Managing user linked accounts
 """
 
+import asyncio
+import time
+import urllib.parse
 import httpx
+from collections import OrderedDict
 from typing import Optional
+import orjson
 from fastapi import HTTPException
 
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.auth.okta_auth import okta_auth
 
+# Invariant request parts; the management token body is entirely static
+_AUTH0_TOKEN_URL = httpx.URL(f"https://{settings.auth0_domain}/oauth/token")
+_AUTH0_USERS_URL = httpx.URL(f"https://{settings.auth0_domain}/api/v2/users")
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+_MANAGEMENT_TOKEN_BODY = orjson.dumps({
+    "grant_type": "client_credentials",
+    "client_id": settings.auth0_client_id,
+    "client_secret": settings.auth0_client_secret,
+    "audience": f"https://{settings.auth0_domain}/api/v2/",
+})
+_VAULT_EXCHANGE_FORM = {
+    "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
+    "subject_token_type": "urn:ietf:params:oauth:token-type:id_token",
+    "client_id": settings.auth0_client_id,
+    "client_secret": settings.auth0_client_secret,
+    "audience": f"https://{settings.auth0_domain}/api/v2/",
+    "scope": "read:users read:user_idp_tokens",
+}
+_AUTHORIZE_URL = f"https://{settings.auth0_domain}/authorize?"
+_AUTHORIZE_PARAMS = {
+    "client_id": settings.auth0_client_id,
+    "response_type": "code",
+    "scope": "openid profile email offline_access",
+}
+
+# Okta sub -> Auth0 user id mappings are effectively static; re-check hourly
+USER_ID_CACHE_TTL = 3600
+USER_ID_CACHE_SIZE = 10_000
+
+# Linked Salesforce tokens are re-read from the user's identities every few minutes
+SALESFORCE_TOKEN_CACHE_TTL = 300
+SALESFORCE_TOKEN_CACHE_SIZE = 10_000
+
 
 class TokenVault:
     """Auth0 Token Vault handler for external service access"""
@@ -21,23 +61,31 @@ class TokenVault:
     def __init__(self):
         self._management_token: Optional[str] = None
         self._token_expiry: float = 0
+        # Only one coroutine refreshes an expired management token
+        self._management_token_lock = asyncio.Lock()
+        # Okta sub -> (Auth0 user id, expiry), least recently used first
+        self._auth0_user_ids: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+        # Auth0 user id -> (Salesforce token result, expiry), least recently used first
+        self._salesforce_tokens: "OrderedDict[str, tuple[dict, float]]" = OrderedDict()
+
+    def _management_token_is_fresh(self) -> bool:
+        return bool(self._management_token) and time.time() < self._token_expiry
 
     async def get_management_token(self) -> str:
         """Get Auth0 Management API token"""
-        import time
-
-        if self._management_token and time.time() < self._token_expiry:
+        if self._management_token_is_fresh():
             return self._management_token
 
-        async with httpx.AsyncClient() as client:
+        async with self._management_token_lock:
+            # Another request may have refreshed the token while we waited
+            if self._management_token_is_fresh():
+                return self._management_token
+
+            client = get_http_client()
             response = await client.post(
-                f"https://{settings.auth0_domain}/oauth/token",
-                json={
-                    "grant_type": "client_credentials",
-                    "client_id": settings.auth0_client_id,
-                    "client_secret": settings.auth0_client_secret,
-                    "audience": f"https://{settings.auth0_domain}/api/v2/",
-                },
+                _AUTH0_TOKEN_URL,
+                content=_MANAGEMENT_TOKEN_BODY,
+                headers=_JSON_HEADERS,
             )
 
             if response.status_code != 200:
@@ -46,7 +94,7 @@ class TokenVault:
                     detail="Failed to get Auth0 management token",
                 )
 
-            data = response.json()
+            data = orjson.loads(response.content)
             self._management_token = data["access_token"]
             self._token_expiry = time.time() + data.get("expires_in", 86400) - 60
 
@@ -59,37 +107,29 @@ class TokenVault:
         This allows the agent to access Token Vault while maintaining
         the WLP identity in the `act` claim for audit purposes.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"https://{settings.auth0_domain}/oauth/token",
-                data={
-                    "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
-                    "subject_token": id_jag,
-                    "subject_token_type": "urn:ietf:params:oauth:token-type:id_token",
-                    "client_id": settings.auth0_client_id,
-                    "client_secret": settings.auth0_client_secret,
-                    "audience": f"https://{settings.auth0_domain}/api/v2/",
-                    "scope": "read:users read:user_idp_tokens",
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-
-            if response.status_code != 200:
-                error = response.json()
-                return {
-                    "success": False,
-                    "error": error.get("error"),
-                    "error_description": error.get("error_description"),
-                }
-
-            data = response.json()
+        client = get_http_client()
+        response = await client.post(
+            _AUTH0_TOKEN_URL,
+            data={**_VAULT_EXCHANGE_FORM, "subject_token": id_jag},
+            headers=_FORM_HEADERS,
+        )
+
+        if response.status_code != 200:
+            error = orjson.loads(response.content)
             return {
-                "success": True,
-                "access_token": data.get("access_token"),
-                "token_type": data.get("token_type", "Bearer"),
-                "expires_in": data.get("expires_in"),
+                "success": False,
+                "error": error.get("error"),
+                "error_description": error.get("error_description"),
             }
 
+        data = orjson.loads(response.content)
+        return {
+            "success": True,
+            "access_token": data.get("access_token"),
+            "token_type": data.get("token_type", "Bearer"),
+            "expires_in": data.get("expires_in"),
+        }
+
     async def get_salesforce_token(
         self,
         auth0_user_id: str,
@@ -99,59 +139,78 @@ class TokenVault:
         Get Salesforce access token from Token Vault for a specific user.
 
         The token is retrieved from the user's linked Salesforce identity.
+        Successful lookups made with the management token are cached for
+        SALESFORCE_TOKEN_CACHE_TTL.
         """
+        if vault_token is None:
+            cached = self._salesforce_tokens.get(auth0_user_id)
+            if cached and time.time() < cached[1]:
+                self._salesforce_tokens.move_to_end(auth0_user_id)
+                return cached[0]
+
         token = vault_token or await self.get_management_token()
 
-        async with httpx.AsyncClient() as client:
-            # Get user's linked identities
-            response = await client.get(
-                f"https://{settings.auth0_domain}/api/v2/users/{auth0_user_id}",
-                headers={"Authorization": f"Bearer {token}"},
-                params={"fields": "identities", "include_fields": "true"},
-            )
+        client = get_http_client()
+        # Get user's linked identities
+        response = await client.get(
+            f"https://{settings.auth0_domain}/api/v2/users/{auth0_user_id}",
+            headers={"Authorization": f"Bearer {token}"},
+            params={"fields": "identities", "include_fields": "true"},
+        )
 
-            if response.status_code != 200:
-                return {
-                    "success": False,
-                    "error": "user_not_found",
-                    "error_description": "Could not find user in Auth0",
-                }
-
-            user_data = response.json()
-            identities = user_data.get("identities", [])
-
-            # Find Salesforce identity
-            salesforce_identity = None
-            for identity in identities:
-                if identity.get("provider") == settings.salesforce_connection_name:
-                    salesforce_identity = identity
-                    break
-
-            if not salesforce_identity:
-                return {
-                    "success": False,
-                    "error": "salesforce_not_connected",
-                    "error_description": "User has not connected their Salesforce account",
-                }
-
-            # Get the access token
-            access_token = salesforce_identity.get("access_token")
-            refresh_token = salesforce_identity.get("refresh_token")
-
-            if not access_token:
-                return {
-                    "success": False,
-                    "error": "no_token",
-                    "error_description": "No Salesforce token available",
-                }
+        if response.status_code != 200:
+            return {
+                "success": False,
+                "error": "user_not_found",
+                "error_description": "Could not find user in Auth0",
+            }
+
+        user_data = orjson.loads(response.content)
+        identities = user_data.get("identities", [])
+
+        # Find Salesforce identity
+        salesforce_identity = next(
+            (i for i in identities if i.get("provider") == settings.salesforce_connection_name),
+            None,
+        )
 
+        if not salesforce_identity:
             return {
-                "success": True,
-                "access_token": access_token,
-                "refresh_token": refresh_token,
-                "instance_url": settings.salesforce_instance_url,
+                "success": False,
+                "error": "salesforce_not_connected",
+                "error_description": "User has not connected their Salesforce account",
             }
 
+        # Get the access token
+        access_token = salesforce_identity.get("access_token")
+        refresh_token = salesforce_identity.get("refresh_token")
+
+        if not access_token:
+            return {
+                "success": False,
+                "error": "no_token",
+                "error_description": "No Salesforce token available",
+            }
+
+        result = {
+            "success": True,
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "instance_url": settings.salesforce_instance_url,
+        }
+
+        if vault_token is None:
+            self._salesforce_tokens[auth0_user_id] = (result, time.time() + SALESFORCE_TOKEN_CACHE_TTL)
+            self._salesforce_tokens.move_to_end(auth0_user_id)
+            if len(self._salesforce_tokens) > SALESFORCE_TOKEN_CACHE_SIZE:
+                self._salesforce_tokens.popitem(last=False)
+
+        return result
+
+    def invalidate_salesforce_token(self, auth0_user_id: str) -> None:
+        """Drop a cached Salesforce token (e.g. after the account is disconnected)"""
+        self._salesforce_tokens.pop(auth0_user_id, None)
+
     async def check_salesforce_connection(self, auth0_user_id: str) -> bool:
         """Check if user has connected their Salesforce account"""
         result = await self.get_salesforce_token(auth0_user_id)
@@ -164,51 +223,59 @@ class TokenVault:
         state: Optional[str] = None,
     ) -> str:
         """Generate authorization URL for connecting an external account"""
-        import urllib.parse
-
         params = {
-            "client_id": settings.auth0_client_id,
-            "response_type": "code",
+            **_AUTHORIZE_PARAMS,
             "connection": connection,
             "redirect_uri": redirect_uri,
-            "scope": "openid profile email offline_access",
         }
 
         if state:
             params["state"] = state
 
-        query = urllib.parse.urlencode(params)
-        return f"https://{settings.auth0_domain}/authorize?{query}"
+        return _AUTHORIZE_URL + urllib.parse.urlencode(params)
 
     async def get_user_id_from_okta_sub(self, okta_sub: str) -> Optional[str]:
         """
         Find Auth0 user ID from Okta subject.
 
         Users are federated from Okta to Auth0, so we need to look up
-        the Auth0 user ID based on the Okta identity.
+        the Auth0 user ID based on the Okta identity. Found mappings
+        are cached for USER_ID_CACHE_TTL; misses are not cached, since the
+        Auth0 user may be created on the user's first federated login.
         """
-        token = await self.get_management_token()
-
-        async with httpx.AsyncClient() as client:
-            # Search for user by Okta identity
-            response = await client.get(
-                f"https://{settings.auth0_domain}/api/v2/users",
-                headers={"Authorization": f"Bearer {token}"},
-                params={
-                    "q": f'identities.user_id:"{okta_sub}"',
-                    "search_engine": "v3",
-                },
-            )
+        cached = self._auth0_user_ids.get(okta_sub)
+        if cached and time.time() < cached[1]:
+            self._auth0_user_ids.move_to_end(okta_sub)
+            return cached[0]
 
-            if response.status_code != 200:
-                return None
-
-            users = response.json()
-            if users and len(users) > 0:
-                return users[0].get("user_id")
+        token = await self.get_management_token()
 
+        client = get_http_client()
+        # Search for user by Okta identity
+        response = await client.get(
+            _AUTH0_USERS_URL,
+            headers={"Authorization": f"Bearer {token}"},
+            params={
+                "q": f'identities.user_id:"{okta_sub}"',
+                "search_engine": "v3",
+            },
+        )
+
+        if response.status_code != 200:
             return None
 
+        users = orjson.loads(response.content)
+        if users and len(users) > 0:
+            user_id = users[0].get("user_id")
+            if user_id:
+                self._auth0_user_ids[okta_sub] = (user_id, time.time() + USER_ID_CACHE_TTL)
+                self._auth0_user_ids.move_to_end(okta_sub)
+                if len(self._auth0_user_ids) > USER_ID_CACHE_SIZE:
+                    self._auth0_user_ids.popitem(last=False)
+            return user_id
+
+        return None
+
 
 # Singleton instance
 token_vault = TokenVault()
@@ -8,6 +8,17 @@ class Settings(BaseSettings):
     app_name: str = "ProGear Hiking API"
     debug: bool = False
     api_prefix: str = "/api"
+    log_level: str = "WARNING"
+    # Share of DEBUG/INFO events kept (1.0 = all); warnings and errors are never sampled
+    log_info_sample_rate: float = 1.0
+    # Inventory and conversation state live in process memory, so extra
+    # workers each see their own copy; raise only once that state is shared
+    web_concurrency: int = 1
+
+    # Per-request pyinstrument profiling (pip install pyinstrument); one HTML
+    # report per request is written to profile_dir
+    profile_requests: bool = False
+    profile_dir: str = "/tmp/progear-profiles"
 
     # CORS
     cors_origins: list[str] = ["http://localhost:3000", "https://*.vercel.app"]
@@ -35,11 +46,17 @@ class Settings(BaseSettings):
     # Salesforce
     salesforce_instance_url: str = "https://orgfarm-3592c48138-dev-ed.develop.my.salesforce.com"
     salesforce_connection_name: str = "salesforce"
+    salesforce_api_version: str = "59.0"
 
     # Azure AI Foundry
     azure_foundry_endpoint: str = ""
     azure_foundry_api_key: str = ""
     azure_foundry_deployment: str = "gpt-4"
+    azure_foundry_max_concurrency: int = 32
+
+    # Streaming: tokens per SSE chunk, and max time a partial batch is held
+    stream_batch_n: int = 4
+    stream_flush_interval_ms: int = 50
 
     @property
     def okta_issuer_url(self) -> str:
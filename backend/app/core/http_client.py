@@ -0,0 +1,55 @@
+"""
+Shared HTTP Clients
+
+Pooled clients reused for outbound API calls so connections (and their
+TLS sessions) are kept alive between requests:
+- httpx.AsyncClient for auth and Token Vault calls
+- aiohttp.ClientSession for the Azure AI Foundry and Salesforce REST calls
+"""
+
+from typing import Optional
+import aiohttp
+import httpx
+
+_http_client: Optional[httpx.AsyncClient] = None
+_aiohttp_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled HTTP client, creating it on first use"""
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+            http2=True,
+        )
+
+    return _http_client
+
+
+def get_aiohttp_session() -> aiohttp.ClientSession:
+    """Get the process-wide aiohttp session, creating it on first use"""
+    global _aiohttp_session
+
+    if _aiohttp_session is None or _aiohttp_session.closed:
+        _aiohttp_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=1000, limit_per_host=100, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=60),
+        )
+
+    return _aiohttp_session
+
+
+async def close_http_client() -> None:
+    """Close the pooled HTTP clients (called on application shutdown)"""
+    global _http_client, _aiohttp_session
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+    if _aiohttp_session is not None:
+        await _aiohttp_session.close()
+        _aiohttp_session = None
@@ -9,19 +9,60 @@ Main FastAPI application with:
 - Azure AI Foundry agent orchestration
 """
 
+import asyncio
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import uuid
+import orjson
 import structlog
 from contextlib import asynccontextmanager
+from typing import Optional
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.core.config import settings
+from app.core.http_client import get_http_client, get_aiohttp_session, close_http_client
+from app.auth.okta_auth import okta_auth
 from app.routers import chat, user, salesforce, inventory
 
-# Configure structured logging
+
+def _orjson_dumps(obj, **_kwargs) -> str:
+    """structlog serializer: orjson, falling back to str() for unknown types"""
+    return orjson.dumps(obj, default=str).decode()
+
+
+def _sample_info_events(_logger, method_name: str, event_dict: dict) -> dict:
+    """Drop a random share of debug/info events before they are rendered"""
+    if method_name in ("debug", "info") and random.random() >= settings.log_info_sample_rate:
+        raise structlog.DropEvent
+    return event_dict
+
+
+# Request handlers only enqueue log records; a background thread writes them
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # flush queued records on exit
+
+# Configure structured logging; events below LOG_LEVEL are dropped by filter_by_level
+logging.basicConfig(
+    format="%(message)s",
+    level=settings.log_level.upper(),
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+)
+_log_sampling = [_sample_info_events] if settings.log_info_sample_rate < 1 else []
 structlog.configure(
     processors=[
         structlog.stdlib.filter_by_level,
+        *_log_sampling,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
@@ -29,7 +70,7 @@ structlog.configure(
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer(),
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps),
     ],
     wrapper_class=structlog.stdlib.BoundLogger,
     context_class=dict,
@@ -44,8 +85,13 @@ logger = structlog.get_logger()
 async def lifespan(app: FastAPI):
     """Application lifespan handler"""
     logger.info("Starting ProGear Hiking API", debug=settings.debug)
+    get_http_client()
+    get_aiohttp_session()
+    jwks_refresher = asyncio.create_task(okta_auth.run_jwks_refresher())
     yield
     logger.info("Shutting down ProGear Hiking API")
+    jwks_refresher.cancel()
+    await close_http_client()
 
 
 # Create FastAPI app
@@ -58,16 +104,76 @@ app = FastAPI(
     redoc_url="/redoc" if settings.debug else None,
 )
 
+def _split_cors_origins(origins: list[str]) -> tuple[frozenset[str], Optional[str]]:
+    """
+    Split configured origins into exact matches and one combined regex.
+
+    Starlette compares allow_origins literally, so wildcard entries such as
+    "https://*.vercel.app" have to be expressed as allow_origin_regex.
+    """
+    exact = frozenset(o for o in origins if "*" not in o)
+    patterns = [
+        re.escape(o).replace(r"\*", "[a-z0-9-]+(?:\\.[a-z0-9-]+)*")
+        for o in origins
+        if "*" in o and o != "*"
+    ]
+    if "*" in origins:
+        exact = frozenset({"*"})
+    return exact, "|".join(patterns) or None
+
+
+_cors_exact_origins, _cors_origin_regex = _split_cors_origins(settings.cors_origins)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=_cors_exact_origins,
+    allow_origin_regex=_cors_origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
+if settings.profile_requests:
+    # Only imported when enabled: pyinstrument is a dev-time dependency
+    from pyinstrument import Profiler
+
+    os.makedirs(settings.profile_dir, exist_ok=True)
+
+    @app.middleware("http")
+    async def profile_request(request: Request, call_next):
+        """
+        Profile the request handler and save an HTML report.
+
+        Streaming responses are profiled up to the point the handler returns
+        the response, not while the body is being sent.
+        """
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        response = await call_next(request)
+        profiler.stop()
+
+        profile_id = uuid.uuid4().hex
+        report_path = os.path.join(settings.profile_dir, f"{profile_id}.html")
+        html = profiler.output_html()
+        await asyncio.to_thread(_write_profile_report, report_path, html)
+
+        response.headers["X-Profile-Id"] = profile_id
+        logger.info(
+            "Request profiled",
+            path=request.url.path,
+            duration_ms=int(profiler.last_session.duration * 1000),
+            report=report_path,
+        )
+        return response
+
+
+def _write_profile_report(path: str, html: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -112,4 +218,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
+        workers=None if settings.debug else settings.web_concurrency,
+        loop="uvloop",
+        http="httptools",
     )
@@ -1,9 +1,15 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from typing import Optional, Any
-from datetime import datetime
+from datetime import datetime, timezone
+from uuid import uuid4
 from enum import Enum
 
 
+def _utcnow() -> datetime:
+    """Timezone-aware UTC now (datetime.utcnow is naive and deprecated)"""
+    return datetime.now(timezone.utc)
+
+
 # === Auth Models ===
 
 class TokenInfo(BaseModel):
@@ -58,7 +64,7 @@ class ToolCallStatus(str, Enum):
 
 
 class ToolCall(BaseModel):
-    id: str = Field(default_factory=lambda: str(__import__('uuid').uuid4()))
+    id: str = Field(default_factory=lambda: uuid4().hex)
     name: Optional[str] = None
     tool_name: Optional[str] = None  # Alias for name
     status: ToolCallStatus = ToolCallStatus.PENDING
@@ -75,11 +81,13 @@ class ToolCall(BaseModel):
 
 class ChatMessage(BaseModel):
     """A message in a chat conversation"""
+    model_config = ConfigDict(frozen=True)
+
     role: MessageRole
     content: str
     agent: Optional[AgentType] = None
     tool_calls: Optional[list[ToolCall]] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class ChatResponse(BaseModel):
@@ -88,10 +96,12 @@ class ChatResponse(BaseModel):
     agent: AgentInfo
     tool_calls: list[ToolCall] = []
     conversation_id: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class StreamChunk(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     type: str  # "chunk", "tool_call", "complete"
     content: Optional[str] = None
     tool_call: Optional[ToolCall] = None
@@ -119,6 +129,8 @@ class UserAccess(BaseModel):
 # === Salesforce Models ===
 
 class SalesforceAccount(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     industry: Optional[str] = None
@@ -129,6 +141,8 @@ class SalesforceAccount(BaseModel):
 
 
 class SalesforceContact(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     email: Optional[str] = None
@@ -139,6 +153,8 @@ class SalesforceContact(BaseModel):
 
 
 class SalesforceLead(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     company: str
@@ -149,6 +165,8 @@ class SalesforceLead(BaseModel):
 
 
 class SalesforceOpportunity(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     amount: Optional[float] = None
@@ -204,7 +222,34 @@ class Product(BaseModel):
     reorder_point: int = 10
     status: StockStatus
     location: Optional[str] = None
-    last_updated: datetime = Field(default_factory=datetime.utcnow)
+    last_updated: datetime = Field(default_factory=_utcnow)
+
+    _cached_view: Optional[dict[str, Any]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Any field change (stock updates etc.) invalidates the cached view
+        if not name.startswith("_"):
+            self._cached_view = None
+
+    def update_fields(self, **changes: Any) -> None:
+        """Set several fields at once without per-assignment overhead.
+
+        Bypasses BaseModel.__setattr__, so values are not validated; callers
+        pass values of the declared field types.
+        """
+        self.__dict__.update(changes)
+        self.__pydantic_fields_set__.update(changes)
+        self.__pydantic_private__["_cached_view"] = None
+
+    def to_dict_cached(self) -> dict[str, Any]:
+        """JSON-ready dict of this product, memoized until the next field update.
+
+        The returned dict is shared between callers and must not be mutated.
+        """
+        if self._cached_view is None:
+            self._cached_view = self.model_dump(mode="json")
+        return self._cached_view
 
 
 class InventoryUpdate(BaseModel):
@@ -221,7 +266,7 @@ class InventoryAlert(BaseModel):
     alert_type: str  # "low_stock", "out_of_stock", "reorder"
     current_quantity: int
     threshold: int
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
 
 class StockSummary(BaseModel):
@@ -234,7 +279,9 @@ class StockSummary(BaseModel):
 
 class StockMovement(BaseModel):
     """Record of a stock quantity change"""
-    id: str = Field(default_factory=lambda: str(__import__('uuid').uuid4()))
+    model_config = ConfigDict(frozen=True)
+
+    id: str = Field(default_factory=lambda: uuid4().hex)
     sku: str
     product_name: str
     movement_type: MovementType
@@ -243,4 +290,4 @@ class StockMovement(BaseModel):
     new_quantity: int
     reason: Optional[str] = None
     performed_by: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
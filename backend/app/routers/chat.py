@@ -7,13 +7,19 @@ Main chat endpoint that orchestrates:
 - Response generation via Azure AI Foundry
 """
 
+import asyncio
+import re
 import uuid
 import time
-import json
-from typing import Optional, AsyncGenerator
+import orjson
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from typing import Optional, AsyncGenerator, Any
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 import structlog
 
 from app.auth.okta_auth import get_current_user, get_id_token, okta_auth
@@ -21,20 +27,140 @@ from app.auth.token_vault import token_vault
 from app.models.schemas import (
     ChatRequest,
     ChatResponse,
+    ChatMessage,
     AgentInfo,
     AgentType,
     ToolCall,
     ToolCallStatus,
     UserInfo,
 )
-from app.tools.salesforce_tools import SalesforceTools
-from app.tools.inventory_tools import InventoryTools, inventory_tools
+from app.tools.salesforce_tools import SalesforceTools, get_salesforce_tools
+from app.tools.inventory_tools import inventory_tools
 from app.agents.orchestrator import AgentOrchestrator as AIOrchestrator
 from app.core.config import settings
 
 router = APIRouter()
 logger = structlog.get_logger()
 
+# AI orchestrators keyed by (user sub, conversation id), least recently used first
+AI_ORCHESTRATOR_CACHE_SIZE = 10_000
+_AI_ORCHESTRATORS: "OrderedDict[tuple[str, str], AIOrchestrator]" = OrderedDict()
+
+# Intent keyword tables, matched against the message's word tokens.
+# Plural/inflected forms are listed explicitly since matching is per word.
+_WORD_PATTERN = re.compile(r"[a-z]+")
+
+_SALESFORCE_KEYWORDS = frozenset({
+    "sales", "salesforce", "lead", "leads", "opportunity", "opportunities",
+    "customer", "customers", "account", "accounts", "contact", "contacts",
+    "pipeline", "deal", "deals", "prospect", "prospects", "crm", "revenue",
+    "close", "closed", "closing", "won", "lost", "quote", "quotes",
+})
+_INVENTORY_KEYWORDS = frozenset({
+    "inventory", "stock", "stocks", "restock", "product", "products",
+    "warehouse", "quantity", "reorder", "alert", "alerts", "sku", "skus",
+    "item", "items", "supply", "supplies", "boot", "boots", "tent", "tents",
+    "backpack", "backpacks", "jacket", "jackets", "gear", "equipment",
+})
+
+_CREATE_WORDS = frozenset({"create", "add", "new"})
+_DETAIL_WORDS = frozenset({"detail", "details", "info", "about"})
+
+_LEAD_WORDS = frozenset({"lead", "leads"})
+_LEAD_UPDATE_WORDS = frozenset({"update", "change", "status"})
+_OPPORTUNITY_WORDS = frozenset({"opportunity", "opportunities", "deal", "deals", "pipeline"})
+_STAGE_UPDATE_WORDS = frozenset({"update", "stage"})
+_OVERVIEW_WORDS = frozenset({"summary", "overview"})
+_ACCOUNT_WORDS = frozenset({"account", "accounts", "company", "companies"})
+_CONTACT_WORDS = frozenset({"contact", "contacts"})
+_ACTIVITY_WORDS = frozenset({"activity", "activities", "recent"})
+
+_STOCK_CHECK_WORDS = frozenset({"check", "level", "levels", "status", "many", "quantity"})
+_STOCK_UPDATE_WORDS = frozenset({"update", "add", "increase", "decrease", "adjust"})
+_ALERT_WORDS = frozenset({"alert", "alerts", "warning", "warnings"})
+_ALERT_CREATE_WORDS = frozenset({"create", "set", "new"})
+_ALERT_DISMISS_WORDS = frozenset({"dismiss", "clear", "remove"})
+_PRODUCT_WORDS = frozenset({"product", "products", "item", "items"})
+_SEARCH_WORDS = frozenset({"search", "find", "look"})
+_REPORT_WORDS = frozenset({"summary", "overview", "total", "report"})
+_LOW_STOCK_WORDS = frozenset({"low", "reorder"})
+_BREAKDOWN_WORDS = frozenset({"category", "categories", "breakdown"})
+
+_INTENT_WORDS = frozenset().union(
+    _SALESFORCE_KEYWORDS, _INVENTORY_KEYWORDS, _CREATE_WORDS, _DETAIL_WORDS,
+    _LEAD_WORDS, _LEAD_UPDATE_WORDS, _OPPORTUNITY_WORDS, _STAGE_UPDATE_WORDS,
+    _OVERVIEW_WORDS, _ACCOUNT_WORDS, _CONTACT_WORDS, _ACTIVITY_WORDS,
+    _STOCK_CHECK_WORDS, _STOCK_UPDATE_WORDS, _ALERT_WORDS, _ALERT_CREATE_WORDS,
+    _ALERT_DISMISS_WORDS, _PRODUCT_WORDS, _SEARCH_WORDS, _REPORT_WORDS,
+    _LOW_STOCK_WORDS, _BREAKDOWN_WORDS,
+)
+_MIN_INTENT_WORD_LENGTH = min(map(len, _INTENT_WORDS))
+
+# Messages longer than this are classified without caching
+INTENT_CACHE_MAX_MESSAGE_LENGTH = 512
+
+
+@lru_cache(maxsize=4096)
+def _classify_intent(message: str) -> tuple[AgentType, tuple[str, ...]]:
+    """Classify a message into (primary_agent, required_tools)"""
+    # One pass over the message collects every intent keyword it contains;
+    # all checks below are set operations on that (small) hit set
+    tokens = _INTENT_WORDS.intersection(_WORD_PATTERN.findall(message.lower()))
+
+    salesforce_score = len(tokens & _SALESFORCE_KEYWORDS)
+    inventory_score = len(tokens & _INVENTORY_KEYWORDS)
+
+    if salesforce_score > inventory_score:
+        return AgentType.SALESFORCE, tuple(AgentOrchestrator._get_salesforce_tools(tokens))
+    elif inventory_score > 0:
+        return AgentType.INVENTORY, tuple(AgentOrchestrator._get_inventory_tools(tokens))
+    else:
+        # Default to orchestrator for general queries
+        return AgentType.ORCHESTRATOR, ()
+
+
+def _search_query(message: str) -> str:
+    """Extract the search query from a chat message"""
+    idx = message.rfind("search")
+    query = message[idx + len("search"):].strip() if idx >= 0 else message
+    return query[:50]
+
+
+# Rule-based tool dispatch: tool name -> (tools, message) -> ToolCall coroutine.
+# Tools without an entry (e.g. create_lead) are skipped.
+_SALESFORCE_TOOL_CALLS = {
+    "get_leads": lambda sf, message: sf.get_leads(limit=10),
+    "get_opportunities": lambda sf, message: sf.get_opportunities(limit=10),
+    "get_accounts": lambda sf, message: sf.get_accounts(limit=10),
+    "get_contacts": lambda sf, message: sf.get_contacts(limit=10),
+    "get_pipeline_summary": lambda sf, message: sf.get_pipeline_summary(),
+    "get_recent_activities": lambda sf, message: sf.get_recent_activities(),
+}
+
+_INVENTORY_TOOL_CALLS = {
+    # Try to extract SKU or category from message
+    "check_stock": lambda inv, message: inv.check_stock(),
+    "get_stock_summary": lambda inv, message: inv.get_stock_summary(),
+    "get_low_stock_report": lambda inv, message: inv.get_low_stock_report(),
+    "get_category_breakdown": lambda inv, message: inv.get_category_breakdown(),
+    "get_alerts": lambda inv, message: inv.get_alerts(),
+    "search_products": lambda inv, message: inv.search_products(query=_search_query(message)),
+    # For demo, we'll need more structured input
+    "update_stock": lambda inv, message: inv.get_stock_summary(),
+}
+
+# Scopes granted to the demo user's inventory agents
+_INVENTORY_SCOPES = ("inventory:read", "inventory:write", "inventory:alert")
+_AI_INVENTORY_SCOPES = ("inventory:read", "inventory:write")
+
+# Markdown fragments for formatted tool results
+_STATUS_EMOJI = {"in_stock": "🟢", "low_stock": "🟡", "out_of_stock": "🔴"}
+_ALERT_EMOJI = {"out_of_stock": "🔴"}
+_PRODUCT_TABLE_HEADER = ("| SKU | Name | Qty | Status |", "|-----|------|-----|--------|")
+_product_row = itemgetter("sku", "name", "quantity", "status")
+_lead_row = itemgetter("name", "company", "status")
+_low_stock_row = itemgetter("name", "sku", "current_quantity", "reorder_point", "shortage")
+
 
 class AgentOrchestrator:
     """Orchestrates chat requests between different MCP agents"""
@@ -43,206 +169,207 @@ class AgentOrchestrator:
         self,
         user: UserInfo,
         id_token: str,
-        salesforce_token: Optional[str] = None,
-        inventory_scopes: list[str] = None,
+        salesforce_tools: Optional[SalesforceTools] = None,
+        inventory_scopes: tuple[str, ...] = (),
     ):
         self.user = user
         self.id_token = id_token
-        self.salesforce_token = salesforce_token
-        self.inventory_scopes = inventory_scopes or []
+        self.salesforce_tools = salesforce_tools
+        self.inventory_scopes = inventory_scopes
 
     def analyze_intent(self, message: str) -> tuple[AgentType, list[str]]:
         """
         Analyze message to determine which agent(s) to use.
         Returns (primary_agent, required_tools).
         """
-        message_lower = message.lower()
-
-        # Salesforce keywords
-        salesforce_keywords = [
-            "sales", "lead", "opportunity", "customer", "account",
-            "contact", "pipeline", "deal", "prospect", "crm",
-            "revenue", "close", "won", "lost", "quote",
-        ]
-
-        # Inventory keywords
-        inventory_keywords = [
-            "inventory", "stock", "product", "warehouse", "quantity",
-            "reorder", "alert", "sku", "item", "supply",
-            "boot", "tent", "backpack", "jacket", "gear", "equipment",
-        ]
-
-        salesforce_score = sum(1 for kw in salesforce_keywords if kw in message_lower)
-        inventory_score = sum(1 for kw in inventory_keywords if kw in message_lower)
+        # Too short to contain any intent keyword
+        if len(message) < _MIN_INTENT_WORD_LENGTH:
+            return AgentType.ORCHESTRATOR, []
 
-        if salesforce_score > inventory_score:
-            return AgentType.SALESFORCE, self._get_salesforce_tools(message_lower)
-        elif inventory_score > 0:
-            return AgentType.INVENTORY, self._get_inventory_tools(message_lower)
+        # Intent depends only on the message text; repeated messages hit the
+        # cache without being lower-cased again
+        if len(message) <= INTENT_CACHE_MAX_MESSAGE_LENGTH:
+            agent_type, tools = _classify_intent(message)
         else:
-            # Default to orchestrator for general queries
-            return AgentType.ORCHESTRATOR, []
+            agent_type, tools = _classify_intent.__wrapped__(message)
+
+        return agent_type, list(tools)
 
-    def _get_salesforce_tools(self, message: str) -> list[str]:
+    @staticmethod
+    def _get_salesforce_tools(tokens: frozenset[str]) -> list[str]:
         """Determine which Salesforce tools to use"""
         tools = []
 
-        if any(w in message for w in ["lead", "leads"]):
-            if any(w in message for w in ["create", "add", "new"]):
+        if not tokens.isdisjoint(_LEAD_WORDS):
+            if not tokens.isdisjoint(_CREATE_WORDS):
                 tools.append("create_lead")
-            elif any(w in message for w in ["update", "change", "status"]):
+            elif not tokens.isdisjoint(_LEAD_UPDATE_WORDS):
                 tools.append("update_lead_status")
             else:
                 tools.append("get_leads")
 
-        if any(w in message for w in ["opportunity", "opportunities", "deal", "pipeline"]):
-            if any(w in message for w in ["create", "add", "new"]):
+        if not tokens.isdisjoint(_OPPORTUNITY_WORDS):
+            if not tokens.isdisjoint(_CREATE_WORDS):
                 tools.append("create_opportunity")
-            elif any(w in message for w in ["update", "stage"]):
+            elif not tokens.isdisjoint(_STAGE_UPDATE_WORDS):
                 tools.append("update_opportunity_stage")
-            elif any(w in message for w in ["summary", "overview"]):
+            elif not tokens.isdisjoint(_OVERVIEW_WORDS):
                 tools.append("get_pipeline_summary")
             else:
                 tools.append("get_opportunities")
 
-        if any(w in message for w in ["account", "accounts", "company", "companies"]):
-            if any(w in message for w in ["detail", "info", "about"]):
+        if not tokens.isdisjoint(_ACCOUNT_WORDS):
+            if not tokens.isdisjoint(_DETAIL_WORDS):
                 tools.append("get_account_details")
             else:
                 tools.append("get_accounts")
 
-        if any(w in message for w in ["contact", "contacts"]):
-            if any(w in message for w in ["create", "add", "new"]):
+        if not tokens.isdisjoint(_CONTACT_WORDS):
+            if not tokens.isdisjoint(_CREATE_WORDS):
                 tools.append("create_contact")
             else:
                 tools.append("get_contacts")
 
-        if any(w in message for w in ["activity", "activities", "recent"]):
+        if not tokens.isdisjoint(_ACTIVITY_WORDS):
             tools.append("get_recent_activities")
 
         return tools or ["get_leads", "get_opportunities"]
 
-    def _get_inventory_tools(self, message: str) -> list[str]:
+    @staticmethod
+    def _get_inventory_tools(tokens: frozenset[str]) -> list[str]:
         """Determine which Inventory tools to use"""
         tools = []
 
-        if any(w in message for w in ["check", "level", "status", "how many", "quantity"]):
+        if not tokens.isdisjoint(_STOCK_CHECK_WORDS):
             tools.append("check_stock")
 
-        if any(w in message for w in ["update", "add", "increase", "decrease", "adjust"]):
+        if not tokens.isdisjoint(_STOCK_UPDATE_WORDS):
             tools.append("update_stock")
 
-        if any(w in message for w in ["alert", "alerts", "warning"]):
-            if any(w in message for w in ["create", "set", "new"]):
+        if not tokens.isdisjoint(_ALERT_WORDS):
+            if not tokens.isdisjoint(_ALERT_CREATE_WORDS):
                 tools.append("create_alert")
-            elif any(w in message for w in ["dismiss", "clear", "remove"]):
+            elif not tokens.isdisjoint(_ALERT_DISMISS_WORDS):
                 tools.append("dismiss_alert")
             else:
                 tools.append("get_alerts")
 
-        if any(w in message for w in ["detail", "info", "about"]) and any(
-            w in message for w in ["product", "item"]
-        ):
+        if not tokens.isdisjoint(_DETAIL_WORDS) and not tokens.isdisjoint(_PRODUCT_WORDS):
             tools.append("get_product_details")
 
-        if any(w in message for w in ["search", "find", "look"]):
+        if not tokens.isdisjoint(_SEARCH_WORDS):
             tools.append("search_products")
 
-        if any(w in message for w in ["summary", "overview", "total", "report"]):
-            if any(w in message for w in ["low", "reorder"]):
+        if not tokens.isdisjoint(_REPORT_WORDS):
+            if not tokens.isdisjoint(_LOW_STOCK_WORDS):
                 tools.append("get_low_stock_report")
-            elif any(w in message for w in ["category", "breakdown"]):
+            elif not tokens.isdisjoint(_BREAKDOWN_WORDS):
                 tools.append("get_category_breakdown")
             else:
                 tools.append("get_stock_summary")
 
         return tools or ["check_stock"]
 
+    @staticmethod
+    async def _guard_tool_call(name: str, coro) -> ToolCall:
+        """Await a tool coroutine, turning an escaped exception into a failed ToolCall"""
+        try:
+            return await coro
+        except Exception as e:
+            logger.error("Tool execution failed", tool=name, error=str(e))
+            return ToolCall(name=name, status=ToolCallStatus.ERROR, error=str(e))
+
+    async def _run_tool_calls(
+        self,
+        calls: list[tuple[str, Any]],
+        tool_calls: list[ToolCall],
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Run independent tool coroutines concurrently.
+
+        Yields a tool_call event as each one finishes; once exhausted,
+        tool_calls holds the results in the original call order.
+        """
+        tasks = [
+            asyncio.ensure_future(self._guard_tool_call(name, coro))
+            for name, coro in calls
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield {"type": "tool_call", "tool_call": await next_done}
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        tool_calls.extend(task.result() for task in tasks)
+
     async def execute_salesforce_tools(
         self,
         tools: list[str],
         message: str,
-    ) -> tuple[list[ToolCall], str]:
-        """Execute Salesforce tools and generate response"""
-        if not self.salesforce_token:
-            return [], "I don't have access to Salesforce. Please connect your Salesforce account first."
-
-        sf_tools = SalesforceTools(
-            access_token=self.salesforce_token,
-            instance_url=settings.salesforce_instance_url,
-        )
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Execute Salesforce tools and generate response.
 
-        tool_calls = []
-        results = []
-
-        for tool_name in tools:
-            if tool_name == "get_leads":
-                tool_call = await sf_tools.get_leads(limit=10)
-            elif tool_name == "get_opportunities":
-                tool_call = await sf_tools.get_opportunities(limit=10)
-            elif tool_name == "get_accounts":
-                tool_call = await sf_tools.get_accounts(limit=10)
-            elif tool_name == "get_contacts":
-                tool_call = await sf_tools.get_contacts(limit=10)
-            elif tool_name == "get_pipeline_summary":
-                tool_call = await sf_tools.get_pipeline_summary()
-            elif tool_name == "get_recent_activities":
-                tool_call = await sf_tools.get_recent_activities()
-            else:
-                continue
+        Yields {"type": "tool_call", "tool_call": ToolCall} as each tool
+        completes, then {"type": "message", "content": str}.
+        """
+        sf_tools = self.salesforce_tools
+        if sf_tools is None:
+            yield {
+                "type": "message",
+                "content": "I don't have access to Salesforce. Please connect your Salesforce account first.",
+            }
+            return
+
+        calls = [
+            (f"salesforce.{tool_name}", _SALESFORCE_TOOL_CALLS[tool_name](sf_tools, message))
+            for tool_name in tools
+            if tool_name in _SALESFORCE_TOOL_CALLS
+        ]
 
-            tool_calls.append(tool_call)
+        tool_calls = []
+        async for event in self._run_tool_calls(calls, tool_calls):
+            yield event
 
-            if tool_call.status == ToolCallStatus.COMPLETED and tool_call.result:
-                results.append(tool_call.result)
+        results = [
+            tc.result for tc in tool_calls
+            if tc.status == ToolCallStatus.COMPLETED and tc.result
+        ]
 
         # Generate response from results
-        response = self._format_salesforce_response(tools, results)
-
-        return tool_calls, response
+        yield {"type": "message", "content": self._format_salesforce_response(tools, results)}
 
     async def execute_inventory_tools(
         self,
         tools: list[str],
         message: str,
-    ) -> tuple[list[ToolCall], str]:
-        """Execute Inventory tools and generate response"""
-        inv_tools = InventoryTools(user_scopes=self.inventory_scopes)
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Execute Inventory tools and generate response.
 
-        tool_calls = []
-        results = []
-
-        for tool_name in tools:
-            if tool_name == "check_stock":
-                # Try to extract SKU or category from message
-                tool_call = await inv_tools.check_stock()
-            elif tool_name == "get_stock_summary":
-                tool_call = await inv_tools.get_stock_summary()
-            elif tool_name == "get_low_stock_report":
-                tool_call = await inv_tools.get_low_stock_report()
-            elif tool_name == "get_category_breakdown":
-                tool_call = await inv_tools.get_category_breakdown()
-            elif tool_name == "get_alerts":
-                tool_call = await inv_tools.get_alerts()
-            elif tool_name == "search_products":
-                # Extract search query
-                query = message.split("search")[-1].strip() if "search" in message else message
-                tool_call = await inv_tools.search_products(query=query[:50])
-            elif tool_name == "update_stock":
-                # For demo, we'll need more structured input
-                tool_call = await inv_tools.get_stock_summary()
-            else:
-                continue
+        Yields {"type": "tool_call", "tool_call": ToolCall} as each tool
+        completes, then {"type": "message", "content": str}.
+        """
+        inv_tools = inventory_tools.with_scopes(self.inventory_scopes)
 
-            tool_calls.append(tool_call)
+        calls = [
+            (f"inventory.{tool_name}", _INVENTORY_TOOL_CALLS[tool_name](inv_tools, message))
+            for tool_name in tools
+            if tool_name in _INVENTORY_TOOL_CALLS
+        ]
 
-            if tool_call.status == ToolCallStatus.COMPLETED and tool_call.result:
-                results.append(tool_call.result)
+        tool_calls = []
+        async for event in self._run_tool_calls(calls, tool_calls):
+            yield event
 
-        # Generate response from results
-        response = self._format_inventory_response(tools, results)
+        results = [
+            tc.result for tc in tool_calls
+            if tc.status == ToolCallStatus.COMPLETED and tc.result
+        ]
 
-        return tool_calls, response
+        # Generate response from results
+        yield {"type": "message", "content": self._format_inventory_response(tools, results)}
 
     def _format_salesforce_response(
         self,
@@ -255,57 +382,10 @@ class AgentOrchestrator:
 
         parts = []
 
-        for i, result in enumerate(results):
-            tool = tools[i] if i < len(tools) else "unknown"
-
-            if "leads" in result:
-                leads = result["leads"]
-                if leads:
-                    parts.append(f"**Found {len(leads)} leads:**\n")
-                    for lead in leads[:5]:
-                        parts.append(f"- {lead['name']} ({lead['company']}) - {lead['status']}")
-                else:
-                    parts.append("No leads found matching your criteria.")
-
-            elif "opportunities" in result:
-                opps = result["opportunities"]
-                if opps:
-                    parts.append(f"**Found {len(opps)} opportunities:**\n")
-                    for opp in opps[:5]:
-                        amount = f"${opp['amount']:,.0f}" if opp.get("amount") else "TBD"
-                        parts.append(f"- {opp['name']} - {amount} ({opp['stage']})")
-                    if result.get("total_pipeline_value"):
-                        parts.append(f"\n**Total pipeline value:** ${result['total_pipeline_value']:,.0f}")
-                else:
-                    parts.append("No opportunities found matching your criteria.")
-
-            elif "accounts" in result:
-                accounts = result["accounts"]
-                if accounts:
-                    parts.append(f"**Found {len(accounts)} accounts:**\n")
-                    for acc in accounts[:5]:
-                        industry = acc.get("industry") or "N/A"
-                        parts.append(f"- {acc['name']} ({industry})")
-                else:
-                    parts.append("No accounts found.")
-
-            elif "contacts" in result:
-                contacts = result["contacts"]
-                if contacts:
-                    parts.append(f"**Found {len(contacts)} contacts:**\n")
-                    for contact in contacts[:5]:
-                        email = contact.get("email") or "no email"
-                        parts.append(f"- {contact['name']} - {email}")
-                else:
-                    parts.append("No contacts found.")
-
-            elif "stages" in result:
-                parts.append("**Pipeline Summary:**\n")
-                for stage in result["stages"]:
-                    parts.append(
-                        f"- {stage['stage']}: {stage['count']} opportunities (${stage['total_amount']:,.0f})"
-                    )
-                parts.append(f"\n**Total:** ${result.get('total_pipeline_value', 0):,.0f}")
+        for result in results:
+            formatter = _pick_formatter(_SALESFORCE_FORMATTERS, result)
+            if formatter:
+                formatter(result, parts)
 
         return "\n".join(parts) if parts else "Salesforce query completed."
 
@@ -320,162 +400,282 @@ class AgentOrchestrator:
 
         parts = []
 
-        for i, result in enumerate(results):
+        for result in results:
             if "error" in result:
                 parts.append(f"Error: {result['error']}")
                 continue
 
-            if "products" in result:
-                products = result["products"]
-                if products:
-                    parts.append(f"**Found {len(products)} products:**\n")
-                    parts.append("| SKU | Name | Qty | Status |")
-                    parts.append("|-----|------|-----|--------|")
-                    for prod in products[:10]:
-                        status_emoji = "🟢" if prod["status"] == "in_stock" else "🟡" if prod["status"] == "low_stock" else "🔴"
-                        parts.append(
-                            f"| {prod['sku']} | {prod['name']} | {prod['quantity']} | {status_emoji} {prod['status']} |"
-                        )
-                else:
-                    parts.append("No products found matching your criteria.")
-
-            elif "total_products" in result:
-                # Stock summary
-                parts.append("**Inventory Summary:**\n")
-                parts.append(f"- **Total Products:** {result['total_products']}")
-                parts.append(f"- **Total Units:** {result['total_units']}")
-                parts.append(f"- **Total Value:** ${result['total_inventory_value']:,.2f}")
-                parts.append(f"- **In Stock:** {result.get('in_stock_count', 0)}")
-                parts.append(f"- **Low Stock:** {result['low_stock_count']} ⚠️")
-                parts.append(f"- **Out of Stock:** {result['out_of_stock_count']} 🔴")
-
-                if result.get("active_alerts", 0) > 0:
-                    parts.append(f"\n**Active Alerts:** {result['active_alerts']}")
-
-            elif "items" in result:
-                # Low stock report
-                items = result["items"]
-                if items:
-                    parts.append(f"**⚠️ {len(items)} items need attention:**\n")
-                    for item in items[:10]:
-                        parts.append(
-                            f"- **{item['name']}** (SKU: {item['sku']}): "
-                            f"{item['current_quantity']}/{item['reorder_point']} - "
-                            f"Need to order {item['shortage']} units"
-                        )
-                else:
-                    parts.append("All products are well stocked! 🎉")
-
-            elif "alerts" in result:
-                alerts = result["alerts"]
-                if alerts:
-                    parts.append(f"**{len(alerts)} Active Alerts:**\n")
-                    for alert in alerts:
-                        emoji = "🔴" if alert["alert_type"] == "out_of_stock" else "🟡"
-                        parts.append(
-                            f"- {emoji} **{alert['product_name']}**: {alert['alert_type']} "
-                            f"(Current: {alert['current_quantity']}, Threshold: {alert['threshold']})"
-                        )
-                else:
-                    parts.append("No active inventory alerts.")
-
-            elif "categories" in result:
-                parts.append("**Inventory by Category:**\n")
-                for cat, data in result["categories"].items():
-                    parts.append(
-                        f"- **{cat.title()}**: {data['product_count']} products, "
-                        f"{data['total_units']} units, ${data['total_value']:,.2f} value"
-                    )
+            formatter = _pick_formatter(_INVENTORY_FORMATTERS, result)
+            if formatter:
+                formatter(result, parts)
 
         return "\n".join(parts) if parts else "Inventory query completed."
 
 
-@router.post("", response_model=ChatResponse)
-async def chat(
-    request: ChatRequest,
-    user: UserInfo = Depends(get_current_user),
-    id_token: str = Depends(get_id_token),
-):
-    """
-    Main chat endpoint.
+# === Tool result formatters ===
+# Each appends the markdown lines for one tool result to parts.
 
-    Analyzes the message, routes to appropriate agent(s),
-    executes tools, and returns response.
-    """
-    logger.info(
-        "Chat request received",
-        user_sub=user.sub,
-        message_length=len(request.message),
+
+def _format_leads(result: dict, parts: list[str]) -> None:
+    leads = result["leads"]
+    if leads:
+        parts.append(f"**Found {len(leads)} leads:**\n")
+        for lead in leads[:5]:
+            name, company, status = _lead_row(lead)
+            parts.append(f"- {name} ({company}) - {status}")
+    else:
+        parts.append("No leads found matching your criteria.")
+
+
+def _format_opportunities(result: dict, parts: list[str]) -> None:
+    opps = result["opportunities"]
+    if opps:
+        parts.append(f"**Found {len(opps)} opportunities:**\n")
+        for opp in opps[:5]:
+            amount = f"${opp['amount']:,.0f}" if opp.get("amount") else "TBD"
+            parts.append(f"- {opp['name']} - {amount} ({opp['stage']})")
+        if result.get("total_pipeline_value"):
+            parts.append(f"\n**Total pipeline value:** ${result['total_pipeline_value']:,.0f}")
+    else:
+        parts.append("No opportunities found matching your criteria.")
+
+
+def _format_accounts(result: dict, parts: list[str]) -> None:
+    accounts = result["accounts"]
+    if accounts:
+        parts.append(f"**Found {len(accounts)} accounts:**\n")
+        for acc in accounts[:5]:
+            industry = acc.get("industry") or "N/A"
+            parts.append(f"- {acc['name']} ({industry})")
+    else:
+        parts.append("No accounts found.")
+
+
+def _format_contacts(result: dict, parts: list[str]) -> None:
+    contacts = result["contacts"]
+    if contacts:
+        parts.append(f"**Found {len(contacts)} contacts:**\n")
+        for contact in contacts[:5]:
+            email = contact.get("email") or "no email"
+            parts.append(f"- {contact['name']} - {email}")
+    else:
+        parts.append("No contacts found.")
+
+
+def _format_pipeline(result: dict, parts: list[str]) -> None:
+    parts.append("**Pipeline Summary:**\n")
+    for stage in result["stages"]:
+        parts.append(
+            f"- {stage['stage']}: {stage['count']} opportunities (${stage['total_amount']:,.0f})"
+        )
+    parts.append(f"\n**Total:** ${result.get('total_pipeline_value', 0):,.0f}")
+
+
+def _format_products(result: dict, parts: list[str]) -> None:
+    products = result["products"]
+    if products:
+        parts.append(f"**Found {len(products)} products:**\n")
+        parts.extend(_PRODUCT_TABLE_HEADER)
+        for prod in products[:10]:
+            sku, name, quantity, status = _product_row(prod)
+            parts.append(
+                f"| {sku} | {name} | {quantity} | {_STATUS_EMOJI.get(status, '🔴')} {status} |"
+            )
+    else:
+        parts.append("No products found matching your criteria.")
+
+
+def _format_stock_summary(result: dict, parts: list[str]) -> None:
+    parts.append("**Inventory Summary:**\n")
+    parts.append(f"- **Total Products:** {result['total_products']}")
+    parts.append(f"- **Total Units:** {result['total_units']}")
+    parts.append(f"- **Total Value:** ${result['total_inventory_value']:,.2f}")
+    parts.append(f"- **In Stock:** {result.get('in_stock_count', 0)}")
+    parts.append(f"- **Low Stock:** {result['low_stock_count']} ⚠️")
+    parts.append(f"- **Out of Stock:** {result['out_of_stock_count']} 🔴")
+
+    if result.get("active_alerts", 0) > 0:
+        parts.append(f"\n**Active Alerts:** {result['active_alerts']}")
+
+
+def _format_low_stock_report(result: dict, parts: list[str]) -> None:
+    items = result["items"]
+    if items:
+        parts.append(f"**⚠️ {len(items)} items need attention:**\n")
+        for item in items[:10]:
+            name, sku, quantity, reorder_point, shortage = _low_stock_row(item)
+            parts.append(
+                f"- **{name}** (SKU: {sku}): {quantity}/{reorder_point} - "
+                f"Need to order {shortage} units"
+            )
+    else:
+        parts.append("All products are well stocked! 🎉")
+
+
+def _format_alerts(result: dict, parts: list[str]) -> None:
+    alerts = result["alerts"]
+    if alerts:
+        parts.append(f"**{len(alerts)} Active Alerts:**\n")
+        for alert in alerts:
+            alert_type = alert["alert_type"]
+            parts.append(
+                f"- {_ALERT_EMOJI.get(alert_type, '🟡')} **{alert['product_name']}**: {alert_type} "
+                f"(Current: {alert['current_quantity']}, Threshold: {alert['threshold']})"
+            )
+    else:
+        parts.append("No active inventory alerts.")
+
+
+def _format_categories(result: dict, parts: list[str]) -> None:
+    parts.append("**Inventory by Category:**\n")
+    for cat, data in result["categories"].items():
+        parts.append(
+            f"- **{cat.title()}**: {data['product_count']} products, "
+            f"{data['total_units']} units, ${data['total_value']:,.2f} value"
+        )
+
+
+# Result key -> formatter, in priority order for results carrying several keys
+_SALESFORCE_FORMATTERS = {
+    "leads": _format_leads,
+    "opportunities": _format_opportunities,
+    "accounts": _format_accounts,
+    "contacts": _format_contacts,
+    "stages": _format_pipeline,
+}
+
+_INVENTORY_FORMATTERS = {
+    "products": _format_products,
+    "total_products": _format_stock_summary,
+    "items": _format_low_stock_report,
+    "alerts": _format_alerts,
+    "categories": _format_categories,
+}
+
+
+def _pick_formatter(formatters: dict, result: dict):
+    """Return the highest-priority formatter whose key appears in result"""
+    matched = formatters.keys() & result.keys()
+    if not matched:
+        return None
+    if len(matched) == 1:
+        return formatters[matched.pop()]
+    return next(f for key, f in formatters.items() if key in matched)
+
+
+_HELP_TEXT = """I can help you with:
+
+**Salesforce** (Sales & Customers)
+- View and manage leads
+- Track opportunities and pipeline
+- Search customer accounts
+- View contact information
+
+**Inventory**
+- Check stock levels
+- Update inventory quantities
+- Set low-stock alerts
+- View product catalog
+
+What would you like to know?"""
+
+
+_SSE_DONE = b"data: [DONE]\n\n"
+
+
+def _sse_event(payload: dict) -> bytes:
+    """Encode a payload as a Server-Sent Events data frame"""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+def _sse_model_event(event_type: str, key: str, model: BaseModel) -> bytes:
+    """Encode {"type": event_type, key: model} as an SSE frame via pydantic's JSON serializer"""
+    return b'data: {"type":"%s","%s":%s}\n\n' % (
+        event_type.encode(),
+        key.encode(),
+        model.model_dump_json().encode(),
     )
 
-    start_time = time.time()
-    conversation_id = request.conversation_id or str(uuid.uuid4())
 
-    # Get user's service connections
-    salesforce_token = None
-    inventory_scopes = ["inventory:read", "inventory:write", "inventory:alert"]
+STREAM_WORDS_PER_CHUNK = 5
 
-    # Try to get Salesforce token from Token Vault
-    try:
-        auth0_user_id = await token_vault.get_user_id_from_okta_sub(user.sub)
-        if auth0_user_id:
-            sf_result = await token_vault.get_salesforce_token(auth0_user_id)
-            if sf_result.get("success"):
-                salesforce_token = sf_result.get("access_token")
-    except Exception as e:
-        logger.warning("Failed to get Salesforce token", error=str(e))
+
+def _iter_word_chunks(message: str, words_per_chunk: int = STREAM_WORDS_PER_CHUNK):
+    """Yield slices of message covering words_per_chunk space-separated words each."""
+    n = len(message)
+    pos = 0
+    chunk_start = 0
+    count = 0
+    while pos < n:
+        nxt = message.find(" ", pos)
+        end = n if nxt < 0 else nxt + 1
+        count += 1
+        if count % words_per_chunk == 0 or end == n:
+            yield message[chunk_start:end]
+            chunk_start = end
+        pos = end
+
+
+async def _run_chat(
+    request: ChatRequest,
+    user: UserInfo,
+    id_token: str,
+) -> AsyncGenerator[dict[str, Any], None]:
+    """
+    Run a rule-based chat turn.
+
+    Analyzes the message, routes to appropriate agent(s) and executes
+    tools, yielding {"type": "tool_call", ...} as each tool completes and
+    finally {"type": "complete", "response": ChatResponse}.
+    """
+    start_ns = time.perf_counter_ns()
+    conversation_id = request.conversation_id or uuid.uuid4().hex
 
     # Create orchestrator
     orchestrator = AgentOrchestrator(
         user=user,
         id_token=id_token,
-        salesforce_token=salesforce_token,
-        inventory_scopes=inventory_scopes,
+        inventory_scopes=_INVENTORY_SCOPES,
     )
 
     # Analyze intent and determine agent
     agent_type, tools = orchestrator.analyze_intent(request.message)
 
+    # Only Salesforce turns need a Token Vault lookup
+    if agent_type == AgentType.SALESFORCE:
+        orchestrator.salesforce_tools = await _resolve_salesforce_tools(user)
+
     # Execute appropriate tools
     tool_calls = []
     response_text = ""
+    events = None
 
     if agent_type == AgentType.SALESFORCE:
-        tool_calls, response_text = await orchestrator.execute_salesforce_tools(
-            tools, request.message
-        )
+        events = orchestrator.execute_salesforce_tools(tools, request.message)
         agent_name = "Salesforce Agent"
-        scopes = ["sales:read", "customer:read"] if salesforce_token else []
+        scopes = ["sales:read", "customer:read"] if orchestrator.salesforce_tools else []
 
     elif agent_type == AgentType.INVENTORY:
-        tool_calls, response_text = await orchestrator.execute_inventory_tools(
-            tools, request.message
-        )
+        events = orchestrator.execute_inventory_tools(tools, request.message)
         agent_name = "Inventory Agent"
-        scopes = inventory_scopes
+        scopes = _INVENTORY_SCOPES
 
     else:
         # Default orchestrator response
         agent_name = "ProGear Assistant"
         agent_type = AgentType.ORCHESTRATOR
         scopes = []
-        response_text = """I can help you with:
-
-**Salesforce** (Sales & Customers)
-- View and manage leads
-- Track opportunities and pipeline
-- Search customer accounts
-- View contact information
-
-**Inventory**
-- Check stock levels
-- Update inventory quantities
-- Set low-stock alerts
-- View product catalog
+        response_text = _HELP_TEXT
 
-What would you like to know?"""
+    if events is not None:
+        async for event in events:
+            if event["type"] == "tool_call":
+                tool_calls.append(event["tool_call"])
+                yield event
+            else:
+                response_text = event["content"]
 
-    duration = int((time.time() - start_time) * 1000)
+    duration = (time.perf_counter_ns() - start_ns) // 1_000_000
     logger.info(
         "Chat response generated",
         agent=agent_type.value,
@@ -483,18 +683,46 @@ What would you like to know?"""
         duration_ms=duration,
     )
 
-    return ChatResponse(
-        id=str(uuid.uuid4()),
-        message=response_text,
-        agent=AgentInfo(
-            name=agent_name,
-            type=agent_type,
-            scopes=scopes,
+    yield {
+        "type": "complete",
+        "response": ChatResponse(
+            id=uuid.uuid4().hex,
+            message=response_text,
+            agent=AgentInfo(
+                name=agent_name,
+                type=agent_type,
+                scopes=scopes,
+            ),
+            tool_calls=tool_calls,
+            conversation_id=conversation_id,
         ),
-        tool_calls=tool_calls,
-        conversation_id=conversation_id,
+    }
+
+
+@router.post("", response_model=ChatResponse)
+async def chat(
+    request: ChatRequest,
+    user: UserInfo = Depends(get_current_user),
+    id_token: str = Depends(get_id_token),
+):
+    """
+    Main chat endpoint.
+
+    Analyzes the message, routes to appropriate agent(s),
+    executes tools, and returns response.
+    """
+    logger.info(
+        "Chat request received",
+        user_sub=user.sub,
+        message_length=len(request.message),
     )
 
+    response = None
+    async for event in _run_chat(request, user, id_token):
+        if event["type"] == "complete":
+            response = event["response"]
+    return response
+
 
 @router.post("/stream")
 async def chat_stream(
@@ -504,29 +732,31 @@ async def chat_stream(
 ):
     """
     Streaming chat endpoint for real-time responses.
-    Returns Server-Sent Events.
+    Returns Server-Sent Events; tool calls are sent as each one completes.
     """
+    logger.info(
+        "Chat stream request received",
+        user_sub=user.sub,
+        message_length=len(request.message),
+    )
 
-    async def generate() -> AsyncGenerator[str, None]:
-        # For now, just call the regular chat endpoint and stream the result
-        response = await chat(request, user, id_token)
-
-        # Stream tool calls
-        for tool_call in response.tool_calls:
-            yield f"data: {json.dumps({'type': 'tool_call', 'tool_call': tool_call.model_dump()})}\n\n"
+    async def generate() -> AsyncGenerator[bytes, None]:
+        # Tool calls are dumped once and reused in the complete frame
+        tool_calls = []
 
-        # Stream the response in chunks (simulated)
-        words = response.message.split(" ")
-        chunk = ""
-        for i, word in enumerate(words):
-            chunk += word + " "
-            if i % 5 == 4 or i == len(words) - 1:
-                yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
-                chunk = ""
+        async for event in _run_chat(request, user, id_token):
+            if event["type"] == "tool_call":
+                tool_calls.append(event["tool_call"].model_dump(mode="json"))
+                yield _sse_event({"type": "tool_call", "tool_call": tool_calls[-1]})
+            elif event["type"] == "complete":
+                response = event["response"]
+                for chunk in _iter_word_chunks(response.message):
+                    yield _sse_event({"type": "chunk", "content": chunk})
+                body = response.model_dump(mode="json", exclude={"tool_calls"})
+                body["tool_calls"] = tool_calls
+                yield _sse_event({"type": "complete", "response": body})
 
-        # Send complete signal
-        yield f"data: {json.dumps({'type': 'complete', 'response': response.model_dump()})}\n\n"
-        yield "data: [DONE]\n\n"
+        yield _SSE_DONE
 
     return StreamingResponse(
         generate(),
@@ -538,6 +768,82 @@ async def chat_stream(
     )
 
 
+async def _resolve_salesforce_tools(user: UserInfo) -> Optional[SalesforceTools]:
+    """
+    Get the pooled Salesforce tools for the user's current Token Vault token.
+
+    Returns None when Salesforce isn't connected. Token Vault caches both
+    lookups, so resolving on every turn is cheap and still picks up a
+    refreshed token or a disconnect.
+    """
+    try:
+        auth0_user_id = await token_vault.get_user_id_from_okta_sub(user.sub)
+        if auth0_user_id:
+            sf_result = await token_vault.get_salesforce_token(auth0_user_id)
+            if sf_result.get("success"):
+                return get_salesforce_tools(
+                    user_id=auth0_user_id,
+                    access_token=sf_result.get("access_token"),
+                    instance_url=settings.salesforce_instance_url,
+                )
+    except Exception as e:
+        logger.warning("Failed to get Salesforce token", error=str(e))
+    return None
+
+
+async def _get_or_create_ai_orchestrator(user: UserInfo, conversation_id: str) -> AIOrchestrator:
+    """
+    Reuse the AI orchestrator for an ongoing conversation.
+
+    Orchestrators are cached per (user, conversation) so conversation
+    history carries over between turns. Salesforce tools are resolved
+    again on every turn, so the conversation follows token refreshes and
+    disconnects.
+    """
+    salesforce_tools = await _resolve_salesforce_tools(user)
+
+    key = (user.sub, conversation_id)
+    orchestrator = _AI_ORCHESTRATORS.get(key)
+    if orchestrator is not None:
+        _AI_ORCHESTRATORS.move_to_end(key)
+    else:
+        orchestrator = AIOrchestrator(user=user, user_scopes=_INVENTORY_SCOPES)
+        # Another request for the same conversation may have won the race
+        orchestrator = _AI_ORCHESTRATORS.setdefault(key, orchestrator)
+        if len(_AI_ORCHESTRATORS) > AI_ORCHESTRATOR_CACHE_SIZE:
+            _AI_ORCHESTRATORS.popitem(last=False)
+
+    orchestrator.salesforce_tools = salesforce_tools
+    return orchestrator
+
+
+# Display names for the agent that produced an AI response
+_AI_AGENT_NAMES: dict[AgentType, str] = {
+    AgentType.SALES: "Sales Agent",
+    AgentType.CUSTOMER: "Customer Agent",
+    AgentType.INVENTORY: "Inventory Agent",
+    AgentType.SALESFORCE: "Salesforce Agent",
+    AgentType.ORCHESTRATOR: "ProGear AI",
+    AgentType.GENERAL: "ProGear Assistant",
+}
+
+
+def _build_ai_response(ai_message: ChatMessage, conversation_id: str) -> ChatResponse:
+    """Convert an orchestrator ChatMessage into the API response shape"""
+    return ChatResponse(
+        id=uuid.uuid4().hex,
+        message=ai_message.content,
+        agent=AgentInfo(
+            name=_AI_AGENT_NAMES.get(ai_message.agent, "ProGear AI"),
+            type=ai_message.agent or AgentType.GENERAL,
+            scopes=_AI_INVENTORY_SCOPES if ai_message.agent == AgentType.INVENTORY else (),
+        ),
+        # The same ToolCall objects the orchestrator ran and streamed
+        tool_calls=list(ai_message.tool_calls or []),
+        conversation_id=conversation_id,
+    )
+
+
 @router.post("/ai", response_model=ChatResponse)
 async def chat_with_ai(
     request: ChatRequest,
@@ -558,29 +864,10 @@ async def chat_with_ai(
         message_length=len(request.message),
     )
 
-    start_time = time.time()
-    conversation_id = request.conversation_id or str(uuid.uuid4())
-
-    # Try to get Salesforce token from Token Vault
-    salesforce_tools = None
-    try:
-        auth0_user_id = await token_vault.get_user_id_from_okta_sub(user.sub)
-        if auth0_user_id:
-            sf_result = await token_vault.get_salesforce_token(auth0_user_id)
-            if sf_result.get("success"):
-                salesforce_tools = SalesforceTools(
-                    access_token=sf_result.get("access_token"),
-                    instance_url=settings.salesforce_instance_url,
-                )
-    except Exception as e:
-        logger.warning("Failed to get Salesforce token", error=str(e))
+    start_ns = time.perf_counter_ns()
+    conversation_id = request.conversation_id or uuid.uuid4().hex
 
-    # Create AI orchestrator
-    ai_orchestrator = AIOrchestrator(
-        user=user,
-        salesforce_tools=salesforce_tools,
-        user_scopes=["inventory:read", "inventory:write", "inventory:alert"],
-    )
+    ai_orchestrator = await _get_or_create_ai_orchestrator(user, conversation_id)
 
     # Process message with AI
     ai_message = await ai_orchestrator.process_message(
@@ -588,7 +875,7 @@ async def chat_with_ai(
         conversation_id=conversation_id,
     )
 
-    duration = int((time.time() - start_time) * 1000)
+    duration = (time.perf_counter_ns() - start_ns) // 1_000_000
     logger.info(
         "AI chat response generated",
         agent=ai_message.agent.value if ai_message.agent else "general",
@@ -596,32 +883,114 @@ async def chat_with_ai(
         duration_ms=duration,
     )
 
-    # Map agent type to agent name
-    agent_names = {
-        AgentType.SALES: "Sales Agent",
-        AgentType.CUSTOMER: "Customer Agent",
-        AgentType.INVENTORY: "Inventory Agent",
-        AgentType.SALESFORCE: "Salesforce Agent",
-        AgentType.ORCHESTRATOR: "ProGear AI",
-        AgentType.GENERAL: "ProGear Assistant",
-    }
+    return _build_ai_response(ai_message, conversation_id)
 
-    return ChatResponse(
-        id=str(uuid.uuid4()),
-        message=ai_message.content,
-        agent=AgentInfo(
-            name=agent_names.get(ai_message.agent, "ProGear AI"),
-            type=ai_message.agent or AgentType.GENERAL,
-            scopes=["inventory:read", "inventory:write"] if ai_message.agent == AgentType.INVENTORY else [],
-        ),
-        tool_calls=[
-            ToolCall(
-                tool_name=tc.tool_name,
-                arguments=tc.arguments,
-                result=tc.result,
-                status=ToolCallStatus.COMPLETED if tc.result else ToolCallStatus.FAILED,
-            )
-            for tc in (ai_message.tool_calls or [])
-        ],
-        conversation_id=conversation_id,
+
+async def _batch_chunks(
+    events: AsyncGenerator[dict[str, Any], None],
+    batch_size: int,
+    flush_interval: float,
+) -> AsyncGenerator[dict[str, Any], None]:
+    """
+    Coalesce consecutive chunk events into batches of up to batch_size tokens.
+
+    A partial batch is flushed once it has been held for flush_interval
+    seconds, or as soon as a non-chunk event arrives, so batching never
+    reorders events or delays them by more than the interval.
+    """
+    loop = asyncio.get_running_loop()
+    buffer: list[str] = []
+    deadline = 0.0
+    pending: Optional[asyncio.Future] = None
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(events.__anext__())
+
+            if buffer:
+                done, _ = await asyncio.wait({pending}, timeout=max(0.0, deadline - loop.time()))
+                if not done:
+                    yield {"type": "chunk", "content": "".join(buffer)}
+                    buffer.clear()
+                    continue
+
+            try:
+                event = await pending
+            except StopAsyncIteration:
+                break
+            finally:
+                pending = None
+
+            if event["type"] == "chunk":
+                if not buffer:
+                    deadline = loop.time() + flush_interval
+                buffer.append(event["content"])
+                if len(buffer) < batch_size:
+                    continue
+                event = None
+
+            if buffer:
+                yield {"type": "chunk", "content": "".join(buffer)}
+                buffer.clear()
+            if event is not None:
+                yield event
+
+        if buffer:
+            yield {"type": "chunk", "content": "".join(buffer)}
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+@router.post("/ai/stream")
+async def chat_with_ai_stream(
+    request: ChatRequest,
+    user: UserInfo = Depends(get_current_user),
+    id_token: str = Depends(get_id_token),
+):
+    """
+    Streaming AI chat endpoint using Azure AI Foundry.
+
+    Tokens are forwarded as Server-Sent Events as the model produces
+    them, batched into chunks of up to STREAM_BATCH_N tokens, using the
+    same event shapes as /stream plus a tool_start event when each tool
+    begins running.
+    """
+    logger.info(
+        "AI stream request received",
+        user_sub=user.sub,
+        message_length=len(request.message),
+    )
+
+    conversation_id = request.conversation_id or uuid.uuid4().hex
+    ai_orchestrator = await _get_or_create_ai_orchestrator(user, conversation_id)
+
+    async def generate() -> AsyncGenerator[bytes, None]:
+        events = ai_orchestrator.process_message_stream(
+            message=request.message,
+            conversation_id=conversation_id,
+        )
+        async for event in _batch_chunks(
+            events,
+            batch_size=settings.stream_batch_n,
+            flush_interval=settings.stream_flush_interval_ms / 1000,
+        ):
+            if event["type"] == "chunk":
+                yield _sse_event({"type": "chunk", "content": event["content"]})
+            elif event["type"] in ("tool_start", "tool_call"):
+                yield _sse_model_event(event["type"], "tool_call", event["tool_call"])
+            elif event["type"] == "complete":
+                response = _build_ai_response(event["message"], conversation_id)
+                yield _sse_model_event("complete", "response", response)
+
+        yield _SSE_DONE
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+        },
     )
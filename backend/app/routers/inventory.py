@@ -5,8 +5,12 @@ Direct inventory management endpoints for product and stock operations.
 These endpoints use Okta XAA for authorization (Custom Authorization Server).
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import Optional, List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import TypeAdapter
+from typing import Any, Optional, List, Dict, Tuple
+import hashlib
+import orjson
 import structlog
 
 from app.auth.okta_auth import get_current_user, get_id_token, okta_auth
@@ -15,24 +19,63 @@ from app.models.schemas import (
     Product,
     ProductCategory,
     StockStatus,
-    StockMovement,
     MovementType,
     InventoryAlert,
     AlertSeverity,
 )
-from app.tools.inventory_tools import inventory_tools
+from app.tools.inventory_tools import inventory_tools, catalog_version
 from app.core.config import settings
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = structlog.get_logger()
 
+# Handlers call the synchronous inventory_tools methods directly: they only
+# touch the in-memory catalog and never block, so offloading them to the
+# thread pool would cost more than the call and let stock writes interleave.
 
-@router.get("/products", response_model=List[Product])
+_product_list_adapter = TypeAdapter(List[Product])
+
+# SKU -> (catalog version, serialized Product, ETag); only existing SKUs are cached
+_product_json: Dict[str, Tuple[int, bytes, str]] = {}
+
+# (category, status, limit) -> (catalog version, serialized list, ETag) for
+# unsearched listings; the key space is bounded by the enums and 1 <= limit <= 100
+_product_list_json: Dict[tuple, Tuple[int, bytes, str]] = {}
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag for a serialized response body"""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+def _etag_response(request: Request, body: bytes, etag: Optional[str] = None) -> Response:
+    """
+    Return a JSON body with its ETag, or an empty 304 when the client's
+    If-None-Match already names it.
+    """
+    if etag is None:
+        etag = _etag(body)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def _json_etag_response(request: Request, content: Any) -> Response:
+    return _etag_response(request, orjson.dumps(content))
+
+
+@router.get("/products", responses={200: {"model": List[Product]}})
 async def list_products(
+    request: Request,
     category: Optional[ProductCategory] = None,
     status: Optional[StockStatus] = None,
     search: Optional[str] = None,
-    limit: int = Query(default=50, le=100),
+    limit: int = Query(default=50, ge=1, le=100),
     user: UserInfo = Depends(get_current_user),
 ):
     """
@@ -49,30 +92,36 @@ async def list_products(
     )
 
     try:
+        version = catalog_version()
+        key = (category, status, limit)
+        cached = None if search else _product_list_json.get(key)
+        if cached is not None and cached[0] == version:
+            return _etag_response(request, cached[1], cached[2])
+
         # In production, perform XAA token exchange here
         # For demo, use inventory tools directly
         products = inventory_tools.list_products(
-            category=category.value if category else None,
-            status=status.value if status else None,
+            category=category,
+            status=status,
+            search=search,
+            limit=limit,
         )
 
-        # Apply search filter
-        if search:
-            search_lower = search.lower()
-            products = [
-                p for p in products
-                if search_lower in p.name.lower() or search_lower in p.sku.lower()
-            ]
-
-        return products[:limit]
+        # Products are already validated models; serialize them directly
+        body = _product_list_adapter.dump_json(products)
+        etag = _etag(body)
+        if not search:
+            _product_list_json[key] = (version, body, etag)
+        return _etag_response(request, body, etag)
 
     except Exception as e:
         logger.error("Failed to list products", error=str(e))
         raise HTTPException(status_code=500, detail="Failed to retrieve products")
 
 
-@router.get("/products/{sku}", response_model=Product)
+@router.get("/products/{sku}", responses={200: {"model": Product}})
 async def get_product(
+    request: Request,
     sku: str,
     user: UserInfo = Depends(get_current_user),
 ):
@@ -83,11 +132,18 @@ async def get_product(
     """
     logger.info("Getting product", user_sub=user.sub, sku=sku)
 
-    product = inventory_tools.get_product(sku)
-    if not product:
-        raise HTTPException(status_code=404, detail=f"Product {sku} not found")
+    version = catalog_version()
+    cached = _product_json.get(sku)
+    if cached is None or cached[0] != version:
+        product = inventory_tools.get_product(sku)
+        if not product:
+            raise HTTPException(status_code=404, detail=f"Product {sku} not found")
+
+        body = product.model_dump_json().encode()
+        cached = (version, body, _etag(body))
+        _product_json[sku] = cached
 
-    return product
+    return _etag_response(request, cached[1], cached[2])
 
 
 @router.post("/products/{sku}/stock")
@@ -116,7 +172,7 @@ async def update_stock(
     )
 
     try:
-        result = inventory_tools.update_stock(
+        result = inventory_tools.update_stock_sync(
             sku=sku,
             quantity_change=quantity_change,
             reason=reason,
@@ -167,10 +223,11 @@ async def create_reorder(
         raise HTTPException(status_code=500, detail="Failed to create reorder")
 
 
-@router.get("/products/{sku}/movements", response_model=List[StockMovement])
+@router.get("/products/{sku}/movements")
 async def get_stock_movements(
+    request: Request,
     sku: str,
-    limit: int = Query(default=20, le=100),
+    limit: int = Query(default=20, ge=1, le=100),
     user: UserInfo = Depends(get_current_user),
 ):
     """
@@ -181,10 +238,10 @@ async def get_stock_movements(
     logger.info("Getting stock movements", user_sub=user.sub, sku=sku)
 
     movements = inventory_tools.get_stock_movements(sku)
-    return movements[:limit]
+    return _json_etag_response(request, movements[:limit])
 
 
-@router.get("/alerts", response_model=List[InventoryAlert])
+@router.get("/alerts", responses={200: {"model": List[InventoryAlert]}})
 async def get_inventory_alerts(
     severity: Optional[AlertSeverity] = None,
     acknowledged: Optional[bool] = None,
@@ -203,17 +260,11 @@ async def get_inventory_alerts(
     )
 
     try:
-        alerts = inventory_tools.get_alerts()
-
-        # Filter by severity
-        if severity:
-            alerts = [a for a in alerts if a.get("severity") == severity.value]
-
-        # Filter by acknowledged status
-        if acknowledged is not None:
-            alerts = [a for a in alerts if a.get("acknowledged") == acknowledged]
-
-        return alerts
+        # Alert dicts are built from validated InventoryAlert models
+        return ORJSONResponse(inventory_tools.list_alerts(
+            severity=severity,
+            acknowledged=acknowledged,
+        ))
 
     except Exception as e:
         logger.error("Failed to get alerts", error=str(e))
@@ -243,6 +294,7 @@ async def acknowledge_alert(
 
 @router.get("/analytics/summary")
 async def get_inventory_summary(
+    request: Request,
     user: UserInfo = Depends(get_current_user),
 ):
     """
@@ -254,7 +306,7 @@ async def get_inventory_summary(
 
     try:
         summary = inventory_tools.get_inventory_summary()
-        return summary
+        return _json_etag_response(request, summary)
 
     except Exception as e:
         logger.error("Failed to get inventory summary", error=str(e))
@@ -263,6 +315,7 @@ async def get_inventory_summary(
 
 @router.get("/analytics/category/{category}")
 async def get_category_analytics(
+    request: Request,
     category: ProductCategory,
     user: UserInfo = Depends(get_current_user),
 ):
@@ -271,35 +324,41 @@ async def get_category_analytics(
 
     Requires: inventory:read scope
     """
+    category_value = category.value
     logger.info(
         "Getting category analytics",
         user_sub=user.sub,
-        category=category.value,
+        category=category_value,
     )
 
     try:
-        products = inventory_tools.list_products(category=category.value)
+        products = inventory_tools.list_products(category=category_value)
+
+        # One pass computes each product's value and the category totals
+        total_value = 0
+        total_units = 0
+        product_values = []
+        for p in products:
+            value = p.price * p.quantity
+            total_value += value
+            total_units += p.quantity
+            product_values.append({
+                "sku": p.sku,
+                "name": p.name,
+                "quantity": p.quantity,
+                "value": round(value, 2),
+            })
 
-        total_value = sum(p.price * p.quantity for p in products)
-        total_units = sum(p.quantity for p in products)
         avg_price = total_value / total_units if total_units > 0 else 0
 
-        return {
-            "category": category.value,
+        return _json_etag_response(request, {
+            "category": category_value,
             "product_count": len(products),
             "total_units": total_units,
             "total_value": round(total_value, 2),
             "average_price": round(avg_price, 2),
-            "products": [
-                {
-                    "sku": p.sku,
-                    "name": p.name,
-                    "quantity": p.quantity,
-                    "value": round(p.price * p.quantity, 2),
-                }
-                for p in products
-            ],
-        }
+            "products": product_values,
+        })
 
     except Exception as e:
         logger.error("Failed to get category analytics", error=str(e))
@@ -349,13 +408,17 @@ async def bulk_receive_inventory(
         item_count=len(items),
     )
 
+    # Each update is an in-memory write, so one pass on the event loop is
+    # faster than fanning out tasks; the shipment is applied atomically
+    # with respect to other requests.
+    reason = f"Bulk shipment received by {user.email}"
     results = []
     for item in items:
         try:
-            result = inventory_tools.update_stock(
+            result = inventory_tools.update_stock_sync(
                 sku=item["sku"],
                 quantity_change=item["quantity"],
-                reason=f"Bulk shipment received by {user.email}",
+                reason=reason,
             )
             results.append({
                 "sku": item["sku"],
@@ -5,6 +5,7 @@ Direct Salesforce API endpoints (for non-chat operations).
 """
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 import structlog
 
 from app.auth.okta_auth import get_current_user, get_id_token
@@ -12,7 +13,7 @@ from app.auth.token_vault import token_vault
 from app.models.schemas import UserInfo
 from app.core.config import settings
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = structlog.get_logger()
 
 
@@ -65,7 +66,8 @@ async def disconnect_salesforce(
             return {"success": True, "message": "No Salesforce connection found"}
 
         # In production, you would call Auth0 Management API to unlink the identity
-        # For now, just return success
+        # For now, just forget the cached token and return success
+        token_vault.invalidate_salesforce_token(auth0_user_id)
         return {"success": True, "message": "Salesforce disconnected"}
 
     except Exception as e:
@@ -4,7 +4,9 @@ User Router
 Endpoints for user information and access management.
 """
 
+import asyncio
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 import structlog
 
 from app.auth.okta_auth import get_current_user, get_id_token, okta_auth
@@ -12,7 +14,7 @@ from app.auth.token_vault import token_vault
 from app.models.schemas import UserInfo, UserAccess, SalesforceAccess, InventoryAccess
 from app.core.config import settings
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = structlog.get_logger()
 
 
@@ -22,23 +24,8 @@ async def get_current_user_info(user: UserInfo = Depends(get_current_user)):
     return user
 
 
-@router.get("/access", response_model=UserAccess)
-async def get_user_access(
-    user: UserInfo = Depends(get_current_user),
-    id_token: str = Depends(get_id_token),
-):
-    """
-    Get user's access to different services.
-
-    Checks:
-    1. Salesforce connection status via Auth0 Token Vault
-    2. Inventory authorization via Okta Custom AS
-    """
-    logger.info("Checking user access", user_sub=user.sub)
-
-    # Check Salesforce connection
-    salesforce_access = SalesforceAccess(connected=False, scopes=[])
-
+async def _check_salesforce_access(user: UserInfo) -> SalesforceAccess:
+    """Check Salesforce connection status via Auth0 Token Vault"""
     try:
         # Get Auth0 user ID from Okta subject
         auth0_user_id = await token_vault.get_user_id_from_okta_sub(user.sub)
@@ -46,7 +33,7 @@ async def get_user_access(
         if auth0_user_id:
             is_connected = await token_vault.check_salesforce_connection(auth0_user_id)
             if is_connected:
-                salesforce_access = SalesforceAccess(
+                return SalesforceAccess(
                     connected=True,
                     scopes=["sales:read", "sales:write", "customer:read", "customer:lookup"],
                     instance_url=settings.salesforce_instance_url,
@@ -54,23 +41,22 @@ async def get_user_access(
     except Exception as e:
         logger.warning("Failed to check Salesforce connection", error=str(e))
 
-    # Check Inventory authorization via Okta Custom AS
-    inventory_access = InventoryAccess(authorized=False, scopes=[])
+    return SalesforceAccess(connected=False, scopes=[])
+
 
+async def _check_inventory_access(user: UserInfo, id_token: str) -> InventoryAccess:
+    """Check inventory authorization via the Okta Custom AS"""
     if settings.inventory_auth_server_id:
         try:
-            # Exchange for ID-JAG first
-            id_jag = await okta_auth.exchange_for_id_jag(id_token)
-
-            # Exchange ID-JAG for inventory token
-            result = await okta_auth.exchange_id_jag_for_token(
-                id_jag=id_jag,
+            # ID token -> ID-JAG -> inventory token (cached per user)
+            result = await okta_auth.get_scoped_token(
+                id_token=id_token,
                 auth_server_id=settings.inventory_auth_server_id,
                 scopes=settings.inventory_scopes,
             )
 
             if result.get("success"):
-                inventory_access = InventoryAccess(
+                return InventoryAccess(
                     authorized=True,
                     scopes=result.get("scope", "").split(" "),
                 )
@@ -79,11 +65,33 @@ async def get_user_access(
     else:
         # For demo without custom AS, grant access based on user groups
         if any(g in user.groups for g in ["ProGear-Sales", "ProGear-Warehouse", "Admins"]):
-            inventory_access = InventoryAccess(
+            return InventoryAccess(
                 authorized=True,
                 scopes=["inventory:read", "inventory:write", "inventory:alert"],
             )
 
+    return InventoryAccess(authorized=False, scopes=[])
+
+
+@router.get("/access", response_model=UserAccess)
+async def get_user_access(
+    user: UserInfo = Depends(get_current_user),
+    id_token: str = Depends(get_id_token),
+):
+    """
+    Get user's access to different services.
+
+    Checks (run concurrently, as they hit different providers):
+    1. Salesforce connection status via Auth0 Token Vault
+    2. Inventory authorization via Okta Custom AS
+    """
+    logger.info("Checking user access", user_sub=user.sub)
+
+    salesforce_access, inventory_access = await asyncio.gather(
+        _check_salesforce_access(user),
+        _check_inventory_access(user, id_token),
+    )
+
     return UserAccess(
         salesforce=salesforce_access,
         inventory=inventory_access,
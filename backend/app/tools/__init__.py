@@ -1,10 +1,11 @@
 """MCP Tools for AI Agent operations."""
 
-from app.tools.salesforce_tools import SalesforceTools
+from app.tools.salesforce_tools import SalesforceTools, get_salesforce_tools
 from app.tools.inventory_tools import InventoryTools, inventory_tools
 
 __all__ = [
     "SalesforceTools",
+    "get_salesforce_tools",
     "InventoryTools",
     "inventory_tools",
 ]
@@ -8,10 +8,13 @@ Comprehensive tools for inventory management:
 - Analytics and reporting
 """
 
+import copy
 import time
 import uuid
-from typing import Optional, List
-from datetime import datetime
+from itertools import count, islice
+from operator import attrgetter
+from typing import Any, Callable, Iterator, Optional, List, Dict, Sequence, Set, Tuple
+from datetime import datetime, timezone
 import structlog
 
 from app.models.schemas import (
@@ -184,28 +187,233 @@ DEMO_ALERTS: List[InventoryAlert] = [
 ]
 
 
+# Every InventoryTools instance shares the DEMO_PRODUCTS objects, so product
+# mutations bump one module-wide version that cached views are checked against
+_catalog_version = 0
+
+
+def _catalog_changed() -> None:
+    """Invalidate cached product views after a product is modified"""
+    global _catalog_version
+    _catalog_version += 1
+
+
+def catalog_version() -> int:
+    """Current product catalog version (changes whenever a product is modified)"""
+    return _catalog_version
+
+
+_by_quantity = attrgetter("quantity")
+
+# Enum member -> plain string; a dict hit is several times cheaper than .value
+_STATUS_VALUE: Dict[StockStatus, str] = {s: s.value for s in StockStatus}
+_CATEGORY_VALUE: Dict[ProductCategory, str] = {c: c.value for c in ProductCategory}
+
+# Scopes granted when none are given
+_DEFAULT_SCOPES = ["inventory:read", "inventory:write", "inventory:alert"]
+
+# Suffix for tool call ids, unique within the process
+_tool_call_ids = count(1)
+
+
+def _stock_status(quantity: int, reorder_point: int) -> StockStatus:
+    """Stock status implied by a quantity and reorder point"""
+    if quantity == 0:
+        return StockStatus.OUT_OF_STOCK
+    if quantity < reorder_point:
+        return StockStatus.LOW_STOCK
+    return StockStatus.IN_STOCK
+
+
+def _trigrams(text: str) -> Set[str]:
+    """All 3-character substrings of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
 class InventoryTools:
     """MCP Tools for Inventory management"""
 
     def __init__(self, user_scopes: Optional[List[str]] = None):
-        self.user_scopes = user_scopes or ["inventory:read", "inventory:write", "inventory:alert"]
+        self.user_scopes = user_scopes or _DEFAULT_SCOPES
         self._products = DEMO_PRODUCTS.copy()
-        self._alerts = DEMO_ALERTS.copy()
+        # Products are updated in place and never added or removed, so one
+        # snapshot serves every full-catalog scan
+        self._all_products: Tuple[Product, ...] = tuple(self._products.values())
+        # Alert id -> alert, in creation order
+        self._alerts: Dict[str, InventoryAlert] = {a.id: a for a in DEMO_ALERTS}
+        self._build_search_index()
+        self._build_static_views()
+        # (severity, acknowledged) -> alert dicts; cleared when alerts change
+        self._alert_views: Dict[Tuple[Optional[str], Optional[bool]], List[dict]] = {}
+        # (category, status) -> (catalog version, filtered products)
+        self._product_lists: Dict[Tuple[Optional[str], Optional[str]], Tuple[int, List[Product]]] = {}
+        # Catalog version -> products by status in catalog order (latest version only)
+        self._by_status: Dict[int, Dict[StockStatus, List[Product]]] = {}
+        # Analytics name -> (inputs version, result); results are shared, treat as read-only
+        self._analytics: Dict[str, Tuple[Any, dict]] = {}
+
+    def _build_search_index(self) -> None:
+        """Build the trigram and lookup indexes used by product search and filtering"""
+        self._name_lc: Dict[str, str] = {}
+        self._name_trigrams: Dict[str, Set[str]] = {}
+        self._sku_order: Dict[str, int] = {}
+        # Lower-cased "name\0sku" so list_products' substring search is one scan
+        self._search_keys: Dict[str, str] = {}
+        # Products by category in catalog order; a product's category never changes
+        self._by_category: Dict[ProductCategory, List[Product]] = {}
+        # Lower-cased "name\0description" and its trigram index for search_products
+        self._text_lower: Dict[str, str] = {}
+        self._text_trigrams: Dict[str, Set[str]] = {}
+
+        for position, (sku, product) in enumerate(self._products.items()):
+            name_lc = product.name.casefold()
+            self._name_lc[sku] = name_lc
+            self._search_keys[sku] = f"{product.name.lower()}\0{sku.lower()}"
+            self._sku_order[sku] = position
+            self._by_category.setdefault(product.category, []).append(product)
+            for gram in _trigrams(name_lc):
+                self._name_trigrams.setdefault(gram, set()).add(sku)
+
+            text_lower = f"{product.name.lower()}\0{(product.description or '').lower()}"
+            self._text_lower[sku] = text_lower
+            for gram in _trigrams(text_lower):
+                self._text_trigrams.setdefault(gram, set()).add(sku)
+
+    def _build_static_views(self) -> None:
+        """
+        Precompute the fields of each tool's per-product dict that never change.
+
+        Stock updates only touch quantity, status, reorder point and timestamp,
+        so responses copy these and add the live fields on top.
+        """
+        self._stock_rows: Dict[str, dict] = {}
+        self._search_rows: Dict[str, dict] = {}
+        self._detail_rows: Dict[str, dict] = {}
+
+        for sku, p in self._products.items():
+            category = _CATEGORY_VALUE[p.category]
+            self._stock_rows[sku] = {
+                "sku": p.sku,
+                "name": p.name,
+                "location": p.location,
+                "category": category,
+            }
+            self._search_rows[sku] = {"sku": p.sku, "name": p.name, "category": category}
+            self._detail_rows[sku] = {
+                "id": p.id,
+                "sku": p.sku,
+                "name": p.name,
+                "description": p.description,
+                "category": category,
+                "price": p.price,
+                "cost": p.cost,
+                "margin": (
+                    round((p.price - p.cost) / p.price * 100, 1)
+                    if p.cost is not None and p.price else None
+                ),
+                "location": p.location,
+            }
+
+    def _trigram_matches(
+        self,
+        index: Dict[str, Set[str]],
+        texts: Dict[str, str],
+        query: str,
+    ) -> Iterator[str]:
+        """SKUs whose indexed text contains query, in catalog order"""
+        grams = _trigrams(query)
+
+        if grams:
+            # Intersect posting lists smallest-first, then verify the substring
+            postings = sorted((index.get(g, set()) for g in grams), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+        else:
+            # Queries shorter than a trigram can't use the index
+            candidates = texts.keys()
+
+        for sku in sorted(candidates, key=self._sku_order.__getitem__):
+            if query in texts[sku]:
+                yield sku
+
+    def _products_by_status(self) -> Dict[StockStatus, List[Product]]:
+        """Status index over the catalog, rebuilt after any product changes"""
+        index = self._by_status.get(_catalog_version)
+        if index is None:
+            index = {}
+            for product in self._all_products:
+                index.setdefault(product.status, []).append(product)
+            # Updated in place so scoped views share the rebuilt index
+            self._by_status.clear()
+            self._by_status[_catalog_version] = index
+        return index
+
+    def _filter_products(
+        self,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Sequence[Product]:
+        """
+        Products matching category and/or status, in catalog order.
+
+        Starts from the smaller of the category and status index entries and
+        checks the other attribute only on those candidates. Unfiltered and
+        single-filter results are the shared snapshot or index entry; copy
+        before handing them to callers that may mutate them.
+        """
+        by_category = self._by_category.get(category, []) if category else None
+        by_status = self._products_by_status().get(status, []) if status else None
+
+        if by_category is None and by_status is None:
+            return self._all_products
+        if by_status is None:
+            return by_category
+        if by_category is None:
+            return by_status
+        if len(by_category) <= len(by_status):
+            return [p for p in by_category if p.status == status]
+        return [p for p in by_status if p.category == category]
+
+    def _memoized(self, name: str, version: Any, compute: Callable[[], dict]) -> dict:
+        """Return the last result of an analytics computation while version is unchanged"""
+        cached = self._analytics.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        result = compute()
+        self._analytics[name] = (version, result)
+        return result
+
+    def with_scopes(self, user_scopes: Sequence[str]) -> "InventoryTools":
+        """
+        A view of these tools limited to user_scopes.
+
+        The view shares this instance's products, alerts, indexes and caches,
+        so scoping a request costs a shallow copy rather than a rebuild. Empty
+        scopes fall back to the defaults, as in __init__.
+        """
+        scoped = copy.copy(self)
+        scoped.user_scopes = user_scopes or _DEFAULT_SCOPES
+        return scoped
 
     def _has_scope(self, required_scope: str) -> bool:
         """Check if user has required scope"""
         return required_scope in self.user_scopes
 
-    async def _execute_tool(
+    def _execute_tool(
         self,
         tool_name: str,
         func,
         required_scope: Optional[str] = None,
         **kwargs,
     ) -> ToolCall:
-        """Execute a tool and return standardized result"""
-        tool_id = f"inv-{tool_name}-{int(time.time() * 1000)}"
-        start_time = time.time()
+        """
+        Execute a tool and return standardized result.
+
+        func is a plain function: the tools only touch in-memory data, so
+        their bodies run inline rather than as extra coroutines. kwargs are
+        recorded as the call's arguments.
+        """
+        tool_id = f"inv-{tool_name}-{next(_tool_call_ids)}"
+        start_ns = time.monotonic_ns()
 
         # Check scope if required
         if required_scope and not self._has_scope(required_scope):
@@ -219,8 +427,8 @@ class InventoryTools:
             )
 
         try:
-            result = await func(**kwargs) if callable(func) else func
-            duration = int((time.time() - start_time) * 1000)
+            result = func() if callable(func) else func
+            duration = (time.monotonic_ns() - start_ns) // 1_000_000
 
             return ToolCall(
                 id=tool_id,
@@ -238,7 +446,7 @@ class InventoryTools:
                 status=ToolCallStatus.ERROR,
                 arguments=kwargs,
                 error=str(e),
-                duration=int((time.time() - start_time) * 1000),
+                duration=(time.monotonic_ns() - start_ns) // 1_000_000,
             )
 
     # === STOCK CHECKING TOOLS ===
@@ -251,26 +459,30 @@ class InventoryTools:
     ) -> ToolCall:
         """Check stock levels for products"""
 
-        async def _execute():
-            products = list(self._products.values())
+        def _execute():
+            category_lower = category.lower() if category else None
+            status_lower = status.lower() if status else None
 
-            # Apply filters
             if sku:
-                products = [p for p in products if p.sku == sku]
-            if category:
-                products = [p for p in products if p.category.value == category.lower()]
-            if status:
-                products = [p for p in products if p.status.value == status.lower()]
+                # SKUs are unique: look the product up and test the other filters
+                product = self._products.get(sku)
+                products = []
+                if (
+                    product
+                    and (not category_lower or product.category == category_lower)
+                    and (not status_lower or product.status == status_lower)
+                ):
+                    products.append(product)
+            else:
+                products = self._filter_products(category=category_lower, status=status_lower)
 
+            stock_rows = self._stock_rows
             result = [
                 {
-                    "sku": p.sku,
-                    "name": p.name,
+                    **stock_rows[p.sku],
                     "quantity": p.quantity,
                     "reorder_point": p.reorder_point,
-                    "status": p.status.value,
-                    "location": p.location,
-                    "category": p.category.value,
+                    "status": _STATUS_VALUE[p.status],
                 }
                 for p in products
             ]
@@ -280,7 +492,7 @@ class InventoryTools:
                 "total_count": len(result),
             }
 
-        return await self._execute_tool(
+        return self._execute_tool(
             "check_stock",
             _execute,
             required_scope="inventory:read",
@@ -292,28 +504,20 @@ class InventoryTools:
     async def get_product_details(self, sku: str) -> ToolCall:
         """Get detailed information about a specific product"""
 
-        async def _execute():
+        def _execute():
             product = self._products.get(sku)
             if not product:
                 return {"error": "Product not found", "sku": sku}
 
             return {
-                "id": product.id,
-                "sku": product.sku,
-                "name": product.name,
-                "description": product.description,
-                "category": product.category.value,
-                "price": product.price,
-                "cost": product.cost,
-                "margin": round((product.price - product.cost) / product.price * 100, 1),
+                **self._detail_rows[sku],
                 "quantity": product.quantity,
                 "reorder_point": product.reorder_point,
-                "status": product.status.value,
-                "location": product.location,
+                "status": _STATUS_VALUE[product.status],
                 "last_updated": product.last_updated.isoformat(),
             }
 
-        return await self._execute_tool(
+        return self._execute_tool(
             "get_product_details",
             _execute,
             required_scope="inventory:read",
@@ -327,29 +531,30 @@ class InventoryTools:
     ) -> ToolCall:
         """Search products by name or description"""
 
-        async def _execute():
+        def _execute():
             query_lower = query.lower()
-            matches = [
-                p for p in self._products.values()
-                if query_lower in p.name.lower() or query_lower in (p.description or "").lower()
-            ][:limit]
+            if "\0" in query_lower:
+                # Would otherwise match across the name/description separator
+                matches = []
+            else:
+                skus = self._trigram_matches(self._text_trigrams, self._text_lower, query_lower)
+                matches = [self._products[sku] for sku in islice(skus, limit)]
 
+            search_rows = self._search_rows
             return {
                 "products": [
                     {
-                        "sku": p.sku,
-                        "name": p.name,
-                        "category": p.category.value,
+                        **search_rows[p.sku],
                         "quantity": p.quantity,
                         "price": p.price,
-                        "status": p.status.value,
+                        "status": _STATUS_VALUE[p.status],
                     }
                     for p in matches
                 ],
                 "total_matches": len(matches),
             }
 
-        return await self._execute_tool(
+        return self._execute_tool(
             "search_products",
             _execute,
             required_scope="inventory:read",
@@ -367,7 +572,7 @@ class InventoryTools:
     ) -> ToolCall:
         """Update stock quantity for a product"""
 
-        async def _execute():
+        def _execute():
             product = self._products.get(sku)
             if not product:
                 return {"error": "Product not found", "sku": sku}
@@ -375,17 +580,13 @@ class InventoryTools:
             old_quantity = product.quantity
             new_quantity = max(0, product.quantity + quantity_change)
 
-            # Update the product
-            product.quantity = new_quantity
-            product.last_updated = datetime.utcnow()
-
-            # Update status
-            if new_quantity == 0:
-                product.status = StockStatus.OUT_OF_STOCK
-            elif new_quantity < product.reorder_point:
-                product.status = StockStatus.LOW_STOCK
-            else:
-                product.status = StockStatus.IN_STOCK
+            # Update the product and its status
+            product.update_fields(
+                quantity=new_quantity,
+                status=_stock_status(new_quantity, product.reorder_point),
+                last_updated=datetime.now(timezone.utc),
+            )
+            _catalog_changed()
 
             return {
                 "success": True,
@@ -394,12 +595,12 @@ class InventoryTools:
                 "old_quantity": old_quantity,
                 "new_quantity": new_quantity,
                 "change": quantity_change,
-                "new_status": product.status.value,
+                "new_status": _STATUS_VALUE[product.status],
                 "reason": reason,
                 "timestamp": product.last_updated.isoformat(),
             }
 
-        return await self._execute_tool(
+        return self._execute_tool(
             "update_stock",
             _execute,
             required_scope="inventory:write",
@@ -414,37 +615,38 @@ class InventoryTools:
     ) -> ToolCall:
         """Bulk update stock for multiple products"""
 
-        async def _execute():
+        def _execute():
+            # The whole batch shares one timestamp and one cache invalidation
+            now = datetime.now(timezone.utc)
+            products = self._products
             results = []
-            for update in updates:
-                sku = update.get("sku")
-                change = update.get("quantity_change", 0)
-                reason = update.get("reason")
+            try:
+                for update in updates:
+                    sku = update.get("sku")
+                    change = update.get("quantity_change", 0)
+
+                    product = products.get(sku)
+                    if not product:
+                        results.append({"sku": sku, "success": False, "error": "Product not found"})
+                        continue
+
+                    old_qty = product.quantity
+                    new_qty = max(0, old_qty + change)
+                    product.update_fields(
+                        quantity=new_qty,
+                        status=_stock_status(new_qty, product.reorder_point),
+                        last_updated=now,
+                    )
 
-                product = self._products.get(sku)
-                if not product:
-                    results.append({"sku": sku, "success": False, "error": "Product not found"})
-                    continue
-
-                old_qty = product.quantity
-                new_qty = max(0, product.quantity + change)
-                product.quantity = new_qty
-                product.last_updated = datetime.utcnow()
-
-                # Update status
-                if new_qty == 0:
-                    product.status = StockStatus.OUT_OF_STOCK
-                elif new_qty < product.reorder_point:
-                    product.status = StockStatus.LOW_STOCK
-                else:
-                    product.status = StockStatus.IN_STOCK
-
-                results.append({
-                    "sku": sku,
-                    "success": True,
-                    "old_quantity": old_qty,
-                    "new_quantity": new_qty,
-                })
+                    results.append({
+                        "sku": sku,
+                        "success": True,
+                        "old_quantity": old_qty,
+                        "new_quantity": new_qty,
+                    })
+            finally:
+                if results:
+                    _catalog_changed()
 
             successful = sum(1 for r in results if r.get("success"))
             return {
@@ -453,7 +655,7 @@ class InventoryTools:
                 "total_failed": len(results) - successful,
             }
 
-        return await self._execute_tool(
+        return self._execute_tool(
             "bulk_stock_update",
             _execute,
             required_scope="inventory:write",
@@ -467,18 +669,19 @@ class InventoryTools:
     ) -> ToolCall:
         """Set the reorder point for a product"""
 
-        async def _execute():
+        def _execute():
             product = self._products.get(sku)
             if not product:
                 return {"error": "Product not found", "sku": sku}
 
             old_point = product.reorder_point
-            product.reorder_point = reorder_point
-            product.last_updated = datetime.utcnow()
+            changes = {"reorder_point": reorder_point, "last_updated": datetime.now(timezone.utc)}
 
             # Update status if needed
             if product.quantity > 0 and product.quantity < reorder_point:
-                product.status = StockStatus.LOW_STOCK
+                changes["status"] = StockStatus.LOW_STOCK
+            product.update_fields(**changes)
+            _catalog_changed()
 
             return {
                 "success": True,
@@ -488,7 +691,7 @@ class InventoryTools:
                 "new_reorder_point": reorder_point,
             }
 
-        return await self._execute_tool(
+        return self._execute_tool(
             "set_reorder_point",
             _execute,
             required_scope="inventory:write",
@@ -504,8 +707,8 @@ class InventoryTools:
     ) -> ToolCall:
         """Get inventory alerts"""
 
-        async def _execute():
-            alerts = self._alerts
+        def _execute():
+            alerts = self._alerts.values()
             if alert_type:
                 alerts = [a for a in alerts if a.alert_type == alert_type]
 
@@ -525,7 +728,7 @@ class InventoryTools:
                 "total_count": len(alerts),
             }
 
-        return await self._execute_tool(
+        return self._execute_tool(
             "get_alerts",
             _execute,
             required_scope="inventory:alert",
@@ -540,7 +743,7 @@ class InventoryTools:
     ) -> ToolCall:
         """Create a new inventory alert"""
 
-        async def _execute():
+        def _execute():
             product = self._products.get(sku)
             if not product:
                 return {"error": "Product not found", "sku": sku}
@@ -555,7 +758,8 @@ class InventoryTools:
                 threshold=threshold,
             )
 
-            self._alerts.append(alert)
+            self._alerts[alert.id] = alert
+            self._alert_views.clear()
 
             return {
                 "success": True,
@@ -565,7 +769,7 @@ class InventoryTools:
                 "threshold": threshold,
             }
 
-        return await self._execute_tool(
+        return self._execute_tool(
             "create_alert",
             _execute,
             required_scope="inventory:alert",
@@ -577,15 +781,14 @@ class InventoryTools:
     async def dismiss_alert(self, alert_id: str) -> ToolCall:
         """Dismiss an inventory alert"""
 
-        async def _execute():
-            for i, alert in enumerate(self._alerts):
-                if alert.id == alert_id:
-                    self._alerts.pop(i)
-                    return {"success": True, "alert_id": alert_id}
+        def _execute():
+            if self._alerts.pop(alert_id, None) is None:
+                return {"error": "Alert not found", "alert_id": alert_id}
 
-            return {"error": "Alert not found", "alert_id": alert_id}
+            self._alert_views.clear()
+            return {"success": True, "alert_id": alert_id}
 
-        return await self._execute_tool(
+        return self._execute_tool(
             "dismiss_alert",
             _execute,
             required_scope="inventory:alert",
@@ -597,35 +800,45 @@ class InventoryTools:
     async def get_stock_summary(self) -> ToolCall:
         """Get overall inventory summary"""
 
-        async def _execute():
-            products = list(self._products.values())
+        def _compute():
+            total_value = 0
+            total_units = 0
+            status_counts = dict.fromkeys(StockStatus, 0)
 
-            total_value = sum(p.price * p.quantity for p in products)
-            low_stock = sum(1 for p in products if p.status == StockStatus.LOW_STOCK)
-            out_of_stock = sum(1 for p in products if p.status == StockStatus.OUT_OF_STOCK)
-
-            # Category breakdown
+            # Totals, status counts and the category breakdown in one pass
             categories = {}
-            for p in products:
-                cat = p.category.value
-                if cat not in categories:
-                    categories[cat] = {"count": 0, "value": 0, "quantity": 0}
-                categories[cat]["count"] += 1
-                categories[cat]["value"] += p.price * p.quantity
-                categories[cat]["quantity"] += p.quantity
+            for p in self._all_products:
+                value = p.price * p.quantity
+                total_value += value
+                total_units += p.quantity
+                status_counts[p.status] += 1
+
+                category = _CATEGORY_VALUE[p.category]
+                cat = categories.get(category)
+                if cat is None:
+                    cat = categories[category] = {"count": 0, "value": 0, "quantity": 0}
+                cat["count"] += 1
+                cat["value"] += value
+                cat["quantity"] += p.quantity
+
+            low_stock = status_counts[StockStatus.LOW_STOCK]
+            out_of_stock = status_counts[StockStatus.OUT_OF_STOCK]
 
             return {
-                "total_products": len(products),
+                "total_products": len(self._products),
                 "total_inventory_value": round(total_value, 2),
-                "total_units": sum(p.quantity for p in products),
+                "total_units": total_units,
                 "low_stock_count": low_stock,
                 "out_of_stock_count": out_of_stock,
-                "in_stock_count": len(products) - low_stock - out_of_stock,
+                "in_stock_count": len(self._products) - low_stock - out_of_stock,
                 "categories": categories,
                 "active_alerts": len(self._alerts),
             }
 
-        return await self._execute_tool(
+        def _execute():
+            return self._memoized("get_stock_summary", (_catalog_version, len(self._alerts)), _compute)
+
+        return self._execute_tool(
             "get_stock_summary",
             _execute,
             required_scope="inventory:read",
@@ -634,30 +847,35 @@ class InventoryTools:
     async def get_low_stock_report(self) -> ToolCall:
         """Get report of all low stock and out of stock items"""
 
-        async def _execute():
-            low_stock_items = [
-                p for p in self._products.values()
-                if p.status in [StockStatus.LOW_STOCK, StockStatus.OUT_OF_STOCK]
-            ]
+        def _compute():
+            # Out-of-stock items have quantity 0 and low-stock items more, so
+            # the sort below still lists equal quantities in catalog order
+            by_status = self._products_by_status()
+            low_stock_items = (
+                by_status.get(StockStatus.LOW_STOCK, []) + by_status.get(StockStatus.OUT_OF_STOCK, [])
+            )
 
             return {
                 "items": [
                     {
                         "sku": p.sku,
                         "name": p.name,
-                        "category": p.category.value,
+                        "category": _CATEGORY_VALUE[p.category],
                         "current_quantity": p.quantity,
                         "reorder_point": p.reorder_point,
                         "shortage": p.reorder_point - p.quantity,
-                        "status": p.status.value,
+                        "status": _STATUS_VALUE[p.status],
                         "estimated_reorder_cost": (p.reorder_point - p.quantity) * p.cost if p.cost else None,
                     }
-                    for p in sorted(low_stock_items, key=lambda x: x.quantity)
+                    for p in sorted(low_stock_items, key=_by_quantity)
                 ],
                 "total_items_needing_reorder": len(low_stock_items),
             }
 
-        return await self._execute_tool(
+        def _execute():
+            return self._memoized("get_low_stock_report", _catalog_version, _compute)
+
+        return self._execute_tool(
             "get_low_stock_report",
             _execute,
             required_scope="inventory:read",
@@ -666,11 +884,11 @@ class InventoryTools:
     async def get_category_breakdown(self) -> ToolCall:
         """Get inventory breakdown by category"""
 
-        async def _execute():
+        def _compute():
             categories = {}
 
-            for p in self._products.values():
-                cat = p.category.value
+            for p in self._all_products:
+                cat = _CATEGORY_VALUE[p.category]
                 if cat not in categories:
                     categories[cat] = {
                         "product_count": 0,
@@ -697,7 +915,10 @@ class InventoryTools:
 
             return {"categories": categories}
 
-        return await self._execute_tool(
+        def _execute():
+            return self._memoized("get_category_breakdown", _catalog_version, _compute)
+
+        return self._execute_tool(
             "get_category_breakdown",
             _execute,
             required_scope="inventory:read",
@@ -705,21 +926,70 @@ class InventoryTools:
 
 
     # === DIRECT ACCESS METHODS (Synchronous, for orchestrator) ===
+    # These only touch the in-memory store and return in microseconds, so
+    # they are called directly on the event loop. Running them through
+    # asyncio.to_thread would cost more than the work itself and would let
+    # concurrent stock updates race on the same Product.
 
     def list_products(
         self,
         category: Optional[str] = None,
         status: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[Product]:
-        """Get list of products (synchronous)"""
-        products = list(self._products.values())
-
+        """
+        Get list of products (synchronous).
+
+        The category/status filtered list is cached until a product changes;
+        search (case-insensitive substring of name or SKU) and limit are
+        applied on top, stopping as soon as limit matches are found.
+        category and status may be the str enums or their plain values;
+        anything else matches no product and is not cached, so free-form
+        LLM arguments can't grow the cache.
+        """
         if category:
-            products = [p for p in products if p.category.value == category]
+            category = _CATEGORY_VALUE.get(category)
+            if category is None:
+                return []
         if status:
-            products = [p for p in products if p.status.value == status]
+            status = _STATUS_VALUE.get(status)
+            if status is None:
+                return []
+
+        key = (category or None, status or None)
+        cached = self._product_lists.get(key)
+        if cached and cached[0] == _catalog_version:
+            products = cached[1]
+        else:
+            products = list(self._filter_products(category=category, status=status))
+            self._product_lists[key] = (_catalog_version, products)
+
+        if search:
+            search_lower = search.lower()
+            if "\0" in search_lower:
+                # Would otherwise match across the name/SKU separator
+                return []
+            search_keys = self._search_keys
+            matches = (p for p in products if search_lower in search_keys[p.sku])
+            return list(islice(matches, limit))
 
-        return products
+        return products[:limit]
+
+    def search_by_name(
+        self,
+        query: str,
+        category: Optional[str] = None,
+    ) -> List[Product]:
+        """Case-insensitive product name search using the trigram index (synchronous)"""
+        matches = []
+        for sku in self._trigram_matches(self._name_trigrams, self._name_lc, query.casefold()):
+            product = self._products[sku]
+            if category and product.category != category:
+                continue
+            matches.append(product)
+
+        return matches
 
     def get_product(self, sku: str) -> Optional[Product]:
         """Get a single product by SKU (synchronous)"""
@@ -739,15 +1009,12 @@ class InventoryTools:
         old_quantity = product.quantity
         new_quantity = max(0, product.quantity + quantity_change)
 
-        product.quantity = new_quantity
-        product.last_updated = datetime.utcnow()
-
-        if new_quantity == 0:
-            product.status = StockStatus.OUT_OF_STOCK
-        elif new_quantity < product.reorder_point:
-            product.status = StockStatus.LOW_STOCK
-        else:
-            product.status = StockStatus.IN_STOCK
+        product.update_fields(
+            quantity=new_quantity,
+            status=_stock_status(new_quantity, product.reorder_point),
+            last_updated=datetime.now(timezone.utc),
+        )
+        _catalog_changed()
 
         return {
             "success": True,
@@ -756,14 +1023,14 @@ class InventoryTools:
             "old_quantity": old_quantity,
             "new_quantity": new_quantity,
             "change": quantity_change,
-            "new_status": product.status.value,
+            "new_status": _STATUS_VALUE[product.status],
             "reason": reason,
         }
 
     def check_low_stock(self, threshold: int = 15) -> dict:
         """Check for low stock items (synchronous)"""
         low_stock_items = [
-            p for p in self._products.values()
+            p for p in self._all_products
             if p.quantity < threshold
         ]
 
@@ -774,9 +1041,9 @@ class InventoryTools:
                     "name": p.name,
                     "quantity": p.quantity,
                     "threshold": threshold,
-                    "status": p.status.value,
+                    "status": _STATUS_VALUE[p.status],
                 }
-                for p in sorted(low_stock_items, key=lambda x: x.quantity)
+                for p in sorted(low_stock_items, key=_by_quantity)
             ],
             "count": len(low_stock_items),
             "threshold": threshold,
@@ -800,36 +1067,72 @@ class InventoryTools:
 
     def get_inventory_summary(self) -> dict:
         """Get inventory summary (synchronous)"""
-        products = list(self._products.values())
 
-        total_value = sum(p.price * p.quantity for p in products)
-        low_stock = sum(1 for p in products if p.status == StockStatus.LOW_STOCK)
-        out_of_stock = sum(1 for p in products if p.status == StockStatus.OUT_OF_STOCK)
+        def _compute():
+            total_value = 0
+            total_units = 0
+            status_counts = dict.fromkeys(StockStatus, 0)
+            for p in self._all_products:
+                total_value += p.price * p.quantity
+                total_units += p.quantity
+                status_counts[p.status] += 1
 
-        return {
-            "total_products": len(products),
-            "total_value": round(total_value, 2),
-            "total_units": sum(p.quantity for p in products),
-            "low_stock_count": low_stock,
-            "out_of_stock_count": out_of_stock,
-            "in_stock_count": len(products) - low_stock - out_of_stock,
-        }
+            low_stock = status_counts[StockStatus.LOW_STOCK]
+            out_of_stock = status_counts[StockStatus.OUT_OF_STOCK]
 
-    def get_alerts(self) -> List[dict]:
-        """Get active alerts (synchronous)"""
-        return [
-            {
-                "id": a.id,
-                "product_name": a.product_name,
-                "sku": a.sku,
-                "alert_type": a.alert_type,
-                "current_quantity": a.current_quantity,
-                "threshold": a.threshold,
-                "severity": "high" if a.current_quantity == 0 else "medium",
-                "acknowledged": False,
+            return {
+                "total_products": len(self._products),
+                "total_value": round(total_value, 2),
+                "total_units": total_units,
+                "low_stock_count": low_stock,
+                "out_of_stock_count": out_of_stock,
+                "in_stock_count": len(self._products) - low_stock - out_of_stock,
             }
-            for a in self._alerts
-        ]
+
+        return self._memoized("get_inventory_summary", _catalog_version, _compute)
+
+    def list_alerts(
+        self,
+        severity: Optional[str] = None,
+        acknowledged: Optional[bool] = None,
+    ) -> List[dict]:
+        """
+        Get active alerts, optionally filtered (synchronous).
+
+        Each filter combination is built once and reused until an alert is
+        created or dismissed.
+        """
+        key = (severity, acknowledged)
+        view = self._alert_views.get(key)
+
+        if view is None:
+            alerts = self._alert_views.get((None, None))
+            if alerts is None:
+                alerts = [
+                    {
+                        "id": a.id,
+                        "product_id": a.product_id,
+                        "product_name": a.product_name,
+                        "sku": a.sku,
+                        "alert_type": a.alert_type,
+                        "current_quantity": a.current_quantity,
+                        "threshold": a.threshold,
+                        "created_at": a.created_at,
+                        "severity": "high" if a.current_quantity == 0 else "medium",
+                        "acknowledged": False,
+                    }
+                    for a in self._alerts.values()
+                ]
+                self._alert_views[(None, None)] = alerts
+
+            view = [
+                a for a in alerts
+                if (severity is None or a["severity"] == severity)
+                and (acknowledged is None or a["acknowledged"] == acknowledged)
+            ]
+            self._alert_views[key] = view
+
+        return list(view)
 
     def get_stock_movements(self, sku: str) -> List[dict]:
         """Get stock movement history (synchronous) - returns demo data"""
@@ -838,13 +1141,14 @@ class InventoryTools:
             return []
 
         # Return demo movement data
+        timestamp = datetime.now(timezone.utc).isoformat()
         return [
             {
                 "id": f"mov-{i}",
                 "sku": sku,
                 "type": "received" if i % 2 == 0 else "sold",
                 "quantity": 10 if i % 2 == 0 else -5,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp,
                 "reason": "Demo movement data",
             }
             for i in range(5)
@@ -8,11 +8,19 @@ Comprehensive tools for interacting with Salesforce CRM:
 - Reports & Analytics
 """
 
+import asyncio
+import random
 import time
-from typing import Optional, Any
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from itertools import count
+from typing import Optional, Any, AsyncIterator, Dict, List, Set, Tuple, Union
+from urllib.parse import quote
+from datetime import datetime, timedelta, timezone
+import orjson
 import structlog
 
+from app.core.config import settings
+from app.core.http_client import get_aiohttp_session
 from app.models.schemas import (
     ToolCall,
     ToolCallStatus,
@@ -24,6 +32,166 @@ from app.models.schemas import (
 
 logger = structlog.get_logger()
 
+# Max in-flight API requests per Salesforce connection
+SALESFORCE_MAX_CONCURRENT_REQUESTS = 5
+
+# Throttling: retry these statuses with backoff, and slow down near the org's API limit
+SALESFORCE_MAX_RETRIES = 3
+_RETRYABLE_STATUSES = frozenset({429, 503})
+_MAX_RETRY_AFTER_SECONDS = 30
+API_USAGE_SLOWDOWN_THRESHOLD = 0.9
+API_USAGE_SLOWDOWN_SECONDS = 0.2
+
+# Last reported API usage fraction per org (instance URL), from Sforce-Limit-Info
+_api_usage: Dict[str, float] = {}
+
+# composite/batch accepts at most this many subrequests
+_COMPOSITE_BATCH_LIMIT = 25
+
+# composite/sobjects creates at most this many records per request
+_COMPOSITE_SOBJECTS_LIMIT = 200
+
+# Read-only tools whose results are reused for identical arguments
+_READ_TOOLS = frozenset({
+    "get_accounts",
+    "get_account_details",
+    "get_contacts",
+    "get_leads",
+    "get_opportunities",
+    "get_pipeline_summary",
+    "get_recent_activities",
+    "get_sales_dashboard",
+})
+READ_CACHE_MAX_ENTRIES = 512
+READ_CACHE_TTL_SECONDS = 60
+
+# Suffix for tool call ids, unique within the process
+_tool_call_ids = count(1)
+
+
+# (tool result key, Salesforce field) per object, in result order
+_ACCOUNT_FIELDS = (
+    ("id", "Id"),
+    ("name", "Name"),
+    ("industry", "Industry"),
+    ("website", "Website"),
+    ("phone", "Phone"),
+    ("billing_city", "BillingCity"),
+    ("billing_state", "BillingState"),
+)
+_CONTACT_FIELDS = (
+    ("id", "Id"),
+    ("name", "Name"),
+    ("email", "Email"),
+    ("phone", "Phone"),
+    ("title", "Title"),
+    ("account_id", "AccountId"),
+)
+_LEAD_FIELDS = (
+    ("id", "Id"),
+    ("name", "Name"),
+    ("company", "Company"),
+    ("email", "Email"),
+    ("phone", "Phone"),
+    ("status", "Status"),
+    ("source", "LeadSource"),
+    ("created_date", "CreatedDate"),
+)
+_OPPORTUNITY_FIELDS = (
+    ("id", "Id"),
+    ("name", "Name"),
+    ("amount", "Amount"),
+    ("stage", "StageName"),
+    ("close_date", "CloseDate"),
+    ("probability", "Probability"),
+    ("account_id", "AccountId"),
+)
+_ACTIVITY_FIELDS = (
+    ("id", "Id"),
+    ("subject", "Subject"),
+    ("status", "Status"),
+    ("activity_date", "ActivityDate"),
+    ("description", "Description"),
+)
+# Related fields as (result key, relationship, field)
+_ACCOUNT_NAME_FIELD = (("account_name", "Account", "Name"),)
+
+
+def _remap(
+    records: List[dict],
+    fields: Tuple[Tuple[str, str], ...],
+    related: Tuple[Tuple[str, str, str], ...] = (),
+) -> List[Dict[str, Any]]:
+    """Rename Salesforce record fields to tool result keys (missing fields become None)"""
+    rows = []
+    for r in records:
+        row = {key: r.get(field) for key, field in fields}
+        for key, relationship, field in related:
+            row[key] = (r.get(relationship) or {}).get(field)
+        rows.append(row)
+    return rows
+
+
+def _select_from(
+    sobject_type: str,
+    fields: Tuple[Tuple[str, str], ...],
+    related: Tuple[Tuple[str, str, str], ...] = (),
+) -> str:
+    """SELECT ... FROM clause for exactly the fields a field table maps"""
+    columns = [field for _, field in fields]
+    columns += [f"{relationship}.{field}" for _, relationship, field in related]
+    return f"SELECT {', '.join(columns)} FROM {sobject_type}"
+
+
+# Static head of each list query; tools append WHERE/ORDER BY/LIMIT
+_ACCOUNT_SELECT = _select_from("Account", _ACCOUNT_FIELDS)
+_CONTACT_SELECT = _select_from("Contact", _CONTACT_FIELDS, _ACCOUNT_NAME_FIELD)
+_LEAD_SELECT = _select_from("Lead", _LEAD_FIELDS)
+_OPPORTUNITY_SELECT = _select_from("Opportunity", _OPPORTUNITY_FIELDS, _ACCOUNT_NAME_FIELD)
+_ACTIVITY_SELECT = _select_from("Task", _ACTIVITY_FIELDS)
+_ACCOUNT_DETAIL_SELECT = (
+    "SELECT Id, Name, Industry, Website, Phone, Description, "
+    "BillingStreet, BillingCity, BillingState, BillingPostalCode, BillingCountry, "
+    "AnnualRevenue, NumberOfEmployees, OwnerId, CreatedDate FROM Account"
+)
+
+
+def _lead_fields(
+    first_name: str,
+    last_name: str,
+    company: str,
+    email: Optional[str] = None,
+    phone: Optional[str] = None,
+    source: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Salesforce field values for a new lead"""
+    lead_data = {
+        "FirstName": first_name,
+        "LastName": last_name,
+        "Company": company,
+        "Status": "New",
+    }
+    if email:
+        lead_data["Email"] = email
+    if phone:
+        lead_data["Phone"] = phone
+    if source:
+        lead_data["LeadSource"] = source
+    return lead_data
+
+
+def _soql_literal(value: Any) -> str:
+    """Quote a value as a SOQL string literal, escaping backslashes and quotes"""
+    escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+def _soql_contains(value: Any) -> str:
+    """Quote a LIKE pattern matching value anywhere; its own % and _ match literally"""
+    escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
+    escaped = escaped.replace("%", "\\%").replace("_", "\\_")
+    return f"'%{escaped}%'"
+
 
 class SalesforceTools:
     """MCP Tools for Salesforce CRM operations"""
@@ -31,18 +199,177 @@ class SalesforceTools:
     def __init__(self, access_token: str, instance_url: str):
         self.access_token = access_token
         self.instance_url = instance_url
-        self._sf = None
-
-    @property
-    def sf(self):
-        """Lazy-load Salesforce client"""
-        if self._sf is None:
-            from simple_salesforce import Salesforce
-            self._sf = Salesforce(
-                instance_url=self.instance_url,
-                session_id=self.access_token,
+        self._base_url = f"{instance_url}/services/data/v{settings.salesforce_api_version}/"
+        self._headers = {"Authorization": f"Bearer {access_token}"}
+        self._log = logger.bind(instance_url=instance_url)
+        # Salesforce limits concurrent API requests per user
+        self._request_slots = asyncio.Semaphore(SALESFORCE_MAX_CONCURRENT_REQUESTS)
+        # SOQL queries waiting for the next flush, with the futures awaiting them
+        self._pending_queries: List[Tuple[str, asyncio.Future]] = []
+        # Flush tasks in flight; the loop only keeps weak references to tasks
+        self._flush_tasks: Set[asyncio.Task] = set()
+        # (tool_name, sorted kwargs) -> (stored_at, result) for _READ_TOOLS
+        self._read_cache: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """
+        Call the Salesforce REST API on the shared aiohttp session.
+
+        path is relative to /services/data/vXX.X/, or absolute from the
+        instance root when it starts with "/" (e.g. a nextRecordsUrl).
+        Returns the decoded JSON body, or None for 204 No Content.
+        """
+        url = self.instance_url + path if path.startswith("/") else self._base_url + path
+        session = get_aiohttp_session()
+
+        for attempt in range(SALESFORCE_MAX_RETRIES + 1):
+            # Every user of the org shares its daily API allowance; ease off near the cap
+            if _api_usage.get(self.instance_url, 0.0) > API_USAGE_SLOWDOWN_THRESHOLD:
+                await asyncio.sleep(API_USAGE_SLOWDOWN_SECONDS)
+
+            async with self._request_slots:
+                async with session.request(method, url, headers=self._headers, **kwargs) as response:
+                    self._record_api_usage(response.headers.get("Sforce-Limit-Info"))
+                    if response.status not in _RETRYABLE_STATUSES or attempt == SALESFORCE_MAX_RETRIES:
+                        if response.status >= 300:
+                            raise RuntimeError(
+                                f"Salesforce API error {response.status}: {await response.text()}"
+                            )
+                        if response.status == 204:
+                            return None
+                        return orjson.loads(await response.read())
+                    retry_after = response.headers.get("Retry-After")
+
+            # Throttled: back off (outside the semaphore), honoring Retry-After when given
+            delay = 2 ** attempt * 0.5 + random.random() * 0.5
+            if retry_after and retry_after.isdigit():
+                delay = min(int(retry_after), _MAX_RETRY_AFTER_SECONDS)
+            self._log.warning(
+                "Salesforce throttled, retrying", status=response.status, attempt=attempt + 1, delay=delay
             )
-        return self._sf
+            await asyncio.sleep(delay)
+
+    def _record_api_usage(self, limit_info: Optional[str]) -> None:
+        """Remember the org's API usage from a 'api-usage=used/max' Sforce-Limit-Info header"""
+        if not limit_info:
+            return
+        for part in limit_info.split(","):
+            name, _, value = part.strip().partition("=")
+            if name == "api-usage":
+                used, _, limit = value.partition("/")
+                if used.isdigit() and limit.isdigit() and int(limit):
+                    _api_usage[self.instance_url] = int(used) / int(limit)
+                return
+
+    def _submit_query(self, soql: str) -> asyncio.Future:
+        """
+        Queue a SOQL query and return a future for its result.
+
+        Queries submitted before the event loop's next iteration (e.g. by
+        tools running concurrently) are sent as one composite/batch request.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_queries.append((soql, future))
+        if len(self._pending_queries) == 1:
+            task = loop.create_task(self._flush_queries())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        return future
+
+    async def _query(self, soql: str) -> dict:
+        """Run a SOQL query"""
+        return await self._submit_query(soql)
+
+    async def _iter_records(self, soql: str) -> AsyncIterator[dict]:
+        """
+        Yield every record a SOQL query matches, one page at a time.
+
+        Salesforce returns at most 2000 records per response; later pages
+        are fetched from nextRecordsUrl only as the consumer reaches them.
+        """
+        result = await self._query(soql)
+        while True:
+            for record in result.get("records", []):
+                yield record
+            if result.get("done", True) or "nextRecordsUrl" not in result:
+                return
+            result = await self._request("GET", result["nextRecordsUrl"])
+
+    async def _flush_queries(self) -> None:
+        """Send every pending query and resolve the futures waiting on them"""
+        pending, self._pending_queries = self._pending_queries, []
+
+        for start in range(0, len(pending), _COMPOSITE_BATCH_LIMIT):
+            chunk = pending[start:start + _COMPOSITE_BATCH_LIMIT]
+            try:
+                results = await self._send_queries([soql for soql, _ in chunk])
+            except Exception as e:
+                results = [e] * len(chunk)
+
+            for (_, future), result in zip(chunk, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def _send_queries(self, queries: List[str]) -> List[Union[dict, Exception]]:
+        """Run queries in one round trip: a plain query, or composite/batch for several"""
+        if len(queries) == 1:
+            return [await self._request("GET", "query", params={"q": queries[0]})]
+
+        version = f"v{settings.salesforce_api_version}"
+        response = await self._request(
+            "POST",
+            "composite/batch",
+            json={
+                "batchRequests": [
+                    {"method": "GET", "url": f"{version}/query?q={quote(soql)}"}
+                    for soql in queries
+                ],
+            },
+        )
+
+        results: List[Union[dict, Exception]] = []
+        for item in response["results"]:
+            if item["statusCode"] < 300:
+                results.append(item["result"])
+            else:
+                errors = item["result"] or [{}]
+                results.append(RuntimeError(
+                    f"{errors[0].get('errorCode', item['statusCode'])}: {errors[0].get('message', '')}"
+                ))
+        return results
+
+    async def _create_records(self, sobject_type: str, records: List[dict]) -> List[dict]:
+        """
+        Create records of one type through composite/sobjects, 200 per request.
+
+        Returns one {"id", "success", "errors"} result per record, in order;
+        a failed record does not roll back the others.
+        """
+        results: List[dict] = []
+        for start in range(0, len(records), _COMPOSITE_SOBJECTS_LIMIT):
+            chunk = records[start:start + _COMPOSITE_SOBJECTS_LIMIT]
+            results.extend(await self._request(
+                "POST",
+                "composite/sobjects",
+                json={
+                    "allOrNone": False,
+                    "records": [{"attributes": {"type": sobject_type}, **record} for record in chunk],
+                },
+            ))
+        return results
+
+    async def _create_record(self, sobject_type: str, record: dict) -> dict:
+        """Create a single record, raising if Salesforce rejects it"""
+        result = (await self._create_records(sobject_type, [record]))[0]
+        if not result.get("success"):
+            errors = result.get("errors") or [{}]
+            raise RuntimeError(f"{errors[0].get('statusCode')}: {errors[0].get('message', '')}")
+        return result
 
     async def _execute_tool(
         self,
@@ -51,12 +378,38 @@ class SalesforceTools:
         **kwargs,
     ) -> ToolCall:
         """Execute a tool and return standardized result"""
-        tool_id = f"sf-{tool_name}-{int(time.time() * 1000)}"
-        start_time = time.time()
+        tool_id = f"sf-{tool_name}-{next(_tool_call_ids)}"
+        start_ns = time.monotonic_ns()
+
+        cache_key = None
+        if tool_name in _READ_TOOLS:
+            cache_key = (tool_name, tuple(sorted(kwargs.items())))
+            entry = self._read_cache.get(cache_key)
+            if entry is not None:
+                stored_at, result = entry
+                if time.monotonic() - stored_at <= READ_CACHE_TTL_SECONDS:
+                    self._read_cache.move_to_end(cache_key)
+                    return ToolCall(
+                        id=tool_id,
+                        name=f"salesforce.{tool_name}",
+                        status=ToolCallStatus.COMPLETED,
+                        arguments=kwargs,
+                        result=result,
+                        duration=0,
+                    )
+                del self._read_cache[cache_key]
 
         try:
-            result = await func(**kwargs) if callable(func) else func
-            duration = int((time.time() - start_time) * 1000)
+            result = await func() if callable(func) else func
+            duration = (time.monotonic_ns() - start_ns) // 1_000_000
+
+            if cache_key is not None:
+                self._read_cache[cache_key] = (time.monotonic(), result)
+                if len(self._read_cache) > READ_CACHE_MAX_ENTRIES:
+                    self._read_cache.popitem(last=False)
+            else:
+                # Any write may change what the cached reads would return
+                self._read_cache.clear()
 
             return ToolCall(
                 id=tool_id,
@@ -67,14 +420,14 @@ class SalesforceTools:
                 duration=duration,
             )
         except Exception as e:
-            logger.error(f"Salesforce tool error: {tool_name}", error=str(e))
+            self._log.error("Salesforce tool error", tool=tool_name, error=str(e))
             return ToolCall(
                 id=tool_id,
                 name=f"salesforce.{tool_name}",
                 status=ToolCallStatus.ERROR,
                 arguments=kwargs,
                 error=str(e),
-                duration=int((time.time() - start_time) * 1000),
+                duration=(time.monotonic_ns() - start_ns) // 1_000_000,
             )
 
     # === ACCOUNT TOOLS ===
@@ -90,33 +443,16 @@ class SalesforceTools:
         async def _execute():
             conditions = []
             if search:
-                conditions.append(f"Name LIKE '%{search}%'")
+                conditions.append(f"Name LIKE {_soql_contains(search)}")
             if industry:
-                conditions.append(f"Industry = '{industry}'")
+                conditions.append(f"Industry = {_soql_literal(industry)}")
 
             where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
-            query = f"""
-                SELECT Id, Name, Industry, Website, Phone, BillingCity, BillingState
-                FROM Account
-                {where_clause}
-                ORDER BY Name
-                LIMIT {limit}
-            """
+            query = f"{_ACCOUNT_SELECT} {where_clause} ORDER BY Name LIMIT {int(limit)}"
 
-            result = self.sf.query(query)
-            accounts = [
-                {
-                    "id": r["Id"],
-                    "name": r["Name"],
-                    "industry": r.get("Industry"),
-                    "website": r.get("Website"),
-                    "phone": r.get("Phone"),
-                    "billing_city": r.get("BillingCity"),
-                    "billing_state": r.get("BillingState"),
-                }
-                for r in result.get("records", [])
-            ]
+            result = await self._query(query)
+            accounts = _remap(result.get("records", []), _ACCOUNT_FIELDS)
 
             return {
                 "accounts": accounts,
@@ -135,7 +471,13 @@ class SalesforceTools:
         """Get detailed information about a specific account"""
 
         async def _execute():
-            account = self.sf.Account.get(account_id)
+            # Only the fields returned below; orgs often have hundreds of custom ones
+            query = f"{_ACCOUNT_DETAIL_SELECT} WHERE Id = {_soql_literal(account_id)}"
+
+            records = (await self._query(query)).get("records")
+            if not records:
+                raise RuntimeError(f"Account not found: {account_id}")
+            account = records[0]
             return {
                 "id": account["Id"],
                 "name": account["Name"],
@@ -171,33 +513,16 @@ class SalesforceTools:
         async def _execute():
             conditions = []
             if account_id:
-                conditions.append(f"AccountId = '{account_id}'")
+                conditions.append(f"AccountId = {_soql_literal(account_id)}")
             if search:
-                conditions.append(f"(Name LIKE '%{search}%' OR Email LIKE '%{search}%')")
+                conditions.append(f"(Name LIKE {_soql_contains(search)} OR Email LIKE {_soql_contains(search)})")
 
             where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
-            query = f"""
-                SELECT Id, Name, Email, Phone, Title, AccountId, Account.Name
-                FROM Contact
-                {where_clause}
-                ORDER BY Name
-                LIMIT {limit}
-            """
+            query = f"{_CONTACT_SELECT} {where_clause} ORDER BY Name LIMIT {int(limit)}"
 
-            result = self.sf.query(query)
-            contacts = [
-                {
-                    "id": r["Id"],
-                    "name": r["Name"],
-                    "email": r.get("Email"),
-                    "phone": r.get("Phone"),
-                    "title": r.get("Title"),
-                    "account_id": r.get("AccountId"),
-                    "account_name": r.get("Account", {}).get("Name") if r.get("Account") else None,
-                }
-                for r in result.get("records", [])
-            ]
+            result = await self._query(query)
+            contacts = _remap(result.get("records", []), _CONTACT_FIELDS, _ACCOUNT_NAME_FIELD)
 
             return {
                 "contacts": contacts,
@@ -236,7 +561,7 @@ class SalesforceTools:
             if title:
                 contact_data["Title"] = title
 
-            result = self.sf.Contact.create(contact_data)
+            result = await self._create_record("Contact", contact_data)
             return {
                 "success": result.get("success", False),
                 "id": result.get("id"),
@@ -265,34 +590,16 @@ class SalesforceTools:
         async def _execute():
             conditions = []
             if status:
-                conditions.append(f"Status = '{status}'")
+                conditions.append(f"Status = {_soql_literal(status)}")
             if source:
-                conditions.append(f"LeadSource = '{source}'")
+                conditions.append(f"LeadSource = {_soql_literal(source)}")
 
             where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
-            query = f"""
-                SELECT Id, Name, Company, Email, Phone, Status, LeadSource, CreatedDate
-                FROM Lead
-                {where_clause}
-                ORDER BY CreatedDate DESC
-                LIMIT {limit}
-            """
+            query = f"{_LEAD_SELECT} {where_clause} ORDER BY CreatedDate DESC LIMIT {int(limit)}"
 
-            result = self.sf.query(query)
-            leads = [
-                {
-                    "id": r["Id"],
-                    "name": r["Name"],
-                    "company": r["Company"],
-                    "email": r.get("Email"),
-                    "phone": r.get("Phone"),
-                    "status": r["Status"],
-                    "source": r.get("LeadSource"),
-                    "created_date": r.get("CreatedDate"),
-                }
-                for r in result.get("records", [])
-            ]
+            result = await self._query(query)
+            leads = _remap(result.get("records", []), _LEAD_FIELDS)
 
             return {
                 "leads": leads,
@@ -319,20 +626,8 @@ class SalesforceTools:
         """Create a new lead"""
 
         async def _execute():
-            lead_data = {
-                "FirstName": first_name,
-                "LastName": last_name,
-                "Company": company,
-                "Status": "New",
-            }
-            if email:
-                lead_data["Email"] = email
-            if phone:
-                lead_data["Phone"] = phone
-            if source:
-                lead_data["LeadSource"] = source
-
-            result = self.sf.Lead.create(lead_data)
+            lead_data = _lead_fields(first_name, last_name, company, email, phone, source)
+            result = await self._create_record("Lead", lead_data)
             return {
                 "success": result.get("success", False),
                 "id": result.get("id"),
@@ -347,11 +642,37 @@ class SalesforceTools:
             company=company,
         )
 
+    async def create_leads_bulk(self, leads: List[Dict[str, Any]]) -> ToolCall:
+        """
+        Create several leads in one round trip.
+
+        Each item takes the create_lead arguments (first_name, last_name,
+        company, and optionally email, phone, source).
+        """
+
+        async def _execute():
+            records = [_lead_fields(**lead) for lead in leads]
+            results = await self._create_records("Lead", records)
+            return {
+                "created_count": sum(1 for r in results if r.get("success")),
+                "leads": [
+                    {
+                        "success": r.get("success", False),
+                        "id": r.get("id"),
+                        "name": f"{lead['first_name']} {lead['last_name']}",
+                        "errors": [e.get("message") for e in r.get("errors") or []],
+                    }
+                    for lead, r in zip(leads, results)
+                ],
+            }
+
+        return await self._execute_tool("create_leads_bulk", _execute, count=len(leads))
+
     async def update_lead_status(self, lead_id: str, new_status: str) -> ToolCall:
         """Update a lead's status"""
 
         async def _execute():
-            self.sf.Lead.update(lead_id, {"Status": new_status})
+            await self._request("PATCH", f"sobjects/Lead/{lead_id}", json={"Status": new_status})
             return {
                 "success": True,
                 "lead_id": lead_id,
@@ -379,39 +700,25 @@ class SalesforceTools:
         async def _execute():
             conditions = []
             if stage:
-                conditions.append(f"StageName = '{stage}'")
+                conditions.append(f"StageName = {_soql_literal(stage)}")
             if account_id:
-                conditions.append(f"AccountId = '{account_id}'")
+                conditions.append(f"AccountId = {_soql_literal(account_id)}")
             if min_amount:
-                conditions.append(f"Amount >= {min_amount}")
+                conditions.append(f"Amount >= {float(min_amount)}")
 
             where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
-            query = f"""
-                SELECT Id, Name, Amount, StageName, CloseDate, Probability,
-                       AccountId, Account.Name, OwnerId
-                FROM Opportunity
-                {where_clause}
-                ORDER BY CloseDate ASC
-                LIMIT {limit}
-            """
+            query = f"{_OPPORTUNITY_SELECT} {where_clause} ORDER BY CloseDate ASC LIMIT {int(limit)}"
+            # Total over every matching opportunity, not just the returned page
+            total_query = f"SELECT SUM(Amount) total_amount FROM Opportunity {where_clause}"
 
-            result = self.sf.query(query)
-            opportunities = [
-                {
-                    "id": r["Id"],
-                    "name": r["Name"],
-                    "amount": r.get("Amount"),
-                    "stage": r["StageName"],
-                    "close_date": r.get("CloseDate"),
-                    "probability": r.get("Probability"),
-                    "account_id": r.get("AccountId"),
-                    "account_name": r.get("Account", {}).get("Name") if r.get("Account") else None,
-                }
-                for r in result.get("records", [])
-            ]
+            # Submitted in the same step, both queries go out in one composite request
+            pending_totals = self._submit_query(total_query)
+            result = await self._query(query)
+            totals = await pending_totals
+            opportunities = _remap(result.get("records", []), _OPPORTUNITY_FIELDS, _ACCOUNT_NAME_FIELD)
 
-            total_value = sum(o["amount"] or 0 for o in opportunities)
+            total_value = totals["records"][0]["total_amount"] or 0
 
             return {
                 "opportunities": opportunities,
@@ -449,7 +756,7 @@ class SalesforceTools:
             if account_id:
                 opp_data["AccountId"] = account_id
 
-            result = self.sf.Opportunity.create(opp_data)
+            result = await self._create_record("Opportunity", opp_data)
             return {
                 "success": result.get("success", False),
                 "id": result.get("id"),
@@ -478,7 +785,7 @@ class SalesforceTools:
             if probability is not None:
                 update_data["Probability"] = probability
 
-            self.sf.Opportunity.update(opportunity_id, update_data)
+            await self._request("PATCH", f"sobjects/Opportunity/{opportunity_id}", json=update_data)
             return {
                 "success": True,
                 "opportunity_id": opportunity_id,
@@ -506,18 +813,18 @@ class SalesforceTools:
                 ORDER BY StageName
             """
 
-            result = self.sf.query(query)
-            stages = [
-                {
+            stages = []
+            total_pipeline = 0
+            total_opportunities = 0
+            async for r in self._iter_records(query):
+                amount = r["total_amount"] or 0
+                stages.append({
                     "stage": r["StageName"],
                     "count": r["opp_count"],
-                    "total_amount": r["total_amount"] or 0,
-                }
-                for r in result.get("records", [])
-            ]
-
-            total_pipeline = sum(s["total_amount"] for s in stages)
-            total_opportunities = sum(s["count"] for s in stages)
+                    "total_amount": amount,
+                })
+                total_pipeline += amount
+                total_opportunities += r["opp_count"]
 
             return {
                 "stages": stages,
@@ -531,27 +838,16 @@ class SalesforceTools:
         """Get recent activities across leads, contacts, and opportunities"""
 
         async def _execute():
-            cutoff_date = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-            query = f"""
-                SELECT Id, Subject, Status, WhoId, WhatId, ActivityDate, Description
-                FROM Task
-                WHERE CreatedDate >= {cutoff_date}
-                ORDER BY ActivityDate DESC
-                LIMIT {limit}
-            """
+            cutoff = datetime.now(timezone.utc) - timedelta(days=int(days))
+            cutoff_date = cutoff.isoformat(timespec="seconds").replace("+00:00", "Z")
+
+            query = (
+                f"{_ACTIVITY_SELECT} WHERE CreatedDate >= {cutoff_date} "
+                f"ORDER BY ActivityDate DESC LIMIT {int(limit)}"
+            )
 
-            result = self.sf.query(query)
-            activities = [
-                {
-                    "id": r["Id"],
-                    "subject": r["Subject"],
-                    "status": r.get("Status"),
-                    "activity_date": r.get("ActivityDate"),
-                    "description": r.get("Description"),
-                }
-                for r in result.get("records", [])
-            ]
+            result = await self._query(query)
+            activities = _remap(result.get("records", []), _ACTIVITY_FIELDS)
 
             return {
                 "activities": activities,
@@ -565,3 +861,67 @@ class SalesforceTools:
             days=days,
             limit=limit,
         )
+
+    async def get_sales_dashboard(self, days: int = 7, lead_limit: int = 50) -> ToolCall:
+        """Get pipeline summary, recent activities and latest leads together"""
+
+        async def _execute():
+            # Started in the same step, the three queries share one composite request
+            calls = await asyncio.gather(
+                self.get_pipeline_summary(),
+                self.get_recent_activities(days=days),
+                self.get_leads(limit=lead_limit),
+            )
+            failed = next((call for call in calls if call.status != ToolCallStatus.COMPLETED), None)
+            if failed is not None:
+                raise RuntimeError(f"{failed.name}: {failed.error}")
+
+            pipeline, activities, leads = (call.result for call in calls)
+            return {
+                "pipeline": pipeline,
+                "recent_activities": activities,
+                "leads": leads,
+            }
+
+        return await self._execute_tool(
+            "get_sales_dashboard",
+            _execute,
+            days=days,
+            lead_limit=lead_limit,
+        )
+
+
+# One SalesforceTools per (instance, user) -> (tools, last used), LRU ordered.
+# Each holds a read cache, so the pool is bounded by size and idle time.
+SALESFORCE_POOL_MAX_ENTRIES = 1024
+SALESFORCE_POOL_IDLE_SECONDS = 3600
+_salesforce_pool: "OrderedDict[Tuple[str, str], Tuple[SalesforceTools, float]]" = OrderedDict()
+
+
+def get_salesforce_tools(user_id: str, access_token: str, instance_url: str) -> SalesforceTools:
+    """
+    Get the shared SalesforceTools for a user, creating it on first use.
+
+    A new instance replaces the pooled one when the user's access token
+    changes (e.g. after Token Vault refreshes it). Instances idle for
+    SALESFORCE_POOL_IDLE_SECONDS, or beyond the pool size, are dropped.
+    """
+    now = time.monotonic()
+    key = (instance_url, user_id)
+    entry = _salesforce_pool.get(key)
+
+    if entry is not None and entry[0].access_token == access_token:
+        tools = entry[0]
+    else:
+        tools = SalesforceTools(access_token=access_token, instance_url=instance_url)
+
+    _salesforce_pool[key] = (tools, now)
+    _salesforce_pool.move_to_end(key)
+
+    # Least recently used first: evict while over size or idle too long
+    while len(_salesforce_pool) > SALESFORCE_POOL_MAX_ENTRIES:
+        _salesforce_pool.popitem(last=False)
+    while now - next(iter(_salesforce_pool.values()))[1] > SALESFORCE_POOL_IDLE_SECONDS:
+        _salesforce_pool.popitem(last=False)
+
+    return tools
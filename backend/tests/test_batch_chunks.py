@@ -0,0 +1,84 @@
+"""Chunk batching for the AI chat stream"""
+
+import asyncio
+
+from app.routers.chat import _batch_chunks
+
+
+def _chunk(content: str) -> dict:
+    return {"type": "chunk", "content": content}
+
+
+async def _events(*items: dict):
+    for item in items:
+        yield item
+
+
+async def _collect(events, batch_size: int, flush_interval: float) -> list:
+    return [event async for event in _batch_chunks(events, batch_size, flush_interval)]
+
+
+def test_full_batches_keep_order():
+    events = _events(*(_chunk(c) for c in "abcde"))
+
+    out = asyncio.run(_collect(events, batch_size=2, flush_interval=10))
+
+    assert out == [_chunk("ab"), _chunk("cd"), _chunk("e")]
+
+
+def test_non_chunk_event_flushes_buffer_first():
+    tool_call = {"type": "tool_call", "tool_call": {"id": "t1"}}
+    events = _events(_chunk("a"), _chunk("b"), tool_call, _chunk("c"), {"type": "complete"})
+
+    out = asyncio.run(_collect(events, batch_size=10, flush_interval=10))
+
+    assert out == [_chunk("ab"), tool_call, _chunk("c"), {"type": "complete"}]
+
+
+def test_partial_batch_flushed_after_interval():
+    async def run():
+        release = asyncio.Event()
+
+        async def slow_events():
+            yield _chunk("a")
+            yield _chunk("b")
+            await release.wait()
+            yield _chunk("c")
+
+        loop = asyncio.get_running_loop()
+        batches = _batch_chunks(slow_events(), batch_size=10, flush_interval=0.05)
+        start = loop.time()
+        first = await asyncio.wait_for(batches.__anext__(), timeout=1)
+        elapsed = loop.time() - start
+
+        release.set()
+        rest = [event async for event in batches]
+        return first, elapsed, rest
+
+    first, elapsed, rest = asyncio.run(run())
+
+    assert first == _chunk("ab")
+    assert 0.04 <= elapsed < 1
+    assert rest == [_chunk("c")]
+
+
+def test_pending_read_cancelled_when_consumer_stops():
+    async def run():
+        cancelled = asyncio.Event()
+
+        async def stalled_events():
+            yield _chunk("a")
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            yield _chunk("b")
+
+        batches = _batch_chunks(stalled_events(), batch_size=10, flush_interval=0.01)
+        first = await asyncio.wait_for(batches.__anext__(), timeout=1)
+        await batches.aclose()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        return first
+
+    assert asyncio.run(run()) == _chunk("a")
@@ -0,0 +1,79 @@
+"""Conditional GETs on the inventory product endpoints"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.auth.okta_auth import get_current_user
+from app.main import app
+from app.models.schemas import UserInfo
+
+SKU = "TRP-001"
+PRODUCT_URL = f"/api/inventory/products/{SKU}"
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_current_user] = lambda: UserInfo(
+        sub="test-user", email="test@example.com", name="Test User"
+    )
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest.fixture
+def etag(client):
+    response = client.get(PRODUCT_URL)
+    assert response.status_code == 200
+    return response.headers["etag"]
+
+
+def test_exact_match_is_not_modified(client, etag):
+    response = client.get(PRODUCT_URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_weak_match_is_not_modified(client, etag):
+    response = client.get(PRODUCT_URL, headers={"If-None-Match": f"W/{etag}"})
+
+    assert response.status_code == 304
+
+
+def test_wildcard_is_not_modified(client, etag):
+    response = client.get(PRODUCT_URL, headers={"If-None-Match": "*"})
+
+    assert response.status_code == 304
+
+
+def test_match_in_list_is_not_modified(client, etag):
+    header = f'"stale-1", W/"stale-2",{etag} , "stale-3"'
+    response = client.get(PRODUCT_URL, headers={"If-None-Match": header})
+
+    assert response.status_code == 304
+
+
+def test_mismatch_returns_body(client, etag):
+    response = client.get(PRODUCT_URL, headers={"If-None-Match": '"stale-1", W/"stale-2"'})
+
+    assert response.status_code == 200
+    assert response.json()["sku"] == SKU
+
+
+def test_stock_update_invalidates_etag(client, etag):
+    params = {"quantity_change": 1, "reason": "etag test"}
+    assert client.post(f"{PRODUCT_URL}/stock", params=params).status_code == 200
+    try:
+        response = client.get(PRODUCT_URL, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert client.get(
+            PRODUCT_URL, headers={"If-None-Match": response.headers["etag"]}
+        ).status_code == 304
+    finally:
+        params = {"quantity_change": -1, "reason": "etag test cleanup"}
+        client.post(f"{PRODUCT_URL}/stock", params=params)
@@ -0,0 +1,85 @@
+"""SOQL literal escaping in the Salesforce tools"""
+
+import pytest
+
+from app.tools.salesforce_tools import _soql_contains, _soql_literal
+
+
+def _parse_literal(literal: str) -> tuple[str, int]:
+    """
+    Read a SOQL string literal starting at literal[0].
+
+    Returns the unescaped value and the index of the closing quote.
+    Escape sequences are kept as their escaped character, so \\% stays
+    distinguishable from a LIKE wildcard by the caller.
+    """
+    assert literal[0] == "'"
+    chars = []
+    i = 1
+    while i < len(literal):
+        ch = literal[i]
+        if ch == "\\":
+            chars.append(literal[i:i + 2])
+            i += 2
+            continue
+        if ch == "'":
+            return "".join(chars), i
+        chars.append(ch)
+        i += 1
+    raise AssertionError(f"unterminated literal: {literal!r}")
+
+
+def _unescape(tokens: str) -> str:
+    return tokens.replace("\\\\", "\0").replace("\\", "").replace("\0", "\\")
+
+
+@pytest.mark.parametrize("value", [
+    "O'Brien",
+    "back\\slash",
+    "\\'",
+    "x\\' OR Name != '",
+    "50%_off",
+    "'",
+    "\\",
+])
+def test_literal_ends_at_its_own_closing_quote(value):
+    literal = _soql_literal(value)
+    body, end = _parse_literal(literal)
+
+    assert end == len(literal) - 1
+    assert _unescape(body) == value
+
+
+def test_literal_escapes():
+    assert _soql_literal("O'Brien") == "'O\\'Brien'"
+    assert _soql_literal("a\\b") == "'a\\\\b'"
+    assert _soql_literal("\\'") == "'\\\\\\''"
+    # LIKE wildcards are plain characters in an equality literal
+    assert _soql_literal("50%_off") == "'50%_off'"
+
+
+@pytest.mark.parametrize("value", [
+    "O'Brien",
+    "back\\slash",
+    "\\'",
+    "x\\' OR Name LIKE '%",
+    "50%_off",
+])
+def test_contains_ends_at_its_own_closing_quote(value):
+    pattern = _soql_contains(value)
+    body, end = _parse_literal(pattern)
+
+    assert end == len(pattern) - 1
+    # Only the leading and trailing % are unescaped wildcards
+    assert body.startswith("%") and body.endswith("%")
+    inner = body[1:-1]
+    assert "%" not in inner.replace("\\%", "")
+    assert "_" not in inner.replace("\\_", "")
+    assert _unescape(inner) == value
+
+
+def test_contains_escapes():
+    assert _soql_contains("50%") == "'%50\\%%'"
+    assert _soql_contains("a_b") == "'%a\\_b%'"
+    assert _soql_contains("O'Brien") == "'%O\\'Brien%'"
+    assert _soql_contains("\\'") == "'%\\\\\\'%'"